@@ -1,5 +1,26 @@
-from .timer import Timer
+from .timer import Timer, Scheduler, Deadline
+from .virtual_clock import VirtualClock
 from .lot import Lot
 from .auction_participant import AuctionParticipant
 from .bid import Bid
-from .trading_platform import TradingPlatform
\ No newline at end of file
+from .bid_ledger import BidLedger, BidRecord
+from .bid_log import BidLog
+from .events import EventBus, Event, Subscription, DROP_OLDEST, COALESCE
+from .analytics import AuctionAnalytics, AuctionStats
+from .lot_scheduler import LotScheduler
+from .platform_snapshot import PlatformSnapshot, PersistentMap, ParticipantView, BidView
+from .proxy_bidding import ProxyBook
+from .storage import Storage, JsonStorage, MemoryStorage, migrate_state_data
+from .journal import Journal
+from .deferred_storage import DeferredStorage
+from .sqlite_storage import SqliteStorage
+from .binary_snapshot import BinarySnapshotStorage, BinarySnapshot, LazyLotIndex
+from .trading_platform import TradingPlatform, BidResult
+from .auction_house import AuctionHouse, ActiveLot, FundsReservations
+from .sealed_bid import SealedBidAuction, SealedBidResult, FIRST_PRICE, SECOND_PRICE
+from .platform_actor import PlatformActor
+from .bulk_import import BulkImporter, ImportReport, RowError
+from .simulation import Simulation, SimulationReport, synthetic_bids
+from .aio import AsyncTradingPlatform, AsyncioScheduler
+from .sharding import ShardedAuction, BalanceCoordinator, CoordinatorManager, CoordinatedFunds
+from .server import BidServer
@@ -0,0 +1,206 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Any, Iterable, List, Optional, Tuple
+
+import asyncio
+import functools
+import threading
+import traceback
+
+from . import AuctionParticipant
+from .timer import Scheduler, Deadline
+from .trading_platform import TradingPlatform, BidResult
+
+
+class AsyncioScheduler(Scheduler):
+    """
+    A Scheduler that runs the timer callbacks on an asyncio event loop with `loop.call_at`.
+
+    No thread is started: deadlines are loop timer handles. As with Scheduler, moving a deadline
+    later only updates the Deadline; the armed loop handle re-arms itself when it fires early.
+    The methods may be called from any thread; callbacks always run on the loop.
+
+    Args:
+        loop (asyncio.AbstractEventLoop, optional): The loop to run on. Defaults to the running loop.
+    """
+
+    def __init__(self, loop: Optional[asyncio.AbstractEventLoop] = None):
+        super().__init__()
+        self._loop = loop if loop is not None else asyncio.get_running_loop()
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return f"AsyncioScheduler(loop={self._loop})"
+
+    def now(self) -> float:
+        return self._loop.time()
+
+    def schedule(self, timeout: float, callback: Callable[..., Any]) -> Deadline:
+        handle = Deadline(self.now() + timeout, callback)
+        with self._lock:
+            self._arm(handle)
+        return handle
+
+    def reschedule(self, handle: Deadline, timeout: float) -> bool:
+        deadline = self.now() + timeout
+        with self._lock:
+            if not handle.active:
+                return False
+            handle.deadline = deadline
+            if deadline < handle._entry[0]:
+                self._arm(handle)
+        return True
+
+    def cancel(self, handle: Deadline) -> None:
+        with self._lock:
+            if handle.active:
+                handle.active = False
+                handle._done.set()
+
+    def _arm(self, handle: Deadline) -> None:
+        """
+        Arms a loop timer handle for the current deadline of `handle`. Must hold `_lock`.
+        """
+        token = object()
+        handle._entry = (handle.deadline, token)
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is self._loop:
+            self._loop.call_at(handle.deadline, self._fire, handle, token)
+        else:
+            self._loop.call_soon_threadsafe(self._loop.call_at, handle.deadline, self._fire, handle, token)
+
+    def _fire(self, handle: Deadline, token: object) -> None:
+        with self._lock:
+            if not handle.active or handle._entry[1] is not token:
+                return
+            if handle.deadline > self.now():
+                self._arm(handle)
+                return
+            handle.active = False
+        try:
+            handle.callback()
+        finally:
+            handle._done.set()
+
+
+class AsyncTradingPlatform:
+    """
+    Asyncio front-end of a TradingPlatform.
+
+    Every operation is awaitable and runs on a single worker thread, so the state transitions
+    and the saves of the storage (disk I/O) happen off the event loop, one at a time, in the order
+    they were awaited. Lot deadlines are scheduled on the loop by an AsyncioScheduler and their
+    expiration is posted to the same worker, so no thread is created per timer.
+
+    Must be created while the event loop is running.
+
+    Args:
+        platform (TradingPlatform, optional): The platform to drive. Its timers are moved to the loop.
+            Defaults to a new TradingPlatform created with `platform_kwargs`.
+        **platform_kwargs: Arguments of the TradingPlatform created when `platform` is not given.
+    """
+
+    def __init__(self, platform: Optional[TradingPlatform] = None, **platform_kwargs):
+        self._loop = asyncio.get_running_loop()
+        self._scheduler = AsyncioScheduler(self._loop)
+        if platform is None:
+            platform = TradingPlatform(clock=self._scheduler, **platform_kwargs)
+        else:
+            platform._clock = self._scheduler
+        self._platform = platform
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='auction-aio')
+        platform._dispatch = self._dispatch
+
+    def __repr__(self):
+        return f"AsyncTradingPlatform(platform={self._platform})"
+
+    async def __aenter__(self) -> 'AsyncTradingPlatform':
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.close()
+
+    @property
+    def platform(self) -> TradingPlatform:
+        """
+        Returns the wrapped platform. Read it only from the loop thread between awaited operations.
+        """
+        return self._platform
+
+    @property
+    def state(self) -> str:
+        return self._platform.state
+
+    async def call(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        Runs a function on the worker thread.
+
+        Args:
+            func (Callable[..., Any]): The function, usually a method of the platform.
+            *args, **kwargs: Arguments of the function.
+
+        Returns:
+            Any: The result of the function.
+        """
+        return await self._loop.run_in_executor(self._executor, functools.partial(func, *args, **kwargs))
+
+    async def place_bid(self, participant: AuctionParticipant, amount: int) -> None:
+        await self.call(self._platform.place_bid, participant, amount)
+
+    async def place_bids(self, bids: Iterable[Tuple[AuctionParticipant, int]]) -> List[BidResult]:
+        return await self.call(self._platform.place_bids, list(bids))
+
+    async def place_proxy_bid(self, participant: AuctionParticipant, maximum: int) -> None:
+        await self.call(self._platform.place_proxy_bid, participant, maximum)
+
+    async def start_auction(self) -> None:
+        await self.call(self._platform.start_auction)
+
+    async def end_auction(self) -> None:
+        await self.call(self._platform.end_auction)
+
+    async def pause_auction(self) -> None:
+        await self.call(self._platform.pause_auction)
+
+    async def resume_auction(self) -> None:
+        await self.call(self._platform.resume_auction)
+
+    async def restart_auction(self) -> None:
+        await self.call(self._platform.restart_auction)
+
+    async def abort_auction(self) -> None:
+        await self.call(self._platform.abort_auction)
+
+    async def add(self, *args) -> None:
+        await self.call(self._platform.add, *args)
+
+    async def remove(self, *args) -> None:
+        await self.call(self._platform.remove, *args)
+
+    async def flush(self) -> None:
+        await self.call(self._platform.flush)
+
+    async def close(self) -> None:
+        """
+        Waits for the queued operations, flushes the storage and stops the worker thread.
+        """
+        await self.flush()
+        if self._platform._dispatch == self._dispatch:
+            self._platform._dispatch = None
+        self._executor.shutdown(wait=False)
+
+    def _dispatch(self, func: Callable[..., Any]) -> None:
+        """
+        Posts a timer expiration of the platform to the worker thread.
+        """
+        self._executor.submit(_run_logged, func)
+
+
+def _run_logged(func: Callable[[], Any]) -> None:
+    # nobody awaits timer expirations, so their errors are reported like the Scheduler does
+    try:
+        func()
+    except Exception:
+        traceback.print_exc()
@@ -0,0 +1,113 @@
+from collections import namedtuple
+from typing import Container, List, Optional, Tuple
+
+import heapq
+
+AuctionStats = namedtuple('AuctionStats', ['revenue', 'sold', 'unsold', 'sell_through', 'top_spenders'])
+AuctionStats.__doc__ = """Aggregates returned by `TradingPlatform.stats`. `sell_through` is the share of closed
+auctions that sold (0.0 before the first one closes) and `top_spenders` lists `(participant_id, spend)`
+pairs, highest spend first."""
+
+
+class AuctionAnalytics:
+    """
+    Running aggregates of the auction outcomes: revenue, spend per participant and sold/unsold counts.
+
+    The aggregates are updated as every auction closes instead of being recomputed from the lots.
+    The top spenders are kept in a max-heap with one entry per spend update; entries left behind
+    by a later update are skipped when they surface and the heap is rebuilt once they outnumber
+    the live ones, so recording a sale takes O(log n) amortized and reading the top k O(k log n).
+    """
+
+    def __init__(self):
+        self._revenue = 0
+        self._sold = 0
+        self._unsold = 0
+        self._spend = {}
+        self._heap = []
+
+    def __repr__(self):
+        return f"AuctionAnalytics(revenue={self._revenue}, sold={self._sold}, unsold={self._unsold})"
+
+    @property
+    def revenue(self) -> float:
+        return self._revenue
+
+    @property
+    def sold(self) -> int:
+        return self._sold
+
+    @property
+    def unsold(self) -> int:
+        return self._unsold
+
+    def spend(self, participant_id: int) -> float:
+        """
+        Returns the total a participant has paid for the lots they won.
+        """
+        return self._spend.get(participant_id, 0)
+
+    def record_sale(self, participant_id: int, amount: float) -> None:
+        """
+        Accounts for a lot sold to a participant.
+
+        Args:
+            participant_id (int): The ID of the winner.
+            amount (float): The price paid.
+        """
+        self._revenue += amount
+        self._sold += 1
+        spend = self._spend.get(participant_id, 0) + amount
+        self._spend[participant_id] = spend
+        heapq.heappush(self._heap, (-spend, participant_id))
+        if len(self._heap) > 2 * len(self._spend) + 16:
+            self._heap = [(-spend, participant_id) for participant_id, spend in self._spend.items()]
+            heapq.heapify(self._heap)
+
+    def record_unsold(self) -> None:
+        """
+        Accounts for an auction that closed without bids.
+        """
+        self._unsold += 1
+
+    def top_spenders(self, k: int = 10, participants: Optional[Container[int]] = None) -> List[Tuple[int, float]]:
+        """
+        Returns the participants who spent the most.
+
+        Args:
+            k (int, optional): Maximum number of participants to return. Defaults to 10.
+            participants (Container[int], optional): If given, only the participants with these IDs are listed;
+                the spend of the others is kept. Defaults to None.
+
+        Returns:
+            List[Tuple[int, float]]: `(participant_id, spend)` pairs, highest spend first.
+        """
+        heap = self._heap
+        top = []
+        popped = []
+        while heap and len(top) < k:
+            entry = heapq.heappop(heap)
+            spend, participant_id = -entry[0], entry[1]
+            if self._spend.get(participant_id) != spend:
+                continue
+            popped.append(entry)
+            if participants is None or participant_id in participants:
+                top.append((participant_id, spend))
+        for entry in popped:
+            heapq.heappush(heap, entry)
+        return top
+
+    def stats(self, k: int = 10, participants: Optional[Container[int]] = None) -> AuctionStats:
+        """
+        Returns the current aggregates.
+
+        Args:
+            k (int, optional): Number of top spenders to include. Defaults to 10.
+            participants (Container[int], optional): Limits the top spenders, as in `top_spenders`. Defaults to None.
+
+        Returns:
+            AuctionStats: The aggregates.
+        """
+        closed = self._sold + self._unsold
+        return AuctionStats(self._revenue, self._sold, self._unsold,
+                            self._sold / closed if closed else 0.0, self.top_spenders(k, participants))
@@ -0,0 +1,335 @@
+from typing import Callable, Dict, List, Iterable, Optional, Tuple
+
+import threading
+
+from . import Timer
+from . import Lot
+from . import AuctionParticipant
+from . import Bid
+from .trading_platform import BidResult
+
+
+class FundsReservations:
+    """
+    Tracks the funds each participant has committed to the lots they are currently leading,
+    so that a participant can never lead more lots than their balance covers.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._held = {}
+        self._totals = {}
+
+    def __repr__(self):
+        return f"FundsReservations(participants={len(self._held)})"
+
+    def reserve(self, participant: AuctionParticipant, lot_id: int, amount: int) -> bool:
+        """
+        Reserves funds of a participant for a lot, replacing the previous reservation for that lot.
+
+        Args:
+            participant (AuctionParticipant): The participant placing the bid.
+            lot_id (int): The ID of the lot.
+            amount (int): The amount to reserve.
+
+        Returns:
+            bool: True if the reservation fits into the participant's balance, otherwise False.
+        """
+        participant_id = participant.participant_id
+        with self._lock:
+            held = self._held.setdefault(participant_id, {})
+            total = self._totals.get(participant_id, 0) - held.get(lot_id, 0) + amount
+            if total > participant.balance:
+                return False
+            held[lot_id] = amount
+            self._totals[participant_id] = total
+            return True
+
+    def release(self, participant: AuctionParticipant, lot_id: int) -> None:
+        """
+        Releases the funds of a participant reserved for a lot.
+
+        Args:
+            participant (AuctionParticipant): The participant.
+            lot_id (int): The ID of the lot.
+        """
+        with self._lock:
+            self._drop(participant.participant_id, lot_id)
+
+    def settle(self, lot_id: int, sell: Callable[[], Optional[AuctionParticipant]]) -> Optional[AuctionParticipant]:
+        """
+        Sells a lot and drops the reservation of its winner as one step.
+
+        `sell` runs under the reservations lock, so a concurrent `reserve` never sees the price both
+        charged to the balance and still held for the lot.
+
+        Args:
+            lot_id (int): The ID of the lot.
+            sell (Callable[[], Optional[AuctionParticipant]]): Charges the winner the price and returns them,
+                or returns None if the lot is not sold.
+
+        Returns:
+            Optional[AuctionParticipant]: The winner returned by `sell`.
+        """
+        with self._lock:
+            winner = sell()
+            if winner is not None:
+                self._drop(winner.participant_id, lot_id)
+        return winner
+
+    def reserved(self, participant: AuctionParticipant) -> int:
+        """
+        Returns the total amount reserved by a participant.
+        """
+        return self._totals.get(participant.participant_id, 0)
+
+    def _drop(self, participant_id: int, lot_id: int) -> None:
+        """
+        Removes the reservation of a participant for a lot. Must hold `_lock`.
+        """
+        held = self._held.get(participant_id)
+        if held is None or lot_id not in held:
+            return
+        self._totals[participant_id] -= held.pop(lot_id)
+        if not held:
+            del self._held[participant_id]
+            del self._totals[participant_id]
+
+
+class ActiveLot:
+    """
+    A lot being auctioned by an AuctionHouse together with its own bid, deadline and lock.
+
+    Args:
+        lot (Lot): The lot being auctioned.
+    """
+
+    def __init__(self, lot: Lot):
+        self.lot = lot
+        self.bid = Bid(lot)
+        self.lock = threading.Lock()
+        self.timer = None
+        self.closed = False
+
+    def __repr__(self):
+        return f"ActiveLot(lot={self.lot}, bid={self.bid})"
+
+
+class AuctionHouse:
+    """
+    An engine that auctions many lots of a TradingPlatform at the same time.
+
+    Every active lot has its own bid, timer and lock, so bids on different lots never wait on each other.
+    The platform stays the owner of the catalog: lots are taken from its pending lots when their auction
+    starts and settled through it when their auction ends, under the platform's lock.
+
+    Args:
+        platform (TradingPlatform): The platform providing participants, lots and persistence.
+        funds (FundsReservations, optional): The funds reservations of the participants.
+            Defaults to a new FundsReservations.
+    """
+
+    def __init__(self, platform, funds: FundsReservations = None):
+        self._platform = platform
+        self._funds = funds if funds is not None else FundsReservations()
+        self._active = {}
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return f"AuctionHouse(active_lots={len(self._active)})"
+
+    @property
+    def active_lots(self) -> List[Lot]:
+        """
+        Returns the lots currently being auctioned.
+        """
+        return [active.lot for active in list(self._active.values())]
+
+    def current_bid(self, lot_id: int) -> Bid:
+        """
+        Returns the current bid on an active lot.
+
+        Args:
+            lot_id (int): The ID of the lot.
+
+        Raises:
+            ValueError: If the lot is not being auctioned.
+        """
+        return self._get_active(lot_id).bid
+
+    def start_auction(self, lot_id: int = None) -> Lot:
+        """
+        Starts the auction of a pending lot of the platform.
+
+        Args:
+            lot_id (int, optional): The ID of the lot. Defaults to None, which takes the next pending lot.
+
+        Returns:
+            Lot: The lot whose auction was started.
+
+        Raises:
+            RuntimeError: If the platform is running its own auction or executing a batch.
+            ValueError: If there is no such pending lot or no participants.
+        """
+        platform = self._platform
+        with platform._lock:
+            if platform.state != 'preparing_for_auction':
+                raise RuntimeError(f"Cannot start an auction while the platform is in state '{platform.state}'")
+            if not platform._participants:
+                raise ValueError("No participants available to start the auction")
+            lot = platform._take_lot(lot_id)
+            platform._save_state()
+        active = ActiveLot(lot)
+        active.timer = Timer(timeout=platform._timeout, callback=lambda: self._timer_callback(lot.lot_id),
+                             scheduler=platform._clock)
+        with self._lock:
+            self._active[lot.lot_id] = active
+        active.timer.start()
+        platform._emit('lot_started', lot.lot_id)
+        return lot
+
+    def place_bid(self, lot_id: int, participant: AuctionParticipant, amount: int) -> None:
+        """
+        Places a bid on an active lot.
+
+        Args:
+            lot_id (int): The ID of the lot.
+            participant (AuctionParticipant): The participant placing the bid.
+            amount (int): The bid amount.
+
+        Raises:
+            ValueError: If the lot is not being auctioned, the bid amount is not higher than the current bid,
+                is below the minimum bid or exceeds the funds the participant has not committed to other lots.
+        """
+        active = self._get_active(lot_id)
+        with active.lock:
+            if active.closed:
+                raise ValueError(f"Auction of lot with ID {lot_id} has ended")
+            bid = active.bid
+            if amount <= bid.amount:
+                raise ValueError("Bid amount must be greater than the current bid")
+            if amount < active.lot.minimum_bid:
+                raise ValueError("Bid amount is less than the minimum bid")
+            if not self._funds.reserve(participant, lot_id, amount):
+                raise ValueError("Bid amount exceeds participant balance")
+            previous = bid.participant
+            bid.increase_bid(amount, participant)
+            self._platform._ledger(lot_id).append(participant.participant_id, amount, self._platform._timestamp())
+            self._platform._emit('bid_accepted', lot_id, participant.participant_id, amount)
+            if previous is not None and previous != participant:
+                self._funds.release(previous, lot_id)
+            active.timer.start()
+
+    def place_bids(self, lot_id: int, bids: Iterable[Tuple[AuctionParticipant, int]]) -> List[BidResult]:
+        """
+        Places a batch of bids on an active lot, with the semantics of `TradingPlatform.place_bids`.
+
+        Bids are checked in order against the best bid so far; only the highest accepted bid is applied
+        and funds are reserved once for the whole batch. If the funds of its bidder do not cover it,
+        the next highest accepted bid is tried, and the bids that could not be reserved are rejected.
+
+        Args:
+            lot_id (int): The ID of the lot.
+            bids (Iterable[Tuple[AuctionParticipant, int]]): Pairs of participant and bid amount.
+
+        Returns:
+            List[BidResult]: The result of every bid, in the order of the batch.
+
+        Raises:
+            ValueError: If the lot is not being auctioned.
+        """
+        active = self._get_active(lot_id)
+        with active.lock:
+            if active.closed:
+                raise ValueError(f"Auction of lot with ID {lot_id} has ended")
+            bid = active.bid
+            results = []
+            accepted = []
+            best_amount = bid.amount
+            for participant, amount in bids:
+                if amount <= best_amount:
+                    reason = "Bid amount must be greater than the current bid"
+                elif amount < active.lot.minimum_bid:
+                    reason = "Bid amount is less than the minimum bid"
+                elif amount > participant.balance:
+                    reason = "Bid amount exceeds participant balance"
+                else:
+                    accepted.append(len(results))
+                    best_amount = amount
+                    reason = None
+                results.append(BidResult(participant, amount, reason is None, reason))
+            while accepted:
+                winner = results[accepted[-1]]
+                if self._funds.reserve(winner.participant, lot_id, winner.amount):
+                    break
+                results[accepted.pop()] = winner._replace(accepted=False,
+                                                          reason="Bid amount exceeds participant balance")
+            if not accepted:
+                return results
+            ledger = self._platform._ledger(lot_id)
+            for index in accepted:
+                participant, amount = results[index].participant, results[index].amount
+                ledger.append(participant.participant_id, amount, self._platform._timestamp())
+                self._platform._emit('bid_accepted', lot_id, participant.participant_id, amount)
+            previous = bid.participant
+            bid.increase_bid(winner.amount, winner.participant)
+            if previous is not None and previous != winner.participant:
+                self._funds.release(previous, lot_id)
+            active.timer.start()
+        return results
+
+    def end_auction(self, lot_id: int) -> AuctionParticipant:
+        """
+        Ends the auction of an active lot and settles it through the platform.
+
+        Args:
+            lot_id (int): The ID of the lot.
+
+        Returns:
+            AuctionParticipant: The winner, or None if the lot received no bids.
+
+        Raises:
+            ValueError: If the lot is not being auctioned.
+        """
+        with self._lock:
+            active = self._active.pop(lot_id, None)
+        if active is None:
+            raise ValueError(f"Lot with ID {lot_id} is not being auctioned")
+        with active.lock:
+            active.closed = True
+            active.timer.cancel()
+            platform = self._platform
+            with platform._lock:
+                winner = self._funds.settle(lot_id, lambda: platform._settle(active.lot, active.bid))
+                platform._save_state()
+        return winner
+
+    def end_all(self) -> Dict[int, AuctionParticipant]:
+        """
+        Ends the auctions of all active lots.
+
+        Returns:
+            Dict[int, AuctionParticipant]: The winners by lot ID.
+        """
+        winners = {}
+        for lot_id in list(self._active):
+            try:
+                winners[lot_id] = self.end_auction(lot_id)
+            except ValueError:
+                pass
+        return winners
+
+    def _get_active(self, lot_id: int) -> ActiveLot:
+        active = self._active.get(lot_id)
+        if active is None:
+            raise ValueError(f"Lot with ID {lot_id} is not being auctioned")
+        return active
+
+    def _timer_callback(self, lot_id: int) -> None:
+        """
+        Callback of the lot timers, ends the auction of the lot when its timer expires.
+        """
+        try:
+            self.end_auction(lot_id)
+        except ValueError:
+            pass
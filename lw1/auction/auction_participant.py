@@ -1,4 +1,5 @@
-from typing import List
+from array import array
+from typing import List, Mapping, Tuple
 
 from . import Lot
 
@@ -9,13 +10,19 @@ class AuctionParticipant:
     Args:
         nickname (str, optional): The participant's nickname. Defaults to 'anonymous' with a unique ID.
         balance (int, optional): The participant's initial balance. Defaults to 0.
+
+    The lots owned by the participant are stored as an array of lot IDs (allocated with the first lot)
+    and resolved to Lot objects on access through `_lot_source`, a mapping of lot IDs to lots shared
+    with the trading platform.
     """
+    __slots__ = ('_nickname', '_balance', '_lot_ids', '_lot_source', '_participant_id')
     _participants_counter = 0
 
     def __init__(self, nickname: str, balance: int = 0):
         self._nickname = nickname
         self._balance = balance
-        self._lots = []
+        self._lot_ids = None
+        self._lot_source = None
         self._participant_id = AuctionParticipant._participants_counter
         AuctionParticipant._participants_counter += 1
 
@@ -76,11 +83,16 @@ class AuctionParticipant:
         self._balance = value
 
     @property
-    def lots(self) -> List[Lot]:
+    def lots(self) -> Tuple[Lot, ...]:
         """
-        Returns the list of lots owned by the participant.
+        Returns the lots owned by the participant.
+        The tuple is built on every access, so changing it would not change the participant; assign
+        `lots` or use `_add_lot` to give the participant a lot.
         """
-        return self._lots
+        if not self._lot_ids:
+            return ()
+        source = self._lot_source
+        return tuple(source[lot_id] for lot_id in self._lot_ids)
 
     @lots.setter
     def lots(self, value: List[Lot]):
@@ -90,7 +102,61 @@ class AuctionParticipant:
         Args:
             value (List[Lot]): The new list of lots for the participant.
         """
-        self._lots = value
+        self._lot_ids = array('q', (lot.lot_id for lot in value))
+        self._lot_source = {lot.lot_id: lot for lot in value}
+
+    @property
+    def lot_ids(self) -> array:
+        """
+        Returns the IDs of the lots owned by the participant.
+        """
+        return self._lot_ids if self._lot_ids is not None else array('q')
+
+    def _add_lot(self, lot: Lot) -> None:
+        """
+        Gives a lot to the participant.
+
+        Args:
+            lot (Lot): The lot. It is added to `_lot_source` if the source does not know it yet.
+        """
+        if self._lot_source is None:
+            self._lot_source = {}
+        if lot.lot_id not in self._lot_source:
+            self._lot_source[lot.lot_id] = lot
+        if self._lot_ids is None:
+            self._lot_ids = array('q')
+        self._lot_ids.append(lot.lot_id)
+
+    def _bind_lots(self, source: Mapping[int, Lot]) -> None:
+        """
+        Makes the participant resolve its lots through the given mapping, if it knows all of them.
+
+        Args:
+            source (Mapping[int, Lot]): Mapping of lot IDs to lots, e.g. the sold lots of a platform.
+        """
+        if all(lot_id in source for lot_id in self.lot_ids):
+            self._lot_source = source
+
+    def _unbind_lots(self) -> None:
+        """
+        Copies the owned lots out of the shared mapping, so they stay resolvable after being removed from it.
+        """
+        self._lot_source = {lot.lot_id: lot for lot in self.lots}
+
+    def _copy(self, lot_source: Mapping[int, Lot]) -> 'AuctionParticipant':
+        """
+        Returns a copy of the participant with its own list of lot IDs, without taking a new ID.
+
+        Args:
+            lot_source (Mapping[int, Lot]): Mapping the copy resolves its lots through.
+        """
+        participant = AuctionParticipant.__new__(AuctionParticipant)
+        participant._nickname = self._nickname
+        participant._balance = self._balance
+        participant._lot_ids = array('q', self._lot_ids) if self._lot_ids is not None else None
+        participant._lot_source = lot_source
+        participant._participant_id = self._participant_id
+        return participant
 
     @property
     def participant_id(self) -> int:
@@ -102,12 +168,13 @@ class AuctionParticipant:
     def _to_dict(self) -> dict:
         """
         Returns a dictionary representation of the AuctionParticipant.
+        The owned lots are referenced by ID; their data is stored with the sold lots of the platform.
         """
         return {
             'nickname': self._nickname,
             'balance': self._balance,
             'participant_id': self._participant_id,
-            'lots': [lot._to_dict() for lot in self._lots]
+            'lot_ids': list(self.lot_ids)
         }
 
     @classmethod
@@ -116,14 +183,18 @@ class AuctionParticipant:
         Creates an AuctionParticipant object from a dictionary, using provided lot_map to resolve lot IDs.
 
         Args:
-            data (dict): Dictionary containing participant data.
-            lot_map (dict): Dictionary mapping lot IDs to Lot objects.
+            data (dict): Dictionary containing participant data. The legacy layout with embedded `lots` is accepted too.
+            lot_map (dict): Dictionary mapping lot IDs to Lot objects. The participant keeps resolving its lots through it.
 
         Returns:
             AuctionParticipant: An AuctionParticipant object.
         """
         participant = cls(nickname=data['nickname'], balance=data['balance'])
-        participant._lots = [lot_map[lot_data['lot_id']] for lot_data in data['lots']]
+        if 'lot_ids' in data:
+            participant._lot_ids = array('q', data['lot_ids'])
+        else:
+            participant._lot_ids = array('q', (lot_data['lot_id'] for lot_data in data['lots']))
+        participant._lot_source = lot_map
         participant._participant_id = data['participant_id']
         if participant._participant_id >= cls._participants_counter:
             cls._participants_counter = participant._participant_id + 1
@@ -15,6 +15,7 @@ class Bid:
         ValueError: If the bid amount is below the lot's minimum bid.
         ValueError: If the bid amount exceeds the participant's balance.
     """
+    __slots__ = ('_amount', '_lot', '_participant')
 
     def __init__(self, lot: Lot, amount: int = 0, participant: AuctionParticipant = None):
         if participant and amount < lot.minimum_bid:
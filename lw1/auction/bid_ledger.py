@@ -0,0 +1,137 @@
+from array import array
+from collections import namedtuple
+from typing import Iterable, List, Iterator, Optional
+
+import bisect
+import heapq
+import time
+
+BidRecord = namedtuple('BidRecord', ['participant_id', 'amount', 'timestamp'])
+BidRecord.__doc__ = """A bid stored in a BidLedger. The timestamp is a monotonic time in nanoseconds."""
+
+
+class BidLedger:
+    """
+    Append-only bid history of a lot.
+
+    Bids are stored column-wise in typed arrays (participant IDs, amounts and monotonic timestamps)
+    instead of one Python object per bid, so millions of bids take a few dozen bytes each.
+    Amounts are stored as doubles, since the platform accepts both int and float amounts.
+
+    Args:
+        lot_id (int): The ID of the lot the bids are placed on.
+    """
+
+    def __init__(self, lot_id: int):
+        self._lot_id = lot_id
+        self._participant_ids = array('q')
+        self._amounts = array('d')
+        self._timestamps = array('q')
+
+    def __repr__(self):
+        return f"BidLedger(lot_id={self._lot_id}, bids={len(self)})"
+
+    def __len__(self) -> int:
+        return len(self._amounts)
+
+    def __getitem__(self, index: int) -> BidRecord:
+        return BidRecord(self._participant_ids[index], self._amounts[index], self._timestamps[index])
+
+    def __iter__(self) -> Iterator[BidRecord]:
+        return map(BidRecord, self._participant_ids, self._amounts, self._timestamps)
+
+    @property
+    def lot_id(self) -> int:
+        """
+        Returns the ID of the lot the bids are placed on.
+        """
+        return self._lot_id
+
+    def append(self, participant_id: int, amount: float, timestamp: Optional[int] = None) -> None:
+        """
+        Appends a bid to the ledger.
+
+        Args:
+            participant_id (int): The ID of the participant who placed the bid.
+            amount (float): The bid amount.
+            timestamp (int, optional): Monotonic time of the bid in nanoseconds. Defaults to now.
+        """
+        self._participant_ids.append(participant_id)
+        self._amounts.append(amount)
+        self._timestamps.append(time.monotonic_ns() if timestamp is None else timestamp)
+
+    def extend(self, participant_ids: Iterable[int], amounts: Iterable[float], timestamps: Iterable[int]) -> None:
+        """
+        Appends many bids at once, column by column.
+
+        Args:
+            participant_ids (Iterable[int]): The IDs of the participants who placed the bids.
+            amounts (Iterable[float]): The bid amounts.
+            timestamps (Iterable[int]): Monotonic times of the bids in nanoseconds, in non-decreasing order.
+        """
+        self._participant_ids.extend(participant_ids)
+        self._amounts.extend(amounts)
+        self._timestamps.extend(timestamps)
+
+    def top(self, k: int) -> List[BidRecord]:
+        """
+        Returns the k highest bids, highest first.
+
+        Args:
+            k (int): The number of bids to return.
+        """
+        amounts = self._amounts
+        return [self[i] for i in heapq.nlargest(k, range(len(amounts)), key=amounts.__getitem__)]
+
+    def by_participant(self, participant_id: int) -> List[BidRecord]:
+        """
+        Returns the bids placed by a participant, in the order they were placed.
+
+        Args:
+            participant_id (int): The ID of the participant.
+        """
+        return [self[i] for i, pid in enumerate(self._participant_ids) if pid == participant_id]
+
+    def bid_rate(self, window: Optional[float] = None, now: Optional[int] = None) -> float:
+        """
+        Returns the number of bids per second.
+
+        Args:
+            window (float, optional): Only count the bids of the last `window` seconds.
+                Defaults to None, which averages over the whole history.
+            now (int, optional): Monotonic time in nanoseconds the window ends at. Defaults to now.
+
+        Returns:
+            float: Bids per second, or 0.0 if it cannot be computed.
+        """
+        timestamps = self._timestamps
+        if not timestamps:
+            return 0.0
+        if window is None:
+            elapsed = (timestamps[-1] - timestamps[0]) / 1e9
+            return len(timestamps) / elapsed if elapsed > 0 else 0.0
+        if window <= 0:
+            raise ValueError('window must be positive.')
+        end = time.monotonic_ns() if now is None else now
+        start = end - int(window * 1e9)
+        # timestamps are appended in non-decreasing order, so the window is a suffix of the ledger
+        return (len(timestamps) - bisect.bisect_left(timestamps, start)) / window
+
+    def rate_series(self, bucket: float) -> List[int]:
+        """
+        Returns the number of bids in consecutive buckets since the first bid.
+
+        Args:
+            bucket (float): Bucket width in seconds.
+        """
+        if bucket <= 0:
+            raise ValueError('bucket must be positive.')
+        timestamps = self._timestamps
+        if not timestamps:
+            return []
+        width = int(bucket * 1e9)
+        first = timestamps[0]
+        series = [0] * ((timestamps[-1] - first) // width + 1)
+        for timestamp in timestamps:
+            series[(timestamp - first) // width] += 1
+        return series
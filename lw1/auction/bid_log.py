@@ -0,0 +1,187 @@
+from typing import List, Tuple, Optional
+
+import json
+import os
+import threading
+
+from .utils import BID_LOG_FILE
+
+
+class BidLog:
+    """
+    Durable log of the bids placed on the lot being auctioned.
+
+    Records are JSON lines `[op, data]`: `lot` when a lot is put up for auction, `bid` for every
+    accepted bid and `restart` when the bids on the lot are discarded. Appending only writes the
+    record to the OS; `sync` makes it durable with group commit: the first caller to wait becomes
+    the leader and fsyncs everything appended so far, while callers arriving meanwhile wait for it
+    and are usually covered by the same fsync. The log is truncated once no lot is in flight; records
+    appended before the truncation count as synced, as the outcome of their lot is saved by then.
+
+    Args:
+        path (str, optional): The log file. Defaults to BID_LOG_FILE.
+    """
+
+    def __init__(self, path: str = BID_LOG_FILE):
+        self._path = path
+        self._cond = threading.Condition()
+        self._file = None
+        self._seq = 0
+        self._synced_seq = 0
+        self._syncing = False
+        self._sync_count = 0
+        self._empty = True
+
+    def __repr__(self):
+        return f"BidLog(path='{self._path}')"
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    @property
+    def sync_count(self) -> int:
+        """
+        Returns the number of fsyncs performed so far.
+        """
+        return self._sync_count
+
+    @property
+    def empty(self) -> bool:
+        """
+        Returns whether nothing has been appended since the log was last truncated or recovered.
+        """
+        return self._empty
+
+    def start_lot(self, lot_data: dict) -> int:
+        """
+        Records that a lot is put up for auction.
+
+        Returns:
+            int: The sequence number to pass to `sync`.
+        """
+        return self._append(['lot', lot_data])
+
+    def append_bid(self, lot_id: int, participant_id: int, amount: float) -> int:
+        """
+        Records an accepted bid.
+
+        Returns:
+            int: The sequence number to pass to `sync`.
+        """
+        return self._append(['bid', [lot_id, participant_id, amount]])
+
+    def restart_lot(self, lot_id: int) -> int:
+        """
+        Records that the bids on a lot were discarded.
+
+        Returns:
+            int: The sequence number to pass to `sync`.
+        """
+        return self._append(['restart', lot_id])
+
+    def sync(self, seq: int) -> None:
+        """
+        Blocks until the record with the given sequence number is on disk.
+
+        Args:
+            seq (int): Sequence number returned by one of the append methods.
+        """
+        with self._cond:
+            while self._synced_seq < seq:
+                if self._syncing:
+                    self._cond.wait()
+                    continue
+                file = self._file
+                if file is None:
+                    return
+                self._syncing = True
+                target = self._seq
+                try:
+                    file.flush()
+                    self._cond.release()
+                    try:
+                        os.fsync(file.fileno())
+                    finally:
+                        self._cond.acquire()
+                    self._synced_seq = max(self._synced_seq, target)
+                    self._sync_count += 1
+                finally:
+                    self._syncing = False
+                    self._cond.notify_all()
+
+    def recover(self) -> Optional[Tuple[dict, List[Tuple[int, float]]]]:
+        """
+        Reads the lot in flight from the log.
+
+        A partially written last record (e.g. after a crash) is ignored and cut off the file,
+        so that the records appended afterwards start on a line of their own.
+
+        Returns:
+            Optional[Tuple[dict, List[Tuple[int, float]]]]: The data of the lot and its bids as
+                (participant ID, amount) pairs in the order they were placed, or None if no lot was in flight.
+        """
+        lot_data = None
+        bids = []
+        end = 0
+        try:
+            f = open(self._path, 'r+b')
+        except FileNotFoundError:
+            return None
+        with f:
+            for line in f:
+                if not line.endswith(b'\n'):
+                    break
+                try:
+                    op, data = json.loads(line)
+                except ValueError:
+                    break
+                end += len(line)
+                if op == 'lot':
+                    lot_data, bids = data, []
+                elif op == 'bid':
+                    lot_id, participant_id, amount = data
+                    if lot_data is not None and lot_id == lot_data['lot_id']:
+                        bids.append((participant_id, amount))
+                elif op == 'restart':
+                    bids = []
+                else:
+                    raise ValueError(f"Unknown bid log operation: {op}")
+            if f.seek(0, os.SEEK_END) > end:
+                with self._cond:
+                    self.close()
+                    f.truncate(end)
+        self._empty = lot_data is None
+        return (lot_data, bids) if lot_data is not None else None
+
+    def reset(self) -> None:
+        """
+        Truncates the log. Called once the outcome of the lot in flight is saved.
+        """
+        with self._cond:
+            self.close()
+            with open(self._path, 'w'):
+                pass
+            self._synced_seq = self._seq
+            self._empty = True
+
+    def close(self) -> None:
+        """
+        Closes the log file if it is open, waiting for an fsync in progress to complete.
+        """
+        with self._cond:
+            while self._syncing:
+                self._cond.wait()
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def _append(self, record: list) -> int:
+        line = json.dumps(record, separators=(',', ':')) + '\n'
+        with self._cond:
+            if self._file is None:
+                self._file = open(self._path, 'a')
+            self._file.write(line)
+            self._seq += 1
+            self._empty = False
+            return self._seq
@@ -0,0 +1,370 @@
+from array import array
+from collections.abc import MutableMapping
+from typing import List, Tuple, Any, Optional, Iterator
+
+import mmap
+import os
+import struct
+
+from .utils import BINARY_STATE_FILE
+from .lot import Lot
+from .auction_participant import AuctionParticipant
+from .storage import Storage
+
+MAGIC = b'AUCB'
+VERSION = 2  # version 2 added the schedule section; version 1 files are still read
+
+# magic, version, participants counter, lot counter, timeout, timeout is int,
+# pending lots, sold lots, participants, owned lot IDs, string table size
+_HEADER = struct.Struct('<4sHqqdBQQQQQ')
+# lot ID, minimum bid, name offset, name length, description offset, description length, flags
+_LOT = struct.Struct('<q8sIIIIB')
+# participant ID, balance, nickname offset, nickname length, first owned lot ID, owned lot count, flags
+_PARTICIPANT = struct.Struct('<q8sIIQQB')
+# lot ID, priority, start time (wall-clock), has start time
+_SCHEDULE = struct.Struct('<qqdB')
+_COUNT = struct.Struct('<Q')
+
+_INT = 1  # flag: the number is an int, not a float
+_NONE = 0xFFFFFFFF  # string length marking None
+
+
+def _pack_number(value) -> Tuple[bytes, int]:
+    if isinstance(value, int):
+        return struct.pack('<q', value), _INT
+    return struct.pack('<d', value), 0
+
+
+def _unpack_number(raw: bytes, flags: int):
+    return struct.unpack('<q' if flags & _INT else '<d', raw)[0]
+
+
+class _StringTable:
+    """
+    Collects the strings of a snapshot into one UTF-8 blob, deduplicating repeated values.
+    """
+
+    def __init__(self):
+        self._chunks = []
+        self._offsets = {}
+        self._size = 0
+
+    def add(self, value: Optional[str]) -> Tuple[int, int]:
+        if value is None:
+            return 0, _NONE
+        return self.add_bytes(value.encode('utf-8'))
+
+    def add_bytes(self, data: Optional[bytes]) -> Tuple[int, int]:
+        """
+        Adds an already encoded string, as copied from another snapshot.
+        """
+        if data is None:
+            return 0, _NONE
+        found = self._offsets.get(data)
+        if found is not None:
+            return found
+        found = self._offsets[data] = (self._size, len(data))
+        self._chunks.append(data)
+        self._size += len(data)
+        return found
+
+    def to_bytes(self) -> bytes:
+        return b''.join(self._chunks)
+
+
+class BinarySnapshot:
+    """
+    A memory-mapped binary snapshot of the auction state.
+
+    Layout (little-endian): a header, the fixed-width lot records (pending lots first, then sold lots),
+    the lot IDs as an int64 column, the fixed-width participant records, the owned lot IDs of the
+    participants as an int64 column, a string table with the names, descriptions and nicknames, and
+    (since version 2) the number of schedule records followed by the records.
+
+    Args:
+        path (str): The snapshot file.
+    """
+
+    def __init__(self, path: str):
+        with open(path, 'rb') as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        (magic, version, self.participants_counter, self.lot_counter, timeout, timeout_is_int, self.lot_count,
+         self.sold_lot_count, self.participant_count, owned_count, strings_size) = _HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not an auction snapshot")
+        if version not in (1, VERSION):
+            raise ValueError(f"Unsupported snapshot version {version}")
+        self.version = version
+        self.timeout = int(timeout) if timeout_is_int else timeout
+        total = self.lot_count + self.sold_lot_count
+        self._lots_offset = _HEADER.size
+        self._lot_ids_offset = self._lots_offset + total * _LOT.size
+        self._participants_offset = self._lot_ids_offset + total * 8
+        self._owned_offset = self._participants_offset + self.participant_count * _PARTICIPANT.size
+        self._strings_offset = self._owned_offset + owned_count * 8
+        self._schedule_offset = self._strings_offset + strings_size
+
+    def __repr__(self):
+        return (f"BinarySnapshot(lots={self.lot_count}, sold_lots={self.sold_lot_count}, "
+                f"participants={self.participant_count})")
+
+    def lot_ids(self) -> array:
+        """
+        Returns the IDs of all lots, pending lots first.
+        """
+        ids = array('q')
+        ids.frombytes(self._mm[self._lot_ids_offset:self._participants_offset])
+        return ids
+
+    def lot(self, index: int) -> Lot:
+        """
+        Materializes the lot stored in the given record. The lot counter is left alone: it is restored
+        from the header when the snapshot is loaded, so the IDs do not depend on which lots are read.
+        """
+        lot_id, minimum_bid, name_off, name_len, desc_off, desc_len, flags = _LOT.unpack_from(
+            self._mm, self._lots_offset + index * _LOT.size)
+        return Lot._restore(lot_id, self._string(name_off, name_len), self._string(desc_off, desc_len),
+                            _unpack_number(minimum_bid, flags))
+
+    def lot_record(self, index: int, strings: _StringTable) -> bytes:
+        """
+        Copies the given lot record for a new snapshot without materializing the lot: the strings are
+        moved to the string table of the new snapshot as raw bytes and the record is repacked to point there.
+        """
+        lot_id, minimum_bid, name_off, name_len, desc_off, desc_len, flags = _LOT.unpack_from(
+            self._mm, self._lots_offset + index * _LOT.size)
+        return _LOT.pack(lot_id, minimum_bid, *strings.add_bytes(self._raw_string(name_off, name_len)),
+                         *strings.add_bytes(self._raw_string(desc_off, desc_len)), flags)
+
+    def participants(self) -> Iterator[Tuple[dict, array]]:
+        """
+        Yields the participant data and the IDs of the lots each participant owns.
+        """
+        mm = self._mm
+        for index in range(self.participant_count):
+            participant_id, balance, nick_off, nick_len, owned_start, owned_len, flags = _PARTICIPANT.unpack_from(
+                mm, self._participants_offset + index * _PARTICIPANT.size)
+            owned = array('q')
+            start = self._owned_offset + owned_start * 8
+            owned.frombytes(mm[start:start + owned_len * 8])
+            yield {
+                'nickname': self._string(nick_off, nick_len),
+                'balance': _unpack_number(balance, flags),
+                'participant_id': participant_id
+            }, owned
+
+    def schedule(self) -> List[list]:
+        """
+        Returns `[lot_id, priority, start_at]` of the pending lots with a priority or a start time.
+        """
+        if self.version < 2:
+            return []
+        count, = _COUNT.unpack_from(self._mm, self._schedule_offset)
+        start = self._schedule_offset + _COUNT.size
+        return [[lot_id, priority, start_at if has_start else None]
+                for lot_id, priority, start_at, has_start in _SCHEDULE.iter_unpack(
+                    self._mm[start:start + count * _SCHEDULE.size])]
+
+    def close(self) -> None:
+        self._mm.close()
+
+    def _string(self, offset: int, length: int) -> Optional[str]:
+        data = self._raw_string(offset, length)
+        return data.decode('utf-8') if data is not None else None
+
+    def _raw_string(self, offset: int, length: int) -> Optional[bytes]:
+        if length == _NONE:
+            return None
+        start = self._strings_offset + offset
+        return self._mm[start:start + length]
+
+
+class LazyLotIndex(MutableMapping):
+    """
+    Index of lots by ID that materializes the lots of a BinarySnapshot on first access.
+
+    Keeps the order of the snapshot; lots added later are appended at the end.
+
+    Args:
+        snapshot (BinarySnapshot): The snapshot the lots are stored in.
+        positions (dict): Mapping of lot IDs to their record index in the snapshot.
+    """
+
+    def __init__(self, snapshot: BinarySnapshot, positions: dict):
+        self._snapshot = snapshot
+        self._positions = positions
+        self._loaded = {}
+
+    def __repr__(self):
+        return f"LazyLotIndex(lots={len(self._positions)}, loaded={len(self._loaded)})"
+
+    def __getitem__(self, lot_id: int) -> Lot:
+        lot = self._loaded.get(lot_id)
+        if lot is None:
+            position = self._positions[lot_id]
+            if position is None:
+                raise KeyError(lot_id)
+            lot = self._loaded[lot_id] = self._snapshot.lot(position)
+        return lot
+
+    def __setitem__(self, lot_id: int, lot: Lot) -> None:
+        self._loaded[lot_id] = lot
+        if lot_id not in self._positions:
+            self._positions[lot_id] = None
+
+    def __delitem__(self, lot_id: int) -> None:
+        del self._positions[lot_id]
+        self._loaded.pop(lot_id, None)
+
+    def __contains__(self, lot_id) -> bool:
+        return lot_id in self._positions
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._positions)
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+    def copy(self) -> 'LazyLotIndex':
+        """
+        Returns a shallow copy sharing the snapshot, without materializing the lots.
+        """
+        index = LazyLotIndex(self._snapshot, dict(self._positions))
+        index._loaded = dict(self._loaded)
+        return index
+
+    @property
+    def snapshot(self) -> BinarySnapshot:
+        """
+        Returns the snapshot the lots are stored in.
+        """
+        return self._snapshot
+
+    def stored_position(self, lot_id: int) -> Optional[int]:
+        """
+        Returns the record index of a lot that has not been materialized yet, or None if the lot
+        is loaded or was added after the snapshot.
+        """
+        if lot_id in self._loaded:
+            return None
+        return self._positions[lot_id]
+
+    @property
+    def loaded_count(self) -> int:
+        """
+        Returns the number of lots materialized so far.
+        """
+        return len(self._loaded)
+
+
+class BinarySnapshotStorage(Storage):
+    """
+    Storage that writes the whole state as a versioned binary snapshot of fixed-width records.
+
+    Loading maps the file into memory and builds only the ID indexes; lots are materialized on first
+    access. Saving copies the records of the lots that were never materialized straight from the loaded
+    snapshot and serializes only the others. Like JsonStorage, the snapshot is written to a temporary file and atomically moved over
+    the previous one. JsonStorage remains the interchange format.
+
+    Args:
+        path (str, optional): The snapshot file. Defaults to BINARY_STATE_FILE.
+    """
+
+    def __init__(self, path: str = BINARY_STATE_FILE):
+        self._path = path
+        self._snapshot = None
+
+    def __repr__(self):
+        return f"BinarySnapshotStorage(path='{self._path}')"
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    def save(self, platform, changes: List[Tuple[str, Any]]) -> None:
+        participants = list(platform._participants.values())
+        strings = _StringTable()
+
+        lot_records = bytearray()
+        lot_ids = array('q')
+        for index in (platform._lots, platform._sold_lots):
+            stored = index if isinstance(index, LazyLotIndex) else None
+            for lot_id in index:
+                position = stored.stored_position(lot_id) if stored is not None else None
+                if position is not None:
+                    lot_records += stored.snapshot.lot_record(position, strings)
+                else:
+                    lot = index[lot_id]
+                    minimum_bid, flags = _pack_number(lot.minimum_bid)
+                    lot_records += _LOT.pack(lot_id, minimum_bid, *strings.add(lot.name),
+                                             *strings.add(lot.description), flags)
+                lot_ids.append(lot_id)
+
+        participant_records = bytearray()
+        owned = array('q')
+        for participant in participants:
+            balance, flags = _pack_number(participant.balance)
+            owned_start = len(owned)
+            owned.extend(participant.lot_ids)
+            participant_records += _PARTICIPANT.pack(participant.participant_id, balance,
+                                                     *strings.add(participant._nickname),
+                                                     owned_start, len(owned) - owned_start, flags)
+
+        string_bytes = strings.to_bytes()
+        schedule = platform._schedule_data()
+        schedule_records = bytearray(_COUNT.pack(len(schedule)))
+        for lot_id, priority, start_at in schedule:
+            schedule_records += _SCHEDULE.pack(lot_id, priority, start_at or 0.0, start_at is not None)
+        timeout = platform._timeout
+        header = _HEADER.pack(MAGIC, VERSION, AuctionParticipant.participants_counter(), Lot.lot_counter(),
+                              timeout, isinstance(timeout, int), len(platform._lots), len(platform._sold_lots),
+                              len(participants), len(owned), len(string_bytes))
+
+        tmp_path = self._path + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            f.write(header)
+            f.write(lot_records)
+            f.write(lot_ids.tobytes())
+            f.write(participant_records)
+            f.write(owned.tobytes())
+            f.write(string_bytes)
+            f.write(schedule_records)
+        os.replace(tmp_path, self._path)
+
+    def load(self) -> Optional[dict]:
+        """
+        Maps the snapshot and returns state data carrying ready-made lazy indexes.
+
+        Returns:
+            Optional[dict]: The state data with an `indexes` entry, or None if the file does not exist.
+        """
+        try:
+            snapshot = BinarySnapshot(self._path)
+        except FileNotFoundError:
+            return None
+        self.close()
+        self._snapshot = snapshot
+
+        ids = snapshot.lot_ids()
+        pending_count = snapshot.lot_count
+        lots = LazyLotIndex(snapshot, dict(zip(ids[:pending_count], range(pending_count))))
+        sold_lots = LazyLotIndex(snapshot, dict(zip(ids[pending_count:], range(pending_count, len(ids)))))
+
+        participants = {}
+        for data, owned in snapshot.participants():
+            data['lot_ids'] = owned
+            participant = AuctionParticipant._from_dict(data, sold_lots)
+            participants[participant.participant_id] = participant
+
+        return {
+            'participants_counter': snapshot.participants_counter,
+            'lot_counter': snapshot.lot_counter,
+            'timeout': snapshot.timeout,
+            'schedule': snapshot.schedule(),
+            'indexes': (participants, lots, sold_lots)
+        }
+
+    def close(self) -> None:
+        if self._snapshot is not None:
+            self._snapshot.close()
+            self._snapshot = None
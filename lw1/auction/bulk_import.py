@@ -0,0 +1,243 @@
+"""
+Streaming bulk import of lots and participants from CSV or JSON Lines files.
+
+Usage (from the lw1 directory):
+    python -m auction.bulk_import FILE [--kind lot|participant] [--chunk-size 1000]
+"""
+from collections import namedtuple
+from typing import Iterable, Iterator, List, Optional, Tuple, Union
+
+import argparse
+import csv
+import json
+import math
+import os
+import time
+
+from . import Lot, AuctionParticipant
+from .trading_platform import TradingPlatform
+
+RowError = namedtuple('RowError', ['line', 'message'])
+RowError.__doc__ = """An invalid row of an import: its line number in the file (1-based) and the reason."""
+
+ImportReport = namedtuple('ImportReport', ['rows', 'imported', 'failed', 'errors', 'elapsed', 'rows_per_second'])
+ImportReport.__doc__ = """Outcome of an import. `errors` holds the first rejected rows (see `max_errors`),
+`failed` counts all of them; `elapsed` is in seconds."""
+
+KINDS = ('lot', 'participant')
+FORMATS = {'.csv': 'csv', '.jsonl': 'jsonl', '.ndjson': 'jsonl'}
+
+
+class BulkImporter:
+    """
+    Imports lots and participants into a TradingPlatform from a stream of rows.
+
+    Rows are read lazily and validated one by one; valid rows become entities, which are added
+    to the platform in chunks inside `TradingPlatform.batch`, so the storage saves once per chunk
+    instead of once per row. Only the current chunk and the first `max_errors` errors are kept
+    in memory, however large the input is.
+
+    Lot rows have `name` (required), `description` and `minimum_bid` (non-negative, defaults to 0);
+    participant rows have `nickname` and `balance` (non-negative, defaults to 0). A file may mix
+    both kinds if every row has a `type` column with `lot` or `participant`.
+
+    Args:
+        platform (TradingPlatform): The platform to import into. It must be preparing for the auction.
+        chunk_size (int, optional): Number of entities added per save. Defaults to 1000.
+        max_errors (int, optional): Number of row errors kept in the report. Defaults to 100.
+    """
+
+    def __init__(self, platform, chunk_size: int = 1000, max_errors: int = 100):
+        if chunk_size <= 0:
+            raise ValueError('chunk_size must be positive.')
+        if max_errors < 0:
+            raise ValueError('max_errors must be non-negative.')
+        self._platform = platform
+        self._chunk_size = chunk_size
+        self._max_errors = max_errors
+
+    def __repr__(self):
+        return f"BulkImporter(chunk_size={self._chunk_size}, max_errors={self._max_errors})"
+
+    def import_file(self, path: str, kind: Optional[str] = None, file_format: Optional[str] = None) -> ImportReport:
+        """
+        Imports a CSV or JSON Lines file.
+
+        Args:
+            path (str): Path of the file.
+            kind (str, optional): 'lot' or 'participant' for files without a `type` column. Defaults to None.
+            file_format (str, optional): 'csv' or 'jsonl'. Defaults to None, which guesses it from the extension.
+
+        Returns:
+            ImportReport: The outcome of the import.
+
+        Raises:
+            ValueError: If the format cannot be determined.
+        """
+        if file_format is None:
+            file_format = FORMATS.get(os.path.splitext(path)[1].lower())
+        if file_format not in ('csv', 'jsonl'):
+            raise ValueError(f"Unknown file format of {path}, expected csv or jsonl")
+        with open(path, 'r', encoding='utf-8', newline='') as file:
+            rows = read_csv(file) if file_format == 'csv' else read_jsonl(file)
+            return self.import_rows(rows, kind)
+
+    def import_rows(self, rows: Iterable[Tuple[int, Union[dict, Exception]]], kind: Optional[str] = None) -> ImportReport:
+        """
+        Imports a stream of rows.
+
+        Args:
+            rows (Iterable[Tuple[int, Union[dict, Exception]]]): `(line, row)` pairs; a row may be the
+                exception raised while reading it, which is reported as a row error.
+            kind (str, optional): 'lot' or 'participant' for rows without a `type` field. Defaults to None.
+
+        Returns:
+            ImportReport: The outcome of the import. If reading the stream fails, e.g. on an undecodable
+                byte, the import stops there: the rows read so far are imported and the failure is
+                reported as an error on the line after the last row read.
+        """
+        if kind is not None and kind not in KINDS:
+            raise ValueError(f"Unknown kind: {kind}")
+        start = time.perf_counter()
+        count = imported = failed = 0
+        errors = []
+        chunk = []
+        rows = iter(rows)
+        line = 0
+        while True:
+            try:
+                line, row = next(rows)
+            except StopIteration:
+                break
+            except (csv.Error, ValueError) as e:
+                count += 1
+                failed += 1
+                if len(errors) < self._max_errors:
+                    errors.append(RowError(line + 1, f"Reading stopped: {e}"))
+                break
+            count += 1
+            try:
+                if isinstance(row, Exception):
+                    raise ValueError(str(row))
+                chunk.append(_build(row, kind))
+            except ValueError as e:
+                failed += 1
+                if len(errors) < self._max_errors:
+                    errors.append(RowError(line, str(e)))
+                continue
+            if len(chunk) >= self._chunk_size:
+                imported += self._commit(chunk)
+                chunk = []
+        if chunk:
+            imported += self._commit(chunk)
+        elapsed = time.perf_counter() - start
+        return ImportReport(count, imported, failed, errors, elapsed, count / elapsed if elapsed > 0 else 0.0)
+
+    def _commit(self, chunk: List[Union[Lot, AuctionParticipant]]) -> int:
+        with self._platform.batch():
+            self._platform.add(chunk)
+        return len(chunk)
+
+
+def read_csv(file) -> Iterator[Tuple[int, Union[dict, Exception]]]:
+    """
+    Yields the rows of a CSV file with a header line as `(line, row)` pairs, or the error of a row
+    the reader rejects (e.g. a field over the size limit). Empty cells are omitted.
+    """
+    reader = csv.DictReader(file)
+    while True:
+        try:
+            row = next(reader)
+        except StopIteration:
+            return
+        except csv.Error as e:
+            # the reader goes on with the next row; `line_num` still points at the previous one
+            yield reader.line_num + 1, e
+            continue
+        yield reader.line_num, {key: value for key, value in row.items() if key is not None and value not in ('', None)}
+
+
+def read_jsonl(file) -> Iterator[Tuple[int, Union[dict, Exception]]]:
+    """
+    Yields the objects of a JSON Lines file as `(line, row)` pairs, or the decoding error of a malformed line.
+    """
+    for line, text in enumerate(file, start=1):
+        if not text.strip():
+            continue
+        try:
+            row = json.loads(text)
+            if not isinstance(row, dict):
+                raise ValueError('Row must be a JSON object')
+        except ValueError as e:
+            yield line, e
+            continue
+        yield line, row
+
+
+def _build(row: dict, kind: Optional[str]) -> Union[Lot, AuctionParticipant]:
+    """
+    Validates a row and creates its entity.
+
+    Raises:
+        ValueError: If the row is invalid.
+    """
+    row_kind = row.get('type', kind)
+    if row_kind == 'lot':
+        name = row.get('name')
+        if not name or not isinstance(name, str):
+            raise ValueError('Lot name cannot be empty')
+        description = row.get('description')
+        return Lot(name=name, description=str(description) if description is not None else None,
+                   minimum_bid=_amount(row, 'minimum_bid'))
+    if row_kind == 'participant':
+        nickname = row.get('nickname')
+        return AuctionParticipant(nickname=str(nickname) if nickname is not None else '',
+                                  balance=_amount(row, 'balance'))
+    if row_kind is None:
+        raise ValueError("Row type is missing, expected 'lot' or 'participant'")
+    raise ValueError(f"Unknown row type: {row_kind}")
+
+
+def _amount(row: dict, field: str) -> Union[int, float]:
+    """
+    Parses a non-negative amount of a row, 0 if it is missing.
+    """
+    value = row.get(field, 0)
+    if isinstance(value, bool):
+        raise ValueError(f"{field} must be a number")
+    if isinstance(value, str):
+        try:
+            value = int(value)
+        except ValueError:
+            try:
+                value = float(value)
+            except ValueError:
+                raise ValueError(f"{field} must be a number, got '{value}'") from None
+    if not isinstance(value, (int, float)) or not math.isfinite(value):
+        raise ValueError(f"{field} must be a finite number")
+    if value < 0:
+        raise ValueError(f"{field} must be non-negative")
+    return value
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Import lots and participants from a CSV or JSON Lines file.')
+    parser.add_argument('path')
+    parser.add_argument('--kind', choices=KINDS)
+    parser.add_argument('--format', choices=('csv', 'jsonl'), dest='file_format')
+    parser.add_argument('--chunk-size', type=int, default=1000)
+    args = parser.parse_args()
+
+    platform = TradingPlatform(load_on_init=True)
+    report = BulkImporter(platform, chunk_size=args.chunk_size).import_file(args.path, args.kind, args.file_format)
+    platform.flush()
+    for error in report.errors:
+        print(f"line {error.line}: {error.message}")
+    if report.failed > len(report.errors):
+        print(f"... and {report.failed - len(report.errors)} more errors")
+    print(f"{report.rows} rows, {report.imported} imported, {report.failed} rejected "
+          f"in {report.elapsed:.2f} s ({report.rows_per_second:.0f} rows/s)")
+
+
+if __name__ == '__main__':
+    main()
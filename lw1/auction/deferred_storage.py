@@ -0,0 +1,216 @@
+from typing import List, Tuple, Any, Optional
+
+import atexit
+import threading
+import time
+import weakref
+
+from .storage import Storage
+
+_open_storages = weakref.WeakSet()
+
+
+class DeferredStorage(Storage):
+    """
+    Storage wrapper that coalesces saves and writes them on a background thread.
+
+    A save only appends the recorded changes to a pending list and marks the storage dirty.
+    A writer thread hands all pending changes to the wrapped storage at once, `interval` seconds
+    after the first unsaved change or as soon as `max_changes` changes are pending, so a burst of
+    mutations costs one write instead of one write per call. The writer holds the platform lock
+    only to take the pending changes and a copy of the state; the wrapped storage serializes and
+    writes that copy after the lock is released, so bids are not held up by the disk. Writes are
+    serialized in the order their copies were taken. The writer thread stops while nothing is pending.
+
+    Changes made within the last `interval` seconds are lost on a crash. `flush()` writes them
+    synchronously, and the pending changes of the storages still open are flushed when the
+    interpreter exits.
+
+    Args:
+        storage (Storage): The storage to write to.
+        interval (float, optional): Maximum delay of a write in seconds. Defaults to 0.1.
+        max_changes (int, optional): Number of pending changes that triggers a write right away. Defaults to 1000.
+    """
+
+    def __init__(self, storage: Storage, interval: float = 0.1, max_changes: int = 1000):
+        if interval <= 0:
+            raise ValueError('interval must be positive.')
+        if max_changes <= 0:
+            raise ValueError('max_changes must be positive.')
+        self._storage = storage
+        self._interval = interval
+        self._max_changes = max_changes
+        self._cond = threading.Condition()
+        self._write_lock = threading.Lock()
+        self._platform = None
+        self._pending = []
+        self._dirty_since = None
+        self._error = None
+        self._closed = False
+        self._thread = None
+        _open_storages.add(self)
+
+    def __repr__(self):
+        return f"DeferredStorage(storage={self._storage!r}, interval={self._interval}, max_changes={self._max_changes})"
+
+    @property
+    def path(self) -> str:
+        return self._storage.path
+
+    @property
+    def storage(self) -> Storage:
+        """
+        Returns the wrapped storage.
+        """
+        return self._storage
+
+    @property
+    def dirty(self) -> bool:
+        """
+        Returns whether there are saves not yet written to the wrapped storage.
+        """
+        return self._dirty_since is not None
+
+    def save(self, platform, changes: List[Tuple[str, Any]]) -> None:
+        """
+        Queues the changes for the background writer.
+
+        Raises:
+            RuntimeError: If the storage is closed.
+        """
+        with self._cond:
+            if self._closed:
+                raise RuntimeError('Cannot save to a closed storage.')
+            self._platform = platform
+            self._pending.extend(changes)
+            if self._dirty_since is None:
+                self._dirty_since = time.monotonic()
+                self._cond.notify()
+            elif len(self._pending) >= self._max_changes:
+                self._cond.notify()
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name='auction-storage-writer', daemon=True)
+                self._thread.start()
+
+    def flush(self) -> None:
+        """
+        Writes the pending changes to the wrapped storage on the calling thread.
+
+        Raises:
+            Exception: The error of a failed background write, if any.
+        """
+        self._write()
+        error, self._error = self._error, None
+        if error is not None:
+            raise error
+
+    def load(self) -> Optional[dict]:
+        return self._storage.load()
+
+    def close(self) -> None:
+        """
+        Stops the writer thread, writes the pending changes and closes the wrapped storage.
+        """
+        with self._cond:
+            if self._closed:
+                return
+            self._closed = True
+            self._cond.notify()
+            thread = self._thread
+        if thread is not None:
+            thread.join()
+        _open_storages.discard(self)
+        try:
+            self.flush()
+        finally:
+            self._storage.close()
+
+    def _flush_at_exit(self) -> None:
+        try:
+            self._write()
+        except Exception as e:
+            print(f"Error flushing state to {self.path}: {e}")
+
+    def _run(self) -> None:
+        cond = self._cond
+        while True:
+            with cond:
+                while not self._closed and self._dirty_since is not None:
+                    delay = self._dirty_since + self._interval - time.monotonic()
+                    if delay <= 0 or len(self._pending) >= self._max_changes:
+                        break
+                    cond.wait(delay)
+                if self._closed or self._dirty_since is None:
+                    # `save` starts a new writer for the next change
+                    self._thread = None
+                    return
+            try:
+                self._write()
+            except Exception as e:
+                self._error = e
+
+    def _write(self) -> None:
+        """
+        Hands the pending changes, and a copy of the state if it needs one, to the wrapped storage.
+
+        The changes are taken under the platform lock, the write runs without it. The state is copied
+        under the lock as well, but only when the wrapped storage reads it (`Storage.needs_state`): an
+        incremental storage gets just the changes between its full snapshots. The write lock is taken
+        before the platform lock is released and held until the write completes, so writes reach the
+        wrapped storage in order and a flush returns only after a write in progress completes.
+        """
+        platform = self._platform
+        if platform is None:
+            return
+        # the platform lock is taken before the condition and the write lock, as in `save` and `flush`
+        with platform._lock:
+            self._write_lock.acquire()
+            with self._cond:
+                changes, self._pending = self._pending, []
+                dirty, self._dirty_since = self._dirty_since, None
+            try:
+                state = (_StateCopy(platform) if dirty is not None and self._storage.needs_state(changes)
+                         else None)
+            except BaseException:
+                self._write_lock.release()
+                raise
+        try:
+            if dirty is not None:
+                self._storage.save(state, changes)
+        except Exception:
+            with self._cond:
+                self._pending[:0] = changes
+                if self._dirty_since is None:
+                    self._dirty_since = time.monotonic()
+            raise
+        finally:
+            self._write_lock.release()
+
+
+class _StateCopy:
+    """
+    Copy of the persisted state of a platform, which the wrapped storage writes in its place.
+
+    The lot indexes are copied shallowly, as lots do not change; participants are copied one by one.
+    """
+
+    def __init__(self, platform):
+        self._platform_type = type(platform)
+        self._timeout = platform._timeout
+        self._lots = platform._lots.copy()
+        self._sold_lots = platform._sold_lots.copy()
+        self._participants = {participant_id: participant._copy(self._sold_lots)
+                              for participant_id, participant in platform._participants.items()}
+        self._schedule = platform._schedule_data()
+
+    def _state_data(self) -> dict:
+        return self._platform_type._state_data(self)
+
+    def _schedule_data(self) -> list:
+        return self._schedule
+
+
+@atexit.register
+def _flush_open_storages() -> None:
+    for storage in list(_open_storages):
+        storage._flush_at_exit()
@@ -0,0 +1,207 @@
+from collections import deque, namedtuple
+from typing import Iterable, Iterator, List, Optional
+
+import threading
+
+Event = namedtuple('Event', ['kind', 'lot_id', 'participant_id', 'amount', 'timestamp'])
+Event.__doc__ = """An auction event. `participant_id` and `amount` are None when they do not apply;
+the timestamp is the time of the platform clock in seconds."""
+
+EVENT_KINDS = ('bid_accepted', 'lot_started', 'lot_sold', 'lot_unsold', 'paused')
+
+DROP_OLDEST = 'drop_oldest'
+COALESCE = 'coalesce'
+
+
+class Subscription:
+    """
+    A bounded queue of the events delivered to one subscriber.
+
+    When the queue is full the oldest event is dropped. With the `coalesce` policy a new
+    `bid_accepted` event replaces the still undelivered `bid_accepted` event of the same lot
+    instead of being queued, so a slow reader only sees the latest price of every lot; other
+    events are never coalesced, and bids are never merged across them.
+
+    Args:
+        maxsize (int): Maximum number of queued events.
+        policy (str): DROP_OLDEST or COALESCE.
+        kinds (Iterable[str], optional): Event kinds to receive. Defaults to None (all kinds).
+    """
+
+    def __init__(self, maxsize: int, policy: str, kinds: Optional[Iterable[str]] = None):
+        if maxsize <= 0:
+            raise ValueError('maxsize must be positive.')
+        if policy not in (DROP_OLDEST, COALESCE):
+            raise ValueError(f"Unknown backpressure policy: {policy}")
+        self._maxsize = maxsize
+        self._policy = policy
+        self._kinds = frozenset(kinds) if kinds is not None else None
+        self._queue = deque()
+        self._latest = {}
+        self._cond = threading.Condition()
+        self._dropped = 0
+        self._coalesced = 0
+        self._closed = False
+
+    def __repr__(self):
+        return f"Subscription(policy='{self._policy}', queued={len(self._queue)}, dropped={self._dropped})"
+
+    def __len__(self) -> int:
+        return len(self._queue)
+
+    def __iter__(self) -> Iterator[Event]:
+        """
+        Yields events as they arrive until the subscription is closed.
+        """
+        while True:
+            event = self.get()
+            if event is None:
+                return
+            yield event
+
+    @property
+    def dropped(self) -> int:
+        """
+        Returns the number of events dropped because the queue was full.
+        """
+        return self._dropped
+
+    @property
+    def coalesced(self) -> int:
+        """
+        Returns the number of bid events replaced by a newer bid on the same lot.
+        """
+        return self._coalesced
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def get(self, timeout: Optional[float] = None) -> Optional[Event]:
+        """
+        Removes and returns the oldest queued event, waiting for one if the queue is empty.
+
+        Args:
+            timeout (float, optional): Maximum time to wait in seconds. Defaults to None (wait forever).
+
+        Returns:
+            Optional[Event]: The event, or None if the wait timed out or the subscription is closed.
+        """
+        with self._cond:
+            if not self._queue and not self._closed:
+                self._cond.wait_for(lambda: self._queue or self._closed, timeout)
+            if not self._queue:
+                return None
+            return self._pop()
+
+    def drain(self) -> List[Event]:
+        """
+        Removes and returns all queued events without waiting.
+        """
+        with self._cond:
+            events = [self._pop() for _ in range(len(self._queue))]
+        return events
+
+    def close(self) -> None:
+        """
+        Closes the subscription and wakes up the waiting readers. Queued events can still be drained.
+        """
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+
+    def _put(self, event: Event) -> None:
+        if self._kinds is not None and event.kind not in self._kinds:
+            return
+        with self._cond:
+            if self._closed:
+                return
+            coalesce = self._policy == COALESCE and event.kind == 'bid_accepted'
+            if coalesce:
+                entry = self._latest.get(event.lot_id)
+                if entry is not None:
+                    entry[0] = event
+                    self._coalesced += 1
+                    return
+            elif self._latest:
+                # later bids must not be merged into a bid queued before this event
+                self._latest.pop(event.lot_id, None)
+            if len(self._queue) >= self._maxsize:
+                self._pop()
+                self._dropped += 1
+            entry = [event]
+            self._queue.append(entry)
+            if coalesce:
+                self._latest[event.lot_id] = entry
+            self._cond.notify()
+
+    def _pop(self) -> Event:
+        entry = self._queue.popleft()
+        event = entry[0]
+        if self._latest and self._latest.get(event.lot_id) is entry:
+            del self._latest[event.lot_id]
+        return event
+
+
+class EventBus:
+    """
+    Publishes auction events to subscribers.
+
+    Each subscriber has its own bounded Subscription queue, so a slow subscriber never blocks
+    the platform or the other subscribers: publishing an event only appends it to every queue.
+    Subscribers read their queues without taking the platform lock.
+    """
+
+    def __init__(self):
+        self._subscriptions = ()
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return f"EventBus(subscriptions={len(self._subscriptions)})"
+
+    @property
+    def active(self) -> bool:
+        """
+        Returns whether there are subscribers, so that publishers can skip building events.
+        """
+        return bool(self._subscriptions)
+
+    def subscribe(self, maxsize: int = 1000, policy: str = DROP_OLDEST,
+                  kinds: Optional[Iterable[str]] = None) -> Subscription:
+        """
+        Creates a subscription.
+
+        Args:
+            maxsize (int, optional): Maximum number of queued events. Defaults to 1000.
+            policy (str, optional): DROP_OLDEST or COALESCE. Defaults to DROP_OLDEST.
+            kinds (Iterable[str], optional): Event kinds to receive. Defaults to None (all kinds).
+
+        Returns:
+            Subscription: The queue to read the events from.
+        """
+        if kinds is not None:
+            # a one-shot iterable is consumed only once, by this copy
+            kinds = frozenset(kinds)
+            unknown = kinds - set(EVENT_KINDS)
+            if unknown:
+                raise ValueError(f"Unknown event kinds: {', '.join(sorted(unknown))}")
+        subscription = Subscription(maxsize, policy, kinds)
+        with self._lock:
+            # publishers iterate over the tuple without locking, so it is replaced instead of mutated
+            self._subscriptions = self._subscriptions + (subscription,)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        """
+        Removes and closes a subscription.
+        """
+        with self._lock:
+            self._subscriptions = tuple(s for s in self._subscriptions if s is not subscription)
+        subscription.close()
+
+    def publish(self, event: Event) -> None:
+        """
+        Delivers an event to every subscription.
+        """
+        for subscription in self._subscriptions:
+            subscription._put(event)
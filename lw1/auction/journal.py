@@ -0,0 +1,214 @@
+from typing import List, Tuple, Any, Optional
+
+import json
+import os
+
+from .utils import STATE_FILE, JOURNAL_FILE
+from .lot import Lot
+from .auction_participant import AuctionParticipant
+from .storage import Storage, migrate_state_data
+
+
+class Journal(Storage):
+    """
+    Append-only write-ahead journal for the trading platform state.
+
+    Every call decorated with `save` appends one compact record with the mutations it made,
+    so the cost of a save depends on the size of the change and not on the size of the catalog.
+    After `snapshot_every` records the full state is written to the snapshot file and the journal
+    is truncated. On load the snapshot is read first and the journal tail is replayed on top of it.
+
+    Args:
+        path (str, optional): The journal file. Defaults to JOURNAL_FILE.
+        snapshot_path (str, optional): The snapshot file. Defaults to STATE_FILE.
+        snapshot_every (int, optional): Number of records after which the journal is compacted. Defaults to 1000.
+    """
+
+    def __init__(self, path: str = JOURNAL_FILE, snapshot_path: str = STATE_FILE, snapshot_every: int = 1000):
+        if snapshot_every <= 0:
+            raise ValueError('snapshot_every must be positive.')
+        self._path = path
+        self._snapshot_path = snapshot_path
+        self._snapshot_every = snapshot_every
+        self._file = None
+        self._seq = 0
+        self._records = 0
+        self._synced = False
+
+    def __repr__(self):
+        return f"Journal(path='{self._path}', snapshot_path='{self._snapshot_path}', snapshot_every={self._snapshot_every})"
+
+    @property
+    def path(self) -> str:
+        """
+        Returns the path of the journal file.
+        """
+        return self._path
+
+    @property
+    def snapshot_path(self) -> str:
+        """
+        Returns the path of the snapshot file.
+        """
+        return self._snapshot_path
+
+    def save(self, platform, changes: List[Tuple[str, Any]]) -> None:
+        """
+        Appends the given changes to the journal as a single record.
+
+        The first save of a session that did not load the journal writes a full snapshot instead,
+        so that stale records of a previous session are never replayed on top of the new state.
+
+        Args:
+            platform (TradingPlatform): The platform the changes were made on.
+            changes (List[Tuple[str, Any]]): The mutations recorded since the previous save.
+        """
+        if not self._synced:
+            self.snapshot(platform)
+            return
+        if not changes:
+            return
+        self._seq += 1
+        record = {
+            'seq': self._seq,
+            'counters': [AuctionParticipant.participants_counter(), Lot.lot_counter()],
+            'ops': changes
+        }
+        if self._file is None:
+            self._file = open(self._path, 'a')
+        self._file.write(json.dumps(record, separators=(',', ':')) + '\n')
+        self._file.flush()
+        self._records += 1
+        if self._records >= self._snapshot_every:
+            self.snapshot(platform)
+
+    def needs_state(self, changes: List[Tuple[str, Any]]) -> bool:
+        """
+        Returns True if the next save writes a full snapshot: on the first save of a session that did not
+        load the journal, or when the record it appends makes the journal due for compaction.
+        """
+        return not self._synced or (bool(changes) and self._records + 1 >= self._snapshot_every)
+
+    def snapshot(self, platform) -> None:
+        """
+        Writes the full state to the snapshot file and truncates the journal.
+
+        Args:
+            platform (TradingPlatform): The platform whose state is written.
+        """
+        state_data = platform._state_data()
+        state_data['journal_seq'] = self._seq
+        tmp_path = self._snapshot_path + '.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump(state_data, f, separators=(',', ':'))
+        os.replace(tmp_path, self._snapshot_path)
+        self.close()
+        self._file = open(self._path, 'w')
+        self._records = 0
+        self._synced = True
+
+    def load(self) -> Optional[dict]:
+        """
+        Loads the snapshot and replays the journal records written after it.
+
+        A partially written last record (e.g. after a crash) is ignored and cut off the journal,
+        so that the records appended afterwards start on a line of their own.
+
+        Returns:
+            Optional[dict]: The state data in the snapshot format, or None if neither file exists.
+        """
+        state_data = None
+        try:
+            with open(self._snapshot_path, 'r') as f:
+                state_data = json.load(f)
+        except FileNotFoundError:
+            pass
+
+        self._seq = state_data.get('journal_seq', 0) if state_data else 0
+        self._records = 0
+        self._synced = True
+
+        try:
+            f = open(self._path, 'r+b')
+        except FileNotFoundError:
+            return state_data
+
+        with f:
+            state_data = migrate_state_data(state_data if state_data is not None else {})
+            participants = {p['participant_id']: p for p in state_data.get('participants', [])}
+            lots = {lot['lot_id']: lot for lot in state_data.get('lots', [])}
+            sold_lots = {lot['lot_id']: lot for lot in state_data.get('sold_lots', [])}
+            schedule = {entry[0]: entry for entry in state_data['schedule']}
+            end = 0
+            for line in f:
+                if not line.endswith(b'\n'):
+                    break
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    break
+                end += len(line)
+                if record['seq'] <= self._seq:
+                    continue
+                for op, data in record['ops']:
+                    _apply(state_data, participants, lots, sold_lots, schedule, op, data)
+                state_data['participants_counter'], state_data['lot_counter'] = record['counters']
+                self._seq = record['seq']
+                self._records += 1
+            if f.seek(0, os.SEEK_END) > end:
+                self.close()
+                f.truncate(end)
+            state_data['participants'] = list(participants.values())
+            state_data['lots'] = list(lots.values())
+            state_data['sold_lots'] = list(sold_lots.values())
+            state_data['schedule'] = [entry for lot_id, entry in schedule.items() if lot_id in lots]
+        return state_data
+
+    def close(self) -> None:
+        """
+        Closes the journal file if it is open.
+        """
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+def _apply(state_data: dict, participants: dict, lots: dict, sold_lots: dict, schedule: dict, op: str,
+           data: Any) -> None:
+    """
+    Applies a single recorded mutation to the state data being rebuilt.
+    """
+    if op == 'add_participant':
+        if 'lot_ids' not in data:
+            # records written before STATE_SCHEMA 2 embed the owned lots
+            data['lot_ids'] = [lot['lot_id'] for lot in data.pop('lots', [])]
+        participants[data['participant_id']] = data
+    elif op == 'remove_participant':
+        participant = participants.pop(data)
+        for lot_id in participant['lot_ids']:
+            sold_lots.pop(lot_id, None)
+    elif op == 'add_lot':
+        lots[data['lot_id']] = data
+        # a priority kept by the lot is recorded right after
+        schedule.pop(data['lot_id'], None)
+    elif op in ('remove_lot', 'take_lot'):
+        lots.pop(data, None)
+        schedule.pop(data, None)
+    elif op == 'schedule':
+        lot_id = data['lot_id']
+        if lot_id in lots:
+            lots[lot_id] = lots.pop(lot_id)
+        if data['priority'] or data['start_at'] is not None:
+            schedule[lot_id] = [lot_id, data['priority'], data['start_at']]
+        else:
+            schedule.pop(lot_id, None)
+    elif op == 'sell':
+        lot = data['lot']
+        participant = participants[data['participant_id']]
+        participant['lot_ids'].append(lot['lot_id'])
+        participant['balance'] = data['balance']
+        sold_lots[lot['lot_id']] = lot
+    elif op == 'timeout':
+        state_data['timeout'] = data
+    else:
+        raise ValueError(f"Unknown journal operation: {op}")
@@ -7,6 +7,7 @@ class Lot:
         description (str, optional): The description of the lot. Defaults to None.
         minimum_bid (float, optional): The minimum bid for the lot. Defaults to 0.
     """
+    __slots__ = ('_name', '_description', '_minimum_bid', '_lot_id')
     _lot_counter = 0
 
     def __init__(self, name: str = None, description: str = None, minimum_bid: int = 0):
@@ -126,6 +127,27 @@ class Lot:
             cls._lot_counter = lot._lot_id + 1
         return lot
 
+    @classmethod
+    def _restore(cls, lot_id: int, name: str, description: str, minimum_bid: int) -> 'Lot':
+        """
+        Recreates a stored lot without moving the lot counter, which the caller restores on its own.
+
+        Args:
+            lot_id (int): The ID of the lot.
+            name (str): The name of the lot.
+            description (str): The description of the lot.
+            minimum_bid (float): The minimum bid for the lot.
+
+        Returns:
+            Lot: The lot.
+        """
+        lot = cls.__new__(cls)
+        lot._name = name
+        lot._description = description
+        lot._minimum_bid = minimum_bid
+        lot._lot_id = lot_id
+        return lot
+
     @classmethod
     def lot_counter(cls) -> int:
         """
@@ -0,0 +1,244 @@
+from typing import Iterable, Iterator, List, Mapping, Optional, Tuple
+
+import heapq
+import itertools
+
+
+class LotScheduler:
+    """
+    Auction order of the pending lots.
+
+    A lot is ready once its start time has come; among the ready lots the one with the highest
+    priority is auctioned first, and lots of equal priority in the order they were scheduled.
+    Lots waiting for their start time are kept in a heap by start time and moved to the heap of
+    ready lots as the time comes, so scheduling and taking a lot are O(log n). Rescheduled or
+    removed lots leave stale heap entries behind, which are dropped when they surface.
+
+    A lot that closes without bids is relisted with an exponential backoff: its n-th relisting
+    makes it wait `relist_backoff * 2 ** (n - 1)` seconds, at most `max_backoff`. With the default
+    backoff of 0 it is simply queued behind the lots of its priority.
+
+    Times are those of the platform clock; the `now` passed to the methods must never decrease.
+
+    Args:
+        relist_backoff (float, optional): Delay of the first relisting in seconds. Defaults to 0.
+        max_backoff (float, optional): Upper bound of the relisting delay in seconds. Defaults to 3600.
+    """
+
+    def __init__(self, relist_backoff: float = 0, max_backoff: float = 3600):
+        if relist_backoff < 0 or max_backoff < 0:
+            raise ValueError('Backoff must be non-negative.')
+        self.relist_backoff = relist_backoff
+        self.max_backoff = max_backoff
+        self._entries = {}
+        self._priorities = {}
+        self._relistings = {}
+        self._ready = []
+        self._waiting = []
+        self._counter = itertools.count()
+
+    def __repr__(self):
+        return f"LotScheduler(lots={len(self._entries)}, relist_backoff={self.relist_backoff})"
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, lot_id: int) -> bool:
+        return lot_id in self._entries
+
+    def push(self, lot_id: int, priority: Optional[int] = None, start_at: Optional[float] = None) -> None:
+        """
+        Schedules a lot, replacing its previous schedule.
+
+        Args:
+            lot_id (int): The ID of the lot.
+            priority (int, optional): Higher priorities are auctioned first. Defaults to None,
+                which keeps the priority the lot was last scheduled with (0 for a new lot).
+            start_at (float, optional): Clock time before which the lot is not auctioned. Defaults to None.
+        """
+        if priority is None:
+            priority = self._priorities.get(lot_id, 0)
+        self._priorities[lot_id] = priority
+        entry = (start_at, -priority, next(self._counter), lot_id)
+        self._entries[lot_id] = entry
+        if start_at is None:
+            heapq.heappush(self._ready, (entry[1], entry[2], entry))
+        else:
+            heapq.heappush(self._waiting, (start_at, entry[2], entry))
+        if len(self._ready) + len(self._waiting) > 2 * len(self._entries) + 16:
+            self._compact()
+
+    def relist(self, lot_id: int, now: float) -> float:
+        """
+        Schedules again a lot that closed without bids, after the relisting backoff.
+
+        Args:
+            lot_id (int): The ID of the lot.
+            now (float): The current clock time.
+
+        Returns:
+            float: The time the lot becomes ready again.
+        """
+        relistings = self._relistings.get(lot_id, 0) + 1
+        self._relistings[lot_id] = relistings
+        delay = min(self.relist_backoff * 2 ** (relistings - 1), self.max_backoff) if self.relist_backoff else 0
+        self.push(lot_id, start_at=now + delay if delay else None)
+        return now + delay
+
+    def take(self, lot_id: int) -> None:
+        """
+        Unschedules a lot that is being auctioned, keeping its priority and relisting count.
+        """
+        self._entries.pop(lot_id, None)
+
+    def discard(self, lot_id: int) -> None:
+        """
+        Forgets a lot that was sold or removed.
+        """
+        self._entries.pop(lot_id, None)
+        self._priorities.pop(lot_id, None)
+        self._relistings.pop(lot_id, None)
+
+    def pop(self, now: float) -> Optional[int]:
+        """
+        Unschedules and returns the next lot ready at `now`.
+
+        Returns:
+            Optional[int]: The ID of the lot, or None if no lot is ready.
+        """
+        self._promote(now)
+        ready = self._ready
+        while ready:
+            entry = heapq.heappop(ready)[2]
+            lot_id = entry[3]
+            if self._entries.get(lot_id) is entry:
+                del self._entries[lot_id]
+                return lot_id
+        return None
+
+    def peek(self, now: float) -> Optional[int]:
+        """
+        Returns the next lot ready at `now` without unscheduling it, or None if no lot is ready.
+        """
+        self._promote(now)
+        entry = self._first_live(self._ready)
+        return entry[3] if entry is not None else None
+
+    def next_start(self, now: float) -> Optional[float]:
+        """
+        Returns when the next lot becomes ready: `now` if a lot is ready, None if no lot is scheduled.
+        """
+        self._promote(now)
+        if self._first_live(self._ready) is not None:
+            return now
+        entry = self._first_live(self._waiting)
+        return entry[0] if entry is not None else None
+
+    def lineup(self, now: float, count: int = 10) -> List[int]:
+        """
+        Returns the upcoming lots without unscheduling them: the lots ready at `now` in auction order,
+        followed by the lots waiting for their start time, by start time.
+
+        The heaps are walked from the root, so the call takes O(count log count) plus the stale entries met.
+
+        Args:
+            now (float): The current clock time.
+            count (int, optional): Maximum number of lots to return. Defaults to 10.
+
+        Returns:
+            List[int]: The IDs of the lots.
+        """
+        self._promote(now)
+        lineup = self._walk(self._ready, count)
+        if len(lineup) < count:
+            lineup.extend(self._walk(self._waiting, count - len(lineup)))
+        return lineup
+
+    def get(self, lot_id: int) -> Optional[Tuple[int, Optional[float]]]:
+        """
+        Returns the `(priority, start_at)` of a scheduled lot, or None if the lot is not scheduled.
+        """
+        entry = self._entries.get(lot_id)
+        return (-entry[1], entry[0]) if entry is not None else None
+
+    def schedules(self) -> Iterator[Tuple[int, int, Optional[float]]]:
+        """
+        Yields `(lot_id, priority, start_at)` of the scheduled lots with a priority or a start time.
+        """
+        for start_at, priority, _, lot_id in self._entries.values():
+            if priority or start_at is not None:
+                yield lot_id, -priority, start_at
+
+    def reset(self, lot_ids: Iterable[int], schedules: Mapping[int, Tuple[int, Optional[float]]] = None) -> None:
+        """
+        Replaces the schedule with the given lots in the given order.
+
+        Args:
+            lot_ids (Iterable[int]): The IDs of the lots.
+            schedules (Mapping[int, Tuple[int, Optional[float]]], optional): `(priority, start_at)` by lot ID;
+                the other lots get the default priority and are ready immediately. Defaults to None.
+        """
+        self._entries = {}
+        self._priorities = {}
+        self._relistings = {}
+        self._ready = []
+        self._waiting = []
+        for lot_id in lot_ids:
+            priority, start_at = schedules.get(lot_id, (0, None)) if schedules else (0, None)
+            self.push(lot_id, priority, start_at)
+
+    def copy(self) -> 'LotScheduler':
+        scheduler = LotScheduler(self.relist_backoff, self.max_backoff)
+        scheduler._entries = self._entries.copy()
+        scheduler._priorities = self._priorities.copy()
+        scheduler._relistings = self._relistings.copy()
+        scheduler._ready = self._ready.copy()
+        scheduler._waiting = self._waiting.copy()
+        scheduler._counter = self._counter
+        return scheduler
+
+    def _promote(self, now: float) -> None:
+        """
+        Moves the lots whose start time has come to the heap of ready lots.
+        """
+        waiting = self._waiting
+        while waiting and waiting[0][0] <= now:
+            entry = heapq.heappop(waiting)[2]
+            if self._entries.get(entry[3]) is entry:
+                heapq.heappush(self._ready, (entry[1], entry[2], entry))
+
+    def _first_live(self, heap: list) -> Optional[tuple]:
+        """
+        Drops the stale entries from the top of a heap and returns its first live entry.
+        """
+        while heap:
+            entry = heap[0][2]
+            if self._entries.get(entry[3]) is entry:
+                return entry
+            heapq.heappop(heap)
+        return None
+
+    def _walk(self, heap: list, count: int) -> List[int]:
+        """
+        Returns the IDs of the first `count` live entries of a heap in order, without popping them.
+        """
+        lot_ids = []
+        frontier = [(heap[0], 0)] if heap else []
+        while frontier and len(lot_ids) < count:
+            item, index = heapq.heappop(frontier)
+            entry = item[2]
+            if self._entries.get(entry[3]) is entry:
+                lot_ids.append(entry[3])
+            for child in (2 * index + 1, 2 * index + 2):
+                if child < len(heap):
+                    heapq.heappush(frontier, (heap[child], child))
+        return lot_ids
+
+    def _compact(self) -> None:
+        """
+        Rebuilds the heaps from the live entries.
+        """
+        self._ready = [(entry[1], entry[2], entry) for entry in self._entries.values() if entry[0] is None]
+        self._waiting = [(entry[0], entry[2], entry) for entry in self._entries.values() if entry[0] is not None]
+        heapq.heapify(self._ready)
+        heapq.heapify(self._waiting)
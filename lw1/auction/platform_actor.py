@@ -0,0 +1,147 @@
+from concurrent.futures import Future
+from collections import deque
+from typing import Callable, Any, Iterable, Tuple
+
+import queue
+import threading
+import time
+
+from . import AuctionParticipant
+
+_STOP = object()
+
+
+class PlatformActor:
+    """
+    Single-writer front-end of a TradingPlatform.
+
+    Every mutation (bids, pause/resume, end, ...) is posted as a command to one queue drained by
+    a dedicated writer thread, and the caller gets a Future back. Timer expirations of the platform
+    are posted to the same queue, so all state transitions happen on the writer thread one by one.
+    The queue depth and the latency of the commands can be inspected while the actor is running.
+
+    Args:
+        platform (TradingPlatform): The platform to drive.
+        maxsize (int, optional): Maximum number of queued commands, 0 for unbounded. Defaults to 0.
+        latency_samples (int, optional): Number of recent command latencies kept for percentiles. Defaults to 10000.
+    """
+
+    def __init__(self, platform, maxsize: int = 0, latency_samples: int = 10000):
+        self._platform = platform
+        self._queue = queue.Queue(maxsize)
+        self._latencies = deque(maxlen=latency_samples)
+        self._completed = 0
+        self._total_latency = 0.0
+        self._max_latency = 0.0
+        self._thread = threading.Thread(target=self._run, name='auction-writer', daemon=True)
+        platform._dispatch = self.submit
+        self._thread.start()
+
+    def __repr__(self):
+        return f"PlatformActor(queue_depth={self.queue_depth}, completed={self._completed})"
+
+    def __enter__(self) -> 'PlatformActor':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.stop()
+
+    @property
+    def queue_depth(self) -> int:
+        """
+        Returns the number of commands waiting in the queue.
+        """
+        return self._queue.qsize()
+
+    def submit(self, func: Callable[..., Any], *args, **kwargs) -> Future:
+        """
+        Posts a command to the writer thread.
+
+        Args:
+            func (Callable[..., Any]): The function to call on the writer thread.
+            *args, **kwargs: Arguments of the function.
+
+        Returns:
+            Future: A future resolved with the result (or the exception) of the call.
+        """
+        future = Future()
+        self._queue.put((func, args, kwargs, future, time.perf_counter()))
+        return future
+
+    def place_bid(self, participant: AuctionParticipant, amount: int) -> Future:
+        return self.submit(self._platform.place_bid, participant, amount)
+
+    def place_bids(self, bids: Iterable[Tuple[AuctionParticipant, int]]) -> Future:
+        return self.submit(self._platform.place_bids, list(bids))
+
+    def start_auction(self) -> Future:
+        return self.submit(self._platform.start_auction)
+
+    def end_auction(self) -> Future:
+        return self.submit(self._platform.end_auction)
+
+    def pause_auction(self) -> Future:
+        return self.submit(self._platform.pause_auction)
+
+    def resume_auction(self) -> Future:
+        return self.submit(self._platform.resume_auction)
+
+    def restart_auction(self) -> Future:
+        return self.submit(self._platform.restart_auction)
+
+    def abort_auction(self) -> Future:
+        return self.submit(self._platform.abort_auction)
+
+    def add(self, *args) -> Future:
+        return self.submit(self._platform.add, *args)
+
+    def remove(self, *args) -> Future:
+        return self.submit(self._platform.remove, *args)
+
+    def latency_stats(self) -> dict:
+        """
+        Returns statistics of the time between posting a command and its completion.
+
+        Returns:
+            dict: `count`, `mean`, `max`, `p50` and `p99` latencies in seconds (percentiles over recent commands).
+        """
+        samples = sorted(self._latencies)
+        count = self._completed
+        return {
+            'count': count,
+            'mean': self._total_latency / count if count else 0.0,
+            'max': self._max_latency,
+            'p50': samples[len(samples) // 2] if samples else 0.0,
+            'p99': samples[min(len(samples) - 1, len(samples) * 99 // 100)] if samples else 0.0
+        }
+
+    def stop(self, wait: bool = True) -> None:
+        """
+        Stops the writer thread after the commands already queued, and detaches from the platform.
+
+        Args:
+            wait (bool, optional): Whether to wait for the writer thread to finish. Defaults to True.
+        """
+        if self._platform._dispatch == self.submit:
+            self._platform._dispatch = None
+        self._queue.put(_STOP)
+        if wait:
+            self._thread.join()
+
+    def _run(self) -> None:
+        while True:
+            command = self._queue.get()
+            if command is _STOP:
+                break
+            func, args, kwargs, future, posted = command
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                future.set_result(func(*args, **kwargs))
+            except BaseException as e:
+                future.set_exception(e)
+            latency = time.perf_counter() - posted
+            self._latencies.append(latency)
+            self._completed += 1
+            self._total_latency += latency
+            self._max_latency = max(self._max_latency, latency)
@@ -0,0 +1,279 @@
+from collections import namedtuple
+from collections.abc import Mapping
+from typing import Any, Iterable, Iterator, List, Optional, Tuple
+
+_BITS = 5
+_WIDTH = 1 << _BITS
+_MASK = _WIDTH - 1
+
+ParticipantView = namedtuple('ParticipantView', ['participant_id', 'nickname', 'balance', 'lot_ids'])
+ParticipantView.__doc__ = """Immutable copy of a participant taken when a snapshot was published; `lot_ids` is a tuple."""
+
+BidView = namedtuple('BidView', ['amount', 'participant_id'])
+BidView.__doc__ = """Immutable copy of the current bid; `participant_id` is None before the first bid."""
+
+PlatformSnapshot = namedtuple('PlatformSnapshot', ['version', 'state', 'participants', 'lots', 'sold_lots',
+                                                   'current_lot', 'current_bid'])
+PlatformSnapshot.__doc__ = """Consistent, immutable view of a TradingPlatform returned by `TradingPlatform.snapshot`.
+`participants` maps IDs to ParticipantView, `lots` and `sold_lots` map IDs to Lot, each a PersistentMap
+iterated in ID order; `current_bid` is a BidView or None. `version` grows with every published change."""
+
+
+class PersistentMap(Mapping):
+    """
+    Immutable mapping from non-negative integer IDs to values, iterated in ID order.
+
+    The items are kept in a trie of 32-slot tuples indexed by 5-bit groups of the ID. `set` and `delete`
+    return a new map that copies only the tuples on the path to the ID, O(log32 n), and shares the rest
+    with the original, so consecutive versions of a large index cost little to publish and any version
+    can be read by other threads without locking. None cannot be stored as a value.
+
+    Args:
+        items (Iterable[Tuple[int, Any]], optional): Initial `(id, value)` pairs. Defaults to none.
+    """
+
+    __slots__ = ('_root', '_shift', '_count')
+
+    def __init__(self, items: Iterable[Tuple[int, Any]] = ()):
+        root = None
+        shift = 0
+        count = 0
+        for key, value in items:
+            _check(key, value)
+            while key >> (shift + _BITS):
+                root = [root] + [None] * (_WIDTH - 1) if root is not None else None
+                shift += _BITS
+            if root is None:
+                root = [None] * _WIDTH
+            node = root
+            for level in range(shift, 0, -_BITS):
+                index = (key >> level) & _MASK
+                child = node[index]
+                if child is None:
+                    child = node[index] = [None] * _WIDTH
+                node = child
+            if node[key & _MASK] is None:
+                count += 1
+            node[key & _MASK] = value
+        self._root = _freeze(root, shift)
+        self._shift = shift
+        self._count = count
+
+    def __repr__(self):
+        return f"PersistentMap(size={self._count})"
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, key: int) -> Any:
+        value = self.get(key)
+        if value is None:
+            raise KeyError(key)
+        return value
+
+    def __contains__(self, key: object) -> bool:
+        return self.get(key) is not None
+
+    def __iter__(self) -> Iterator[int]:
+        for key, _ in self._walk(self._root, self._shift, 0):
+            yield key
+
+    def get(self, key: int, default: Any = None) -> Any:
+        if not isinstance(key, int) or key < 0 or key >> (self._shift + _BITS):
+            return default
+        node = self._root
+        shift = self._shift
+        while node is not None and shift:
+            node = node[(key >> shift) & _MASK]
+            shift -= _BITS
+        if node is None:
+            return default
+        value = node[key & _MASK]
+        return default if value is None else value
+
+    def values(self) -> List[Any]:
+        """
+        Returns the values in ID order.
+        """
+        return [value for _, value in self._walk(self._root, self._shift, 0)]
+
+    def items(self) -> List[Tuple[int, Any]]:
+        """
+        Returns the `(id, value)` pairs in ID order.
+        """
+        return list(self._walk(self._root, self._shift, 0))
+
+    def set(self, key: int, value: Any) -> 'PersistentMap':
+        """
+        Returns a copy of the map with `key` set to `value`.
+
+        Raises:
+            ValueError: If the key is not a non-negative integer or the value is None.
+        """
+        _check(key, value)
+        root, shift = self._root, self._shift
+        while key >> (shift + _BITS):
+            root = (root,) + (None,) * (_WIDTH - 1) if root is not None else None
+            shift += _BITS
+        root, added = _assoc(root, shift, key, value)
+        return self._derive(root, shift, self._count + added)
+
+    def delete(self, key: int) -> 'PersistentMap':
+        """
+        Returns a copy of the map without `key`, or the map itself if it has no such key.
+        """
+        if key not in self:
+            return self
+        root, _ = _assoc(self._root, self._shift, key, None)
+        return self._derive(root, self._shift, self._count - 1)
+
+    def _derive(self, root: Optional[tuple], shift: int, count: int) -> 'PersistentMap':
+        derived = PersistentMap.__new__(PersistentMap)
+        derived._root = root
+        derived._shift = shift
+        derived._count = count
+        return derived
+
+    @staticmethod
+    def _walk(node: Optional[tuple], shift: int, prefix: int) -> Iterator[Tuple[int, Any]]:
+        if node is None:
+            return
+        if not shift:
+            for index, value in enumerate(node):
+                if value is not None:
+                    yield prefix | index, value
+            return
+        for index, child in enumerate(node):
+            if child is not None:
+                yield from PersistentMap._walk(child, shift - _BITS, prefix | (index << shift))
+
+
+def _check(key: int, value: Any) -> None:
+    if not isinstance(key, int) or key < 0:
+        raise ValueError(f"Key must be a non-negative integer, got {key!r}")
+    if value is None:
+        raise ValueError('Value cannot be None')
+
+
+def _freeze(node: Optional[list], shift: int) -> Optional[tuple]:
+    """
+    Converts a trie built of lists into tuples.
+    """
+    if node is None:
+        return None
+    if not shift:
+        return tuple(node)
+    return tuple(_freeze(child, shift - _BITS) for child in node)
+
+
+def _assoc(node: Optional[tuple], shift: int, key: int, value: Any) -> Tuple[Optional[tuple], int]:
+    """
+    Returns a copy of the path to `key` with its slot set to `value` (None clears it), dropping nodes
+    left empty, and 1 if the key was added, otherwise 0.
+    """
+    index = (key >> shift) & _MASK
+    slots = list(node) if node is not None else [None] * _WIDTH
+    if shift:
+        slots[index], added = _assoc(slots[index], shift - _BITS, key, value)
+    else:
+        added = int(slots[index] is None and value is not None)
+        slots[index] = value
+    if value is None and not any(slot is not None for slot in slots):
+        return None, added
+    return tuple(slots), added
+
+
+def participant_view(participant) -> ParticipantView:
+    """
+    Returns an immutable copy of an AuctionParticipant.
+    """
+    return ParticipantView(participant.participant_id, participant.nickname, participant.balance,
+                           tuple(participant.lot_ids))
+
+
+def bid_view(bid) -> Optional[BidView]:
+    """
+    Returns an immutable copy of a Bid, or None if there is no bid.
+    """
+    if bid is None:
+        return None
+    return BidView(bid.amount, bid.participant.participant_id if bid.participant is not None else None)
+
+
+def build_snapshot(version: int, state: str, participants: Mapping, lots: Mapping, sold_lots: Mapping,
+                   current_lot=None, current_bid=None) -> PlatformSnapshot:
+    """
+    Builds a snapshot from scratch, copying every participant and index entry.
+
+    Args:
+        version (int): Version of the snapshot.
+        state (str): State of the auction.
+        participants (Mapping): Participants by ID.
+        lots (Mapping): Pending lots by ID.
+        sold_lots (Mapping): Sold lots by ID.
+        current_lot (Lot, optional): The lot being auctioned. Defaults to None.
+        current_bid (Bid, optional): The current bid. Defaults to None.
+
+    Returns:
+        PlatformSnapshot: The snapshot.
+    """
+    return PlatformSnapshot(version, state,
+                            PersistentMap((pid, participant_view(p)) for pid, p in participants.items()),
+                            PersistentMap(lots.items()), PersistentMap(sold_lots.items()),
+                            current_lot, bid_view(current_bid))
+
+
+def apply_changes(snapshot: PlatformSnapshot, changes: Iterable[Tuple[str, Any]], participants: Mapping,
+                  lots: Mapping, sold_lots: Mapping) -> PlatformSnapshot:
+    """
+    Returns a snapshot whose indexes reflect the recorded changes, sharing everything they did not touch.
+
+    The changes only tell which entries are affected; the entries are copied from the live indexes
+    as they are now, so several changes to the same entry cost one update. The version and the
+    auction fields are left to the caller.
+
+    Args:
+        snapshot (PlatformSnapshot): The snapshot the changes were made after.
+        changes (Iterable[Tuple[str, Any]]): Changes recorded by `TradingPlatform._record` since that snapshot.
+        participants (Mapping): The live participants by ID.
+        lots (Mapping): The live pending lots by ID.
+        sold_lots (Mapping): The live sold lots by ID.
+
+    Returns:
+        PlatformSnapshot: The updated snapshot.
+    """
+    participant_ids, lot_ids, sold_ids = set(), set(), set()
+    for op, data in changes:
+        if op == 'add_participant':
+            participant_ids.add(data['participant_id'])
+        elif op == 'remove_participant':
+            participant_ids.add(data)
+            view = snapshot.participants.get(data)
+            if view is not None:
+                sold_ids.update(view.lot_ids)
+        elif op == 'add_lot':
+            lot_ids.add(data['lot_id'])
+        elif op in ('remove_lot', 'take_lot'):
+            lot_ids.add(data)
+        elif op == 'sell':
+            lot_ids.add(data['lot']['lot_id'])
+            sold_ids.add(data['lot']['lot_id'])
+            participant_ids.add(data['participant_id'])
+    participant_map = snapshot.participants
+    for participant_id in participant_ids:
+        participant = participants.get(participant_id)
+        participant_map = (participant_map.set(participant_id, participant_view(participant))
+                           if participant is not None else participant_map.delete(participant_id))
+    return snapshot._replace(participants=participant_map,
+                             lots=_sync(snapshot.lots, lot_ids, lots),
+                             sold_lots=_sync(snapshot.sold_lots, sold_ids, sold_lots))
+
+
+def _sync(index: PersistentMap, keys: Iterable[int], source: Mapping) -> PersistentMap:
+    """
+    Copies the entries `keys` of a live index into a persistent one.
+    """
+    for key in keys:
+        value = source.get(key)
+        index = index.set(key, value) if value is not None else index.delete(key)
+    return index
@@ -0,0 +1,126 @@
+from typing import Optional, Tuple, List
+
+import heapq
+import itertools
+
+from . import AuctionParticipant
+
+
+class ProxyBook:
+    """
+    Maximum (proxy) bids of the participants on a lot, resolved eBay-style.
+
+    Proxies are kept in a max-heap. The leader is the participant with the highest maximum
+    (the earliest one on ties) and the price is one increment above the best competing commitment,
+    capped by the leader's maximum. Raised maximums leave stale heap entries behind, which are
+    dropped when they surface, so resolving a new proxy takes O(log n) amortized.
+
+    Args:
+        increment (int, optional): The minimal step between competing bids. Defaults to 1.
+    """
+
+    def __init__(self, increment: int = 1):
+        if increment <= 0:
+            raise ValueError('Bid increment must be positive.')
+        self._increment = increment
+        self._heap = []
+        self._maximums = {}
+        self._participants = {}
+        self._counter = itertools.count()
+
+    def __repr__(self):
+        return f"ProxyBook(proxies={len(self._maximums)}, increment={self._increment})"
+
+    def __len__(self) -> int:
+        return len(self._maximums)
+
+    def maximum(self, participant: AuctionParticipant) -> Optional[int]:
+        """
+        Returns the maximum registered by a participant, or None if they have no proxy.
+        """
+        return self._maximums.get(participant.participant_id)
+
+    def submit(self, participant: AuctionParticipant, maximum: int) -> None:
+        """
+        Registers or raises the maximum bid of a participant.
+
+        Args:
+            participant (AuctionParticipant): The participant.
+            maximum (int): The maximum amount the participant is willing to pay.
+
+        Raises:
+            ValueError: If the participant already registered a maximum that is not lower.
+        """
+        participant_id = participant.participant_id
+        previous = self._maximums.get(participant_id)
+        if previous is not None and maximum <= previous:
+            raise ValueError("Maximum bid must be greater than the previous maximum")
+        self._maximums[participant_id] = maximum
+        self._participants[participant_id] = participant
+        heapq.heappush(self._heap, (-maximum, next(self._counter), participant_id))
+
+    def withdraw(self, participant: AuctionParticipant) -> None:
+        """
+        Removes the proxy of a participant. Its heap entry is dropped lazily.
+        """
+        self._maximums.pop(participant.participant_id, None)
+        self._participants.pop(participant.participant_id, None)
+
+    def resolve(self, current_amount: int, current_participant: Optional[AuctionParticipant],
+                minimum_bid: int) -> Optional[Tuple[AuctionParticipant, int]]:
+        """
+        Computes the bid the proxies produce against the current bid.
+
+        Args:
+            current_amount (int): The amount of the current bid.
+            current_participant (AuctionParticipant, optional): The current leader, or None if there are no bids.
+            minimum_bid (int): The minimum bid of the lot.
+
+        Returns:
+            Optional[Tuple[AuctionParticipant, int]]: The new leader and price, or None if the current bid stands.
+        """
+        top = self._top_two()
+        if not top:
+            return None
+        leader_max, leader_id = top[0]
+        second_max = top[1][0] if len(top) > 1 else None
+        current_id = current_participant.participant_id if current_participant is not None else None
+
+        if leader_id == current_id:
+            if second_max is None:
+                return None
+            price = max(current_amount, min(leader_max, second_max + self._increment))
+            if price == current_amount:
+                return None
+        else:
+            if current_id is not None and leader_max <= current_amount:
+                return None
+            competitor = second_max
+            if current_id is not None:
+                competitor = current_amount if competitor is None else max(competitor, current_amount)
+            # the opening price must still beat the current amount, which is 0 on a lot without bids
+            price = max(minimum_bid, current_amount + self._increment)
+            if competitor is not None:
+                price = max(price, competitor + self._increment)
+            price = min(leader_max, price)
+            if price <= current_amount:
+                return None
+        return self._participants[leader_id], price
+
+    def _top_two(self) -> List[Tuple[int, int]]:
+        """
+        Returns up to two (maximum, participant ID) pairs of distinct participants with the highest maximums.
+        """
+        found = []
+        popped = []
+        heap = self._heap
+        while heap and len(found) < 2:
+            entry = heapq.heappop(heap)
+            neg_maximum, _, participant_id = entry
+            if self._maximums.get(participant_id) != -neg_maximum or any(pid == participant_id for _, pid in found):
+                continue
+            popped.append(entry)
+            found.append((-neg_maximum, participant_id))
+        for entry in popped:
+            heapq.heappush(heap, entry)
+        return found
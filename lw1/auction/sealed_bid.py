@@ -0,0 +1,350 @@
+from array import array
+from collections import namedtuple
+from typing import Iterable, List, Optional, Tuple
+
+import threading
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is optional
+    np = None
+
+from . import Timer
+from . import Lot
+from . import AuctionParticipant
+from . import Bid
+from .trading_platform import BidResult
+
+FIRST_PRICE = 'first_price'
+SECOND_PRICE = 'second_price'
+
+SealedBidResult = namedtuple('SealedBidResult', ['lot', 'winner', 'price'])
+SealedBidResult.__doc__ = """Outcome of a lot in a sealed-bid round. `winner` and `price` are None for unsold lots."""
+
+
+class SealedBidAuction:
+    """
+    A sealed-bid round over many lots of a TradingPlatform, cleared all at once.
+
+    Opening the round takes the lots from the pending lots of the platform. During the round
+    participants submit bids without seeing the others; a later bid of a participant on a lot
+    replaces their earlier one. Clearing resolves every lot in a vectorized NumPy pass over the
+    (lot, participant, amount) columns of the bids: the highest bid wins (the earliest on ties)
+    and pays its own amount with FIRST_PRICE pricing, or the second highest amount (at least the
+    minimum bid of the lot) with SECOND_PRICE (Vickrey) pricing.
+
+    A participant may win more lots than their balance covers. Then their most expensive win that
+    does not fit is dropped and the lot goes to the next bidder, and the pass is repeated until
+    every winner can pay. Finally all the lots are settled through the platform, which saves the
+    state once for the whole round; lots without a winner are relisted.
+
+    Requires numpy.
+
+    Args:
+        platform (TradingPlatform): The platform providing participants, lots and persistence.
+        pricing (str, optional): FIRST_PRICE or SECOND_PRICE. Defaults to SECOND_PRICE.
+
+    Raises:
+        RuntimeError: If numpy is not installed.
+        ValueError: If the pricing is unknown.
+    """
+
+    def __init__(self, platform, pricing: str = SECOND_PRICE):
+        if np is None:
+            raise RuntimeError('Sealed-bid clearing requires numpy')
+        if pricing not in (FIRST_PRICE, SECOND_PRICE):
+            raise ValueError(f"Unknown pricing: {pricing}")
+        self._platform = platform
+        self._pricing = pricing
+        self._lock = threading.Lock()
+        self._lots = {}
+        self._timer = None
+        self._open = False
+        self._lot_ids = array('q')
+        self._participant_ids = array('q')
+        self._amounts = []
+        self._timestamps = array('q')
+
+    def __repr__(self):
+        return f"SealedBidAuction(pricing='{self._pricing}', lots={len(self._lots)}, bids={len(self._amounts)})"
+
+    @property
+    def is_open(self) -> bool:
+        return self._open
+
+    @property
+    def lots(self) -> List[Lot]:
+        """
+        Returns the lots of the round.
+        """
+        return list(self._lots.values())
+
+    @property
+    def bid_count(self) -> int:
+        """
+        Returns the number of bids submitted so far.
+        """
+        return len(self._amounts)
+
+    def open(self, lots: Optional[Iterable[Lot]] = None, window: Optional[float] = None) -> List[Lot]:
+        """
+        Opens the round.
+
+        Args:
+            lots (Iterable[Lot], optional): Pending lots of the platform to sell. Defaults to None,
+                which takes every lot of the schedule that is ready.
+            window (float, optional): If given, the round is cleared automatically after this many seconds
+                of the platform clock. Defaults to None (cleared by calling `clear`).
+
+        Returns:
+            List[Lot]: The lots of the round.
+
+        Raises:
+            RuntimeError: If the round is already open, the platform is running its own auction or executing a batch.
+            ValueError: If a lot is not pending or there are no lots.
+        """
+        platform = self._platform
+        with self._lock:
+            if self._open:
+                raise RuntimeError('The sealed-bid round is already open')
+            with platform._lock:
+                if platform.state != 'preparing_for_auction':
+                    raise RuntimeError(f"Cannot open a sealed-bid round while the platform is in state '{platform.state}'")
+                taken = []
+                if lots is None:
+                    while platform._schedule.peek(platform._clock.now()) is not None:
+                        taken.append(platform._take_lot())
+                else:
+                    lot_ids = [lot.lot_id for lot in lots]
+                    missing = [lot_id for lot_id in lot_ids if lot_id not in platform._lots]
+                    if missing:
+                        raise ValueError(f"Lot with ID {missing[0]} not found")
+                    taken = [platform._take_lot(lot_id) for lot_id in lot_ids]
+                if not taken:
+                    raise ValueError("No lots available to start the auction")
+                platform._save_state()
+            self._lots = {lot.lot_id: lot for lot in taken}
+            self._open = True
+            if window is not None:
+                self._timer = Timer(timeout=window, callback=self._timer_expired, scheduler=platform._clock)
+                self._timer.start()
+        for lot in taken:
+            platform._emit('lot_started', lot.lot_id)
+        return taken
+
+    def submit(self, participant: AuctionParticipant, lot_id: int, amount: float) -> None:
+        """
+        Submits a sealed bid.
+
+        Args:
+            participant (AuctionParticipant): The bidder.
+            lot_id (int): The ID of a lot of the round.
+            amount (float): The bid amount.
+
+        Raises:
+            ValueError: If the round is not open, the lot is not part of it, the participant is not registered,
+                or the amount is below the minimum bid or exceeds the balance of the participant.
+        """
+        with self._lock:
+            reason = self._rejection(participant, lot_id, amount)
+            if reason:
+                raise ValueError(reason)
+            self._append(participant.participant_id, lot_id, amount)
+
+    def submit_many(self, bids: Iterable[Tuple[AuctionParticipant, int, float]]) -> List[BidResult]:
+        """
+        Submits a batch of sealed bids under a single lock acquisition, rejecting invalid bids without raising.
+
+        Args:
+            bids (Iterable[Tuple[AuctionParticipant, int, float]]): `(participant, lot_id, amount)` triples.
+
+        Returns:
+            List[BidResult]: The result of every bid, in the order of the batch.
+        """
+        results = []
+        with self._lock:
+            for participant, lot_id, amount in bids:
+                reason = self._rejection(participant, lot_id, amount)
+                if not reason:
+                    self._append(participant.participant_id, lot_id, amount)
+                results.append(BidResult(participant, amount, not reason, reason))
+        return results
+
+    def clear(self) -> List[SealedBidResult]:
+        """
+        Closes the round, resolves the winners and settles every lot with a single save.
+
+        Returns:
+            List[SealedBidResult]: The outcome of every lot of the round.
+
+        Raises:
+            RuntimeError: If the round is not open.
+        """
+        platform = self._platform
+        with self._lock:
+            if not self._open:
+                raise RuntimeError('The sealed-bid round is not open')
+            self._open = False
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            lots, self._lots = self._lots, {}
+            lot_ids, self._lot_ids = self._lot_ids, array('q')
+            participant_ids, self._participant_ids = self._participant_ids, array('q')
+            amounts, self._amounts = self._amounts, []
+            timestamps, self._timestamps = self._timestamps, array('q')
+
+        results = []
+        with platform._lock:
+            participants = platform._participants
+            winners = _resolve(lots, participants, lot_ids, participant_ids, amounts, self._pricing)
+            _record_history(platform, lot_ids, participant_ids, amounts, timestamps)
+            for lot_id, lot in lots.items():
+                winner = winners.get(lot_id)
+                if winner is None:
+                    platform._settle(lot, Bid(lot))
+                    results.append(SealedBidResult(lot, None, None))
+                    continue
+                participant_id, price = winner
+                sold_to = platform._settle(lot, Bid(lot, price, participants[participant_id]))
+                results.append(SealedBidResult(lot, sold_to, price))
+            platform._save_state()
+        return results
+
+    def _rejection(self, participant: AuctionParticipant, lot_id: int, amount: float) -> Optional[str]:
+        """
+        Returns why a bid must be rejected, or None if it is valid. Must hold `_lock`.
+        """
+        if not self._open:
+            return "The sealed-bid round is not open"
+        lot = self._lots.get(lot_id)
+        if lot is None:
+            return f"Lot with ID {lot_id} is not part of the round"
+        if participant.participant_id not in self._platform._participants:
+            return f"Participant '{participant}' not found"
+        if amount < lot.minimum_bid or amount <= 0:
+            return "Bid amount is less than the minimum bid"
+        if amount > participant.balance:
+            return "Bid amount exceeds participant balance"
+        return None
+
+    def _append(self, participant_id: int, lot_id: int, amount: float) -> None:
+        self._lot_ids.append(lot_id)
+        self._participant_ids.append(participant_id)
+        self._amounts.append(amount)
+        self._timestamps.append(self._platform._timestamp())
+
+    def _timer_expired(self) -> None:
+        try:
+            self.clear()
+        except RuntimeError:
+            pass
+
+
+def _resolve(lots: dict, participants: dict, lot_ids: array, participant_ids: array, amounts: list,
+             pricing: str) -> dict:
+    """
+    Resolves the winners of a sealed-bid round.
+
+    Args:
+        lots (dict): The lots of the round by ID.
+        participants (dict): The registered participants by ID; bids of other participants are ignored.
+        lot_ids, participant_ids, amounts: The columns of the bids, in submission order.
+        pricing (str): FIRST_PRICE or SECOND_PRICE.
+
+    Returns:
+        dict: `(participant_id, price)` by lot ID, for the lots that have a winner.
+    """
+    if not amounts or not participants:
+        return {}
+    lot_col = np.frombuffer(lot_ids, dtype=np.int64)
+    participant_col = np.frombuffer(participant_ids, dtype=np.int64)
+    amount_col = np.asarray(amounts, dtype=np.float64)
+    seq = np.arange(len(amount_col))
+
+    # dense indexes of the participants, so that the balances can be looked up with fancy indexing
+    known_ids = np.fromiter(participants, dtype=np.int64, count=len(participants))
+    balance_of = np.fromiter((p.balance for p in participants.values()), dtype=np.float64, count=len(participants))
+    id_order = np.argsort(known_ids)
+    position = np.searchsorted(known_ids, participant_col, sorter=id_order).clip(max=len(known_ids) - 1)
+    participant_idx = id_order[position]
+    alive = known_ids[participant_idx] == participant_col
+
+    # only the last bid of every participant on a lot counts
+    order = np.lexsort((seq, participant_col, lot_col))
+    last = np.ones(len(order), dtype=bool)
+    last[:-1] = (lot_col[order][1:] != lot_col[order][:-1]) | (participant_col[order][1:] != participant_col[order][:-1])
+    superseded = np.ones(len(seq), dtype=bool)
+    superseded[order[last]] = False
+    alive &= ~superseded
+
+    round_ids = np.fromiter(lots, dtype=np.int64, count=len(lots))
+    round_minimums = np.fromiter((lot.minimum_bid for lot in lots.values()), dtype=np.float64, count=len(lots))
+    round_order = np.argsort(round_ids)
+    minimum_col = round_minimums[round_order[np.searchsorted(round_ids, lot_col, sorter=round_order)]]
+
+    while True:
+        rows = np.flatnonzero(alive)
+        if not len(rows):
+            return {}
+        # bids of every lot from the highest, the earliest first on ties
+        ranked = rows[np.lexsort((seq[rows], -amount_col[rows], lot_col[rows]))]
+        ranked_lots = lot_col[ranked]
+        first = np.ones(len(ranked), dtype=bool)
+        first[1:] = ranked_lots[1:] != ranked_lots[:-1]
+        heads = np.flatnonzero(first)
+        winning = ranked[heads]
+
+        if pricing == FIRST_PRICE:
+            price_row = winning
+            price = amount_col[winning]
+        else:
+            following = heads + 1
+            has_second = following < len(ranked)
+            has_second[has_second] = ~first[following[has_second]]
+            second = np.where(has_second, ranked[following.clip(max=len(ranked) - 1)], -1)
+            second_amount = np.where(has_second, amount_col[second], 0.0)
+            minimum = minimum_col[winning]
+            price_row = np.where(second_amount >= minimum, second, -1)
+            price = np.maximum(second_amount, minimum)
+
+        # a winner must be able to pay for all their wins; the most expensive win that does not fit is dropped
+        winner_idx = participant_idx[winning]
+        by_winner = np.lexsort((-price, winner_idx))
+        sorted_idx = winner_idx[by_winner]
+        spent = np.cumsum(price[by_winner])
+        group_start = np.ones(len(by_winner), dtype=bool)
+        group_start[1:] = sorted_idx[1:] != sorted_idx[:-1]
+        before_group = np.concatenate(([0.0], spent[:-1]))[group_start]
+        spent -= np.repeat(before_group, np.diff(np.append(np.flatnonzero(group_start), len(by_winner))))
+        over = np.flatnonzero(spent > balance_of[sorted_idx])
+        if not len(over):
+            break
+        _, first_over = np.unique(sorted_idx[over], return_index=True)
+        alive[winning[by_winner[over[first_over]]]] = False
+
+    winners = {}
+    for head, row in zip(winning.tolist(), price_row.tolist()):
+        lot_id = lot_ids[head]
+        winners[lot_id] = (participant_ids[head], amounts[row] if row >= 0 else lots[lot_id].minimum_bid)
+    return winners
+
+
+def _record_history(platform, lot_ids: array, participant_ids: array, amounts: list, timestamps: array) -> None:
+    """
+    Appends the bids of a cleared round to the bid ledgers of their lots, one slice per lot.
+    """
+    if not amounts:
+        return
+    lot_col = np.frombuffer(lot_ids, dtype=np.int64)
+    order = np.argsort(lot_col, kind='stable')
+    sorted_lots = lot_col[order]
+    bounds = np.flatnonzero(sorted_lots[1:] != sorted_lots[:-1]) + 1
+    participant_col = np.frombuffer(participant_ids, dtype=np.int64)[order]
+    amount_col = np.asarray(amounts, dtype=np.float64)[order]
+    timestamp_col = np.frombuffer(timestamps, dtype=np.int64)[order]
+    starts = np.concatenate(([0], bounds)).tolist()
+    ends = np.concatenate((bounds, [len(order)])).tolist()
+    for lot_id, start, end in zip(sorted_lots[starts].tolist(), starts, ends):
+        platform._ledger(lot_id).extend(participant_col[start:end].tolist(), amount_col[start:end].tolist(),
+                                        timestamp_col[start:end].tolist())
@@ -0,0 +1,221 @@
+"""
+Local TCP server exposing a TradingPlatform.
+
+The protocol is JSON lines: every request is one JSON object `{"id": ..., "op": ..., ...arguments}`
+and gets exactly one response line `{"id": ..., "ok": true, "result": ...}` or
+`{"id": ..., "ok": false, "error": "..."}`. Requests of one connection are answered in order.
+
+Usage (from the lw1 directory):
+    python -m auction.server [--host 127.0.0.1] [--port 8765] [--storage json|journal|memory]
+"""
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import argparse
+import asyncio
+import json
+
+from . import Lot, AuctionParticipant
+from .aio import AsyncTradingPlatform
+from .storage import JsonStorage, MemoryStorage
+from .journal import Journal
+
+# errors of the platform that are reported to the client instead of closing the connection
+_CLIENT_ERRORS = (ValueError, RuntimeError, TypeError, KeyError)
+
+
+class BidServer:
+    """
+    asyncio streams server that drives an AsyncTradingPlatform.
+
+    Operations:
+        - `state`, `lots`, `participants`, `current_bid`: read the platform.
+        - `add_participant` (nickname, balance), `add_lot` (name, description, minimum_bid): return the new ID.
+        - `remove_participant` (participant_id), `remove_lot` (lot_id), `timeout` (value).
+        - `place_bid` (participant_id, amount): returns the current bid after the bid.
+        - `start_auction`, `end_auction`, `pause_auction`, `resume_auction`, `restart_auction`, `abort_auction`.
+
+    Every operation, reads included, runs on the worker thread of the AsyncTradingPlatform, so
+    responses always reflect a consistent state.
+
+    Args:
+        platform (AsyncTradingPlatform): The platform to expose.
+        host (str, optional): The address to listen on. Defaults to '127.0.0.1'.
+        port (int, optional): The port to listen on, 0 for any free port. Defaults to 0.
+    """
+
+    def __init__(self, platform: AsyncTradingPlatform, host: str = '127.0.0.1', port: int = 0):
+        self._platform = platform
+        self._host = host
+        self._port = port
+        self._server = None
+        self._handlers: Dict[str, Callable[..., Any]] = {
+            'state': self._state,
+            'lots': self._lots,
+            'participants': self._participants,
+            'current_bid': self._current_bid,
+            'add_participant': self._add_participant,
+            'add_lot': self._add_lot,
+            'remove_participant': self._remove_participant,
+            'remove_lot': self._remove_lot,
+            'timeout': self._set_timeout,
+            'place_bid': self._place_bid,
+        }
+        for op in ('start_auction', 'end_auction', 'pause_auction', 'resume_auction', 'restart_auction',
+                   'abort_auction'):
+            self._handlers[op] = getattr(platform.platform, op)
+
+    def __repr__(self):
+        return f"BidServer(host='{self._host}', port={self._port})"
+
+    @property
+    def address(self) -> Tuple[str, int]:
+        """
+        Returns the (host, port) the server listens on.
+        """
+        return self._server.sockets[0].getsockname()[:2]
+
+    async def start(self) -> Tuple[str, int]:
+        """
+        Starts listening.
+
+        Returns:
+            Tuple[str, int]: The address the server listens on.
+        """
+        self._server = await asyncio.start_server(self._handle, self._host, self._port)
+        return self.address
+
+    async def serve_forever(self) -> None:
+        if self._server is None:
+            await self.start()
+        await self._server.serve_forever()
+
+    async def close(self) -> None:
+        """
+        Stops accepting connections and closes the server.
+        """
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                response = await self._respond(line)
+                writer.write(json.dumps(response, separators=(',', ':')).encode() + b'\n')
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def _respond(self, line: bytes) -> dict:
+        request_id = None
+        try:
+            request = json.loads(line)
+            if not isinstance(request, dict):
+                raise ValueError('Request must be a JSON object')
+            request_id = request.pop('id', None)
+            handler = self._handlers.get(request.pop('op', None))
+            if handler is None:
+                raise ValueError('Unknown operation')
+            result = await self._platform.call(handler, **request)
+        except json.JSONDecodeError:
+            return {'id': None, 'ok': False, 'error': 'Malformed request'}
+        except _CLIENT_ERRORS as e:
+            return {'id': request_id, 'ok': False, 'error': str(e)}
+        return {'id': request_id, 'ok': True, 'result': result}
+
+    # The handlers below run on the worker thread of the AsyncTradingPlatform.
+
+    def _state(self) -> str:
+        return self._platform.platform.state
+
+    def _lots(self) -> list:
+        return [lot._to_dict() for lot in self._platform.platform._lots.values()]
+
+    def _participants(self) -> list:
+        return [{'participant_id': p.participant_id, 'nickname': p.nickname, 'balance': p.balance}
+                for p in self._platform.platform._participants.values()]
+
+    def _current_bid(self) -> Optional[dict]:
+        platform = self._platform.platform
+        bid = platform._current_bid
+        if bid is None:
+            return None
+        return {
+            'lot': platform._current_lot._to_dict(),
+            'amount': bid.amount,
+            'participant_id': bid.participant.participant_id if bid.participant else None
+        }
+
+    def _add_participant(self, nickname: str = '', balance: float = 0) -> int:
+        participant = AuctionParticipant(nickname=nickname, balance=balance)
+        self._platform.platform.add(participant)
+        return participant.participant_id
+
+    def _add_lot(self, name: str = None, description: str = None, minimum_bid: float = 0) -> int:
+        lot = Lot(name=name, description=description, minimum_bid=minimum_bid)
+        self._platform.platform.add(lot)
+        return lot.lot_id
+
+    def _remove_participant(self, participant_id: int) -> None:
+        self._platform.platform.remove(self._find_participant(participant_id))
+
+    def _remove_lot(self, lot_id: int) -> None:
+        platform = self._platform.platform
+        lot = platform._lots.get(lot_id)
+        if lot is None:
+            raise ValueError(f"Lot with ID {lot_id} not found")
+        platform.remove(lot)
+
+    def _set_timeout(self, value: float) -> None:
+        self._platform.platform.timeout = value
+
+    def _place_bid(self, participant_id: int, amount: float) -> Optional[dict]:
+        self._platform.platform.place_bid(self._find_participant(participant_id), amount)
+        return self._current_bid()
+
+    def _find_participant(self, participant_id: int) -> AuctionParticipant:
+        participant = self._platform.platform._participants.get(participant_id)
+        if participant is None:
+            raise ValueError(f"Participant with ID {participant_id} not found")
+        return participant
+
+
+async def serve(host: str = '127.0.0.1', port: int = 8765, storage: str = 'json') -> None:
+    """
+    Runs a BidServer until it is cancelled.
+
+    Args:
+        host (str, optional): The address to listen on. Defaults to '127.0.0.1'.
+        port (int, optional): The port to listen on. Defaults to 8765.
+        storage (str, optional): 'json', 'journal' or 'memory'. Defaults to 'json'.
+    """
+    storages = {'json': JsonStorage, 'journal': Journal, 'memory': MemoryStorage}
+    async with AsyncTradingPlatform(load_on_init=storage != 'memory', storage=storages[storage]()) as platform:
+        server = BidServer(platform, host, port)
+        host, port = await server.start()
+        print(f"Listening on {host}:{port}")
+        try:
+            await server.serve_forever()
+        finally:
+            await server.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Serve a trading platform over TCP (JSON lines).')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--storage', choices=('json', 'journal', 'memory'), default='json')
+    args = parser.parse_args()
+    try:
+        asyncio.run(serve(args.host, args.port, args.storage))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
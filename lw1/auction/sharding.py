@@ -0,0 +1,479 @@
+from multiprocessing.managers import BaseManager
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+import multiprocessing
+import os
+import threading
+
+from . import Lot, AuctionParticipant
+from .auction_house import AuctionHouse
+from .storage import MemoryStorage
+from .trading_platform import TradingPlatform, BidResult
+
+ShardBid = Tuple[int, int, float]
+
+
+class BalanceCoordinator:
+    """
+    Owner of the participant balances of a sharded deployment.
+
+    Shards never charge a balance themselves: they hold funds for the lots a participant is leading
+    and turn the hold into a payment when the lot is sold. Holds are granted atomically against the
+    balance minus the holds on all the other lots, whatever shard they are on, so a participant can
+    never overspend across shards. Runs in the process of a CoordinatorManager.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._balances = {}
+        self._held = {}
+        self._totals = {}
+
+    def __repr__(self):
+        return f"BalanceCoordinator(participants={len(self._balances)}, holding={len(self._held)})"
+
+    def register(self, participant_id: int, balance: float) -> None:
+        """
+        Registers a participant, or replaces the balance of a registered one.
+        """
+        with self._lock:
+            self._balances[participant_id] = balance
+
+    def balance(self, participant_id: int) -> Optional[float]:
+        """
+        Returns the balance of a participant, or None if they are not registered.
+        """
+        return self._balances.get(participant_id)
+
+    def balances(self) -> Dict[int, float]:
+        """
+        Returns the balances of all participants by ID.
+        """
+        with self._lock:
+            return dict(self._balances)
+
+    def reserved(self, participant_id: int) -> float:
+        """
+        Returns the total amount held for a participant.
+        """
+        return self._totals.get(participant_id, 0)
+
+    def reserve(self, participant_id: int, lot_id: int, amount: float) -> bool:
+        """
+        Holds funds of a participant for a lot, replacing the previous hold for that lot.
+
+        Returns:
+            bool: True if the hold fits into the balance of the participant, otherwise False.
+        """
+        with self._lock:
+            balance = self._balances.get(participant_id)
+            if balance is None:
+                return False
+            held = self._held.setdefault(participant_id, {})
+            total = self._totals.get(participant_id, 0) - held.get(lot_id, 0) + amount
+            if total > balance:
+                if not held:
+                    del self._held[participant_id]
+                return False
+            held[lot_id] = amount
+            self._totals[participant_id] = total
+            return True
+
+    def release(self, participant_id: int, lot_id: int) -> float:
+        """
+        Releases the hold of a participant for a lot.
+
+        Returns:
+            float: The amount released, 0 if there was no hold.
+        """
+        with self._lock:
+            return self._drop(participant_id, lot_id)
+
+    def settle(self, participant_id: int, lot_id: int) -> Optional[float]:
+        """
+        Charges a participant the amount held for a lot they have won.
+
+        Returns:
+            Optional[float]: The new balance, or None if there was no hold.
+        """
+        with self._lock:
+            amount = self._drop(participant_id, lot_id)
+            if not amount:
+                return None
+            self._balances[participant_id] -= amount
+            return self._balances[participant_id]
+
+    def _drop(self, participant_id: int, lot_id: int) -> float:
+        """
+        Removes the hold of a participant for a lot and returns its amount. Must hold `_lock`.
+        """
+        held = self._held.get(participant_id)
+        if held is None or lot_id not in held:
+            return 0
+        amount = held.pop(lot_id)
+        self._totals[participant_id] -= amount
+        if not held:
+            del self._held[participant_id]
+            del self._totals[participant_id]
+        return amount
+
+
+class CoordinatorManager(BaseManager):
+    """
+    Manager process serving BalanceCoordinator objects to the shards.
+    """
+
+
+CoordinatorManager.register('BalanceCoordinator', BalanceCoordinator)
+
+
+class CoordinatedFunds:
+    """
+    FundsReservations of a shard, backed by the BalanceCoordinator.
+
+    Has the interface of FundsReservations, so an AuctionHouse uses it unchanged; every call
+    is a round trip to the coordinator process.
+
+    Args:
+        coordinator (BalanceCoordinator): Proxy of the coordinator.
+    """
+
+    def __init__(self, coordinator):
+        self._coordinator = coordinator
+
+    def __repr__(self):
+        return f"CoordinatedFunds(coordinator={self._coordinator})"
+
+    def reserve(self, participant: AuctionParticipant, lot_id: int, amount: int) -> bool:
+        return self._coordinator.reserve(participant.participant_id, lot_id, amount)
+
+    def release(self, participant: AuctionParticipant, lot_id: int) -> None:
+        self._coordinator.release(participant.participant_id, lot_id)
+
+    def settle(self, lot_id: int, sell: Callable[[], Optional[AuctionParticipant]]) -> Optional[AuctionParticipant]:
+        # the reservations check the coordinator's balance, which its `settle` charges and releases at once
+        winner = sell()
+        if winner is not None:
+            balance = self._coordinator.settle(winner.participant_id, lot_id)
+            if balance is not None:
+                # the shard charged its own copy of the balance, the coordinator's one is authoritative
+                winner._balance = balance
+        return winner
+
+    def reserved(self, participant: AuctionParticipant) -> int:
+        return self._coordinator.reserved(participant.participant_id)
+
+
+class _Shard:
+    """
+    The auctions of one shard: a TradingPlatform holding the lots of the shard and an AuctionHouse
+    that auctions them concurrently. Runs in the worker process and serves the commands of the pipe.
+    """
+
+    def __init__(self, coordinator, timeout: float):
+        self._platform = TradingPlatform(storage=MemoryStorage(keep_state=False))
+        self._platform.timeout = timeout
+        self._house = AuctionHouse(self._platform, CoordinatedFunds(coordinator))
+
+    def serve(self, connection) -> None:
+        """
+        Runs the commands received from the pipe until `stop`. A command that fails, or a malformed one,
+        is answered with the error and the shard keeps serving.
+        """
+        while True:
+            message = connection.recv()
+            try:
+                op, args = message
+                if op == 'stop':
+                    self._house.end_all()
+                    connection.send((True, None))
+                    return
+                command = getattr(self, op, None) if isinstance(op, str) and not op.startswith('_') else None
+                if command is None:
+                    raise ValueError(f"Unknown shard command {op!r}")
+                result = command(*args)
+            except (ValueError, RuntimeError, KeyError) as e:
+                connection.send((False, e))
+                continue
+            except Exception as e:
+                # any other error is sent by its repr, as the exception itself may not be picklable
+                connection.send((False, RuntimeError(f"Shard command {message!r} failed: {e!r}")))
+                continue
+            connection.send((True, result))
+
+    def add_participants(self, participants_data: List[dict]) -> None:
+        platform = self._platform
+        platform.add([AuctionParticipant._from_dict(data, platform._sold_lots) for data in participants_data])
+
+    def add_lots(self, lots_data: List[dict]) -> None:
+        self._platform.add([Lot._from_dict(data) for data in lots_data])
+
+    def start_auction(self, lot_id: Optional[int]) -> int:
+        return self._house.start_auction(lot_id).lot_id
+
+    def start_all(self) -> List[int]:
+        return [self._house.start_auction(lot_id).lot_id for lot_id in list(self._platform._lots)]
+
+    def place_bid(self, lot_id: int, participant_id: int, amount: float) -> None:
+        self._house.place_bid(lot_id, self._participant(participant_id), amount)
+
+    def place_bids(self, bids: List[ShardBid]) -> List[Tuple[bool, Optional[str]]]:
+        results = [None] * len(bids)
+        by_lot = {}
+        for index, (lot_id, participant_id, amount) in enumerate(bids):
+            participant = self._platform._participants.get(participant_id)
+            if participant is None:
+                results[index] = (False, f"Participant with ID {participant_id} not found")
+                continue
+            by_lot.setdefault(lot_id, []).append((index, participant, amount))
+        for lot_id, lot_bids in by_lot.items():
+            try:
+                lot_results = self._house.place_bids(lot_id, [(participant, amount) for _, participant, amount in lot_bids])
+            except ValueError as e:
+                lot_results = [BidResult(None, None, False, str(e))] * len(lot_bids)
+            for (index, _, _), result in zip(lot_bids, lot_results):
+                results[index] = (result.accepted, result.reason)
+        return results
+
+    def current_bid(self, lot_id: int) -> Tuple[float, Optional[int]]:
+        bid = self._house.current_bid(lot_id)
+        return bid.amount, bid.participant.participant_id if bid.participant else None
+
+    def end_auction(self, lot_id: int) -> Optional[int]:
+        winner = self._house.end_auction(lot_id)
+        return winner.participant_id if winner else None
+
+    def end_all(self) -> Dict[int, Optional[int]]:
+        return {lot_id: winner.participant_id if winner else None
+                for lot_id, winner in self._house.end_all().items()}
+
+    def _participant(self, participant_id: int) -> AuctionParticipant:
+        participant = self._platform._participants.get(participant_id)
+        if participant is None:
+            raise ValueError(f"Participant with ID {participant_id} not found")
+        return participant
+
+
+def _run_shard(coordinator, connection, timeout: float) -> None:
+    _Shard(coordinator, timeout).serve(connection)
+
+
+class ShardedAuction:
+    """
+    Auctions lots on several worker processes, so that bidding is not limited by one GIL.
+
+    Lots are partitioned across the shards by ID (`lot_id % shards`); every shard is a process
+    running its own TradingPlatform and AuctionHouse for its lots, with a copy of the participants.
+    Balances are owned by a BalanceCoordinator in a manager process: a shard asks it to hold the
+    funds of the leading bidder of a lot and to charge them when the lot is sold, so holds on
+    different shards never add up to more than the balance.
+
+    Shards work in parallel when they are given work together: `place_bids`, `start_all` and `end_all`
+    send every shard its part before waiting for the replies. Every accepted bid batch of a lot costs
+    one round trip to the coordinator, so batching bids is what lets throughput grow with the shards.
+
+    Args:
+        shards (int, optional): Number of worker processes. Defaults to the number of CPUs.
+        timeout (float, optional): Auction timeout of every lot in seconds. Defaults to 60.
+        start_method (str, optional): multiprocessing start method. Defaults to 'spawn', which does not
+            copy the scheduler threads of the parent process.
+    """
+
+    def __init__(self, shards: Optional[int] = None, timeout: float = 60, start_method: str = 'spawn'):
+        shards = shards if shards is not None else os.cpu_count() or 1
+        if shards <= 0:
+            raise ValueError('Number of shards must be positive.')
+        context = multiprocessing.get_context(start_method)
+        self._manager = CoordinatorManager(ctx=context)
+        self._manager.start()
+        self._coordinator = self._manager.BalanceCoordinator()
+        self._connections = []
+        self._locks = []
+        self._processes = []
+        for index in range(shards):
+            connection, child_connection = context.Pipe()
+            process = context.Process(target=_run_shard, args=(self._coordinator, child_connection, timeout),
+                                      name=f'auction-shard-{index}', daemon=True)
+            process.start()
+            child_connection.close()
+            self._connections.append(connection)
+            self._locks.append(threading.Lock())
+            self._processes.append(process)
+
+    def __repr__(self):
+        return f"ShardedAuction(shards={len(self._processes)})"
+
+    def __enter__(self) -> 'ShardedAuction':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    @property
+    def shards(self) -> int:
+        return len(self._processes)
+
+    @property
+    def coordinator(self) -> BalanceCoordinator:
+        """
+        Returns the proxy of the balance coordinator.
+        """
+        return self._coordinator
+
+    def shard_of(self, lot_id: int) -> int:
+        """
+        Returns the index of the shard a lot belongs to.
+        """
+        return lot_id % len(self._processes)
+
+    def add(self, *args: Union[AuctionParticipant, Lot, List[Union[AuctionParticipant, Lot]]]) -> None:
+        """
+        Registers participants with the coordinator and every shard, and hands lots to their shards.
+
+        Args:
+            *args (Union[AuctionParticipant, Lot, List[Union[AuctionParticipant, Lot]]]): Participants or lots to add.
+        """
+        participants = []
+        lots = {}
+        for item in args:
+            for single in item if isinstance(item, list) else [item]:
+                if isinstance(single, AuctionParticipant):
+                    participants.append(single._to_dict())
+                elif isinstance(single, Lot):
+                    lots.setdefault(self.shard_of(single.lot_id), []).append(single._to_dict())
+                else:
+                    raise ValueError(f"Item must be an AuctionParticipant or a Lot, not {type(single).__name__}")
+        for data in participants:
+            self._coordinator.register(data['participant_id'], data['balance'])
+        if participants:
+            self._scatter({shard: ('add_participants', (participants,)) for shard in range(self.shards)})
+        if lots:
+            self._scatter({shard: ('add_lots', (lots_data,)) for shard, lots_data in lots.items()})
+
+    def start_auction(self, lot_id: int) -> None:
+        """
+        Starts the auction of a lot on its shard.
+        """
+        self._call(self.shard_of(lot_id), 'start_auction', lot_id)
+
+    def start_all(self) -> List[int]:
+        """
+        Starts the auctions of all pending lots.
+
+        Returns:
+            List[int]: The IDs of the lots whose auction was started.
+        """
+        started = self._scatter({shard: ('start_all', ()) for shard in range(self.shards)})
+        return [lot_id for lot_ids in started.values() for lot_id in lot_ids]
+
+    def place_bid(self, lot_id: int, participant_id: int, amount: float) -> None:
+        """
+        Places a bid on an active lot.
+
+        Raises:
+            ValueError: If the bid is rejected.
+        """
+        self._call(self.shard_of(lot_id), 'place_bid', lot_id, participant_id, amount)
+
+    def place_bids(self, bids: Iterable[ShardBid]) -> List[BidResult]:
+        """
+        Places a batch of bids, processed by all the shards involved in parallel.
+
+        The bids of every lot are resolved like `AuctionHouse.place_bids`.
+
+        Args:
+            bids (Iterable[ShardBid]): `(lot_id, participant_id, amount)` triples.
+
+        Returns:
+            List[BidResult]: The result of every bid in the order of the batch, with participant IDs
+                in place of the participants.
+        """
+        bids = list(bids)
+        positions = {}
+        for index, bid in enumerate(bids):
+            shard_bids = positions.setdefault(self.shard_of(bid[0]), ([], []))
+            shard_bids[0].append(index)
+            shard_bids[1].append(bid)
+        replies = self._scatter({shard: ('place_bids', (shard_bids,)) for shard, (_, shard_bids) in positions.items()})
+        results = [None] * len(bids)
+        for shard, (indexes, _) in positions.items():
+            for index, (accepted, reason) in zip(indexes, replies[shard]):
+                _, participant_id, amount = bids[index]
+                results[index] = BidResult(participant_id, amount, accepted, reason)
+        return results
+
+    def current_bid(self, lot_id: int) -> Tuple[float, Optional[int]]:
+        """
+        Returns the amount and the bidder ID of the current bid on an active lot.
+        """
+        return self._call(self.shard_of(lot_id), 'current_bid', lot_id)
+
+    def end_auction(self, lot_id: int) -> Optional[int]:
+        """
+        Ends the auction of an active lot.
+
+        Returns:
+            Optional[int]: The ID of the winner, or None if the lot received no bids.
+        """
+        return self._call(self.shard_of(lot_id), 'end_auction', lot_id)
+
+    def end_all(self) -> Dict[int, Optional[int]]:
+        """
+        Ends the auctions of all active lots.
+
+        Returns:
+            Dict[int, Optional[int]]: The winner IDs by lot ID.
+        """
+        winners = {}
+        for shard_winners in self._scatter({shard: ('end_all', ()) for shard in range(self.shards)}).values():
+            winners.update(shard_winners)
+        return winners
+
+    def balance(self, participant_id: int) -> Optional[float]:
+        """
+        Returns the balance of a participant as recorded by the coordinator.
+        """
+        return self._coordinator.balance(participant_id)
+
+    def close(self) -> None:
+        """
+        Ends the active auctions, stops the shards and the coordinator.
+        """
+        if not self._processes:
+            return
+        self._scatter({shard: ('stop', ()) for shard in range(self.shards)})
+        for process in self._processes:
+            process.join()
+        for connection in self._connections:
+            connection.close()
+        self._processes = []
+        self._manager.shutdown()
+
+    def _call(self, shard: int, op: str, *args):
+        return self._scatter({shard: (op, args)})[shard]
+
+    def _scatter(self, requests: Dict[int, Tuple[str, tuple]]) -> dict:
+        """
+        Sends every shard its request, then collects the replies.
+
+        Raises:
+            ValueError, RuntimeError, KeyError: The first error raised by a shard, after all replies are read.
+        """
+        shards = sorted(requests)
+        for shard in shards:
+            # locks are taken in shard order, so concurrent scatters cannot deadlock
+            self._locks[shard].acquire()
+        try:
+            for shard in shards:
+                self._connections[shard].send(requests[shard])
+            replies = {shard: self._connections[shard].recv() for shard in shards}
+        finally:
+            for shard in shards:
+                self._locks[shard].release()
+        results = {}
+        for shard in shards:
+            ok, result = replies[shard]
+            if not ok:
+                raise result
+            results[shard] = result
+        return results
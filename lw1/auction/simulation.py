@@ -0,0 +1,167 @@
+from collections import namedtuple
+from typing import Iterable, Iterator, List, Optional, Tuple, Union
+
+import random
+import time
+
+from . import AuctionParticipant
+from .virtual_clock import VirtualClock
+
+SimulationReport = namedtuple('SimulationReport', ['auctions', 'sold', 'unsold', 'bids_accepted', 'bids_rejected',
+                                                   'simulated_time', 'wall_time'])
+SimulationReport.__doc__ = """Outcome of a Simulation run. Times are in seconds."""
+
+BidEvent = Tuple[float, Union[AuctionParticipant, int], Optional[float]]
+
+
+class Simulation:
+    """
+    Runs auctions of a TradingPlatform on a VirtualClock, as fast as the CPU allows.
+
+    The lots are auctioned one after another, each starting as soon as the previous one closes.
+    A bid stream is a time-ordered iterable of `(time, participant, amount)` events, where the time
+    is in seconds since the start of the run, the participant is an AuctionParticipant or its ID,
+    and an amount of None outbids the current bid by the platform's bid increment. Whenever the
+    next event is later than the deadline of the current lot, the clock jumps to the deadline and
+    the lot is closed by its timer, exactly as it would be in real time.
+
+    Args:
+        platform (TradingPlatform): The platform to drive. It must have been created with a VirtualClock.
+
+    Raises:
+        ValueError: If the platform does not run on a VirtualClock.
+    """
+
+    def __init__(self, platform):
+        if not isinstance(platform._clock, VirtualClock):
+            raise ValueError('Simulation requires a platform created with a VirtualClock.')
+        self._platform = platform
+        self._clock = platform._clock
+
+    def __repr__(self):
+        return f"Simulation(platform={self._platform}, clock={self._clock})"
+
+    def run(self, bids: Iterable[BidEvent], max_auctions: Optional[int] = None) -> SimulationReport:
+        """
+        Replays a bid stream against the pending lots of the platform.
+
+        The run stops when the stream is exhausted and the lot being auctioned has closed, or when
+        `max_auctions` lots have been auctioned. Lots that got no bids are relisted by the platform.
+
+        Args:
+            bids (Iterable[BidEvent]): The bid stream, ordered by time.
+            max_auctions (int, optional): Maximum number of lots to auction. Defaults to None (no limit).
+
+        Returns:
+            SimulationReport: Counters of the run.
+        """
+        platform = self._platform
+        clock = self._clock
+        start = clock.now()
+        wall_start = time.perf_counter()
+        counts = {'auctions': 0, 'sold': 0, 'unsold': 0, 'accepted': 0, 'rejected': 0}
+
+        for offset, participant, amount in bids:
+            at = start + offset
+            if not self._reach(at, counts, max_auctions):
+                if self._exhausted(counts, max_auctions):
+                    break
+                counts['rejected'] += 1
+                continue
+            if isinstance(participant, int):
+                participant = platform._participants.get(participant)
+            if participant is None:
+                counts['rejected'] += 1
+                continue
+            if amount is None:
+                amount = self._next_amount()
+            try:
+                platform.place_bid(participant, amount)
+                counts['accepted'] += 1
+            except ValueError:
+                counts['rejected'] += 1
+
+        if platform.state == 'accepting_bids':
+            while platform.state == 'accepting_bids' and clock.run_next():
+                pass
+            self._record_outcome(counts)
+
+        return SimulationReport(counts['auctions'], counts['sold'], counts['unsold'], counts['accepted'],
+                                counts['rejected'], clock.now() - start, time.perf_counter() - wall_start)
+
+    def _reach(self, at: float, counts: dict, max_auctions: Optional[int]) -> bool:
+        """
+        Advances the clock to `at`, closing and starting lots on the way. Lots held back by their
+        start time or relisting backoff are started when their time comes.
+
+        Returns:
+            bool: False if no lot is open for bidding at `at`.
+        """
+        platform = self._platform
+        clock = self._clock
+        while True:
+            if platform.state == 'preparing_for_auction':
+                if self._exhausted(counts, max_auctions):
+                    return False
+                start_at = platform._schedule.next_start(clock.now())
+                if start_at is None or start_at > at:
+                    clock.run_until(at)
+                    return False
+                clock.run_until(start_at)
+                platform.start_auction()
+                counts['auctions'] += 1
+            deadline = clock.now() + platform._timer.remaining
+            if deadline > at:
+                clock.run_until(at)
+                return True
+            clock.run_until(deadline)
+            self._record_outcome(counts)
+
+    def _exhausted(self, counts: dict, max_auctions: Optional[int]) -> bool:
+        """
+        Returns whether no more lots will be auctioned by the run.
+        """
+        platform = self._platform
+        if platform.state != 'preparing_for_auction':
+            return False
+        if max_auctions is not None and counts['auctions'] >= max_auctions:
+            return True
+        return platform._schedule.next_start(self._clock.now()) is None
+
+    def _record_outcome(self, counts: dict) -> None:
+        if self._platform.state != 'preparing_for_auction':
+            return
+        if self._platform._winner is not None:
+            counts['sold'] += 1
+        else:
+            counts['unsold'] += 1
+
+    def _next_amount(self) -> float:
+        platform = self._platform
+        bid = platform._current_bid
+        if bid.participant is None:
+            return platform._current_lot.minimum_bid or platform.bid_increment
+        return bid.amount + platform.bid_increment
+
+
+def synthetic_bids(participants: List[AuctionParticipant], rate: float, duration: float,
+                   seed: Optional[int] = None) -> Iterator[BidEvent]:
+    """
+    Generates a Poisson stream of outbidding events.
+
+    Args:
+        participants (List[AuctionParticipant]): The participants to draw the bidders from.
+        rate (float): Average number of bids per second.
+        duration (float): Length of the stream in seconds.
+        seed (int, optional): Seed of the random generator, for reproducible streams. Defaults to None.
+
+    Yields:
+        BidEvent: `(time, participant, None)` events in time order.
+    """
+    if rate <= 0:
+        raise ValueError('rate must be positive.')
+    rng = random.Random(seed)
+    at = rng.expovariate(rate)
+    while at < duration:
+        yield at, rng.choice(participants), None
+        at += rng.expovariate(rate)
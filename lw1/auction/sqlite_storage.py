@@ -0,0 +1,195 @@
+from typing import List, Tuple, Any, Optional
+
+import sqlite3
+
+from .utils import SQLITE_FILE, STATE_SCHEMA
+from .lot import Lot
+from .auction_participant import AuctionParticipant
+from .storage import Storage
+
+# balance and minimum_bid are declared without a type so that SQLite keeps ints and floats as they were given
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value
+);
+CREATE TABLE IF NOT EXISTS participants (
+    participant_id INTEGER PRIMARY KEY,
+    nickname TEXT,
+    balance
+);
+CREATE TABLE IF NOT EXISTS lots (
+    lot_id INTEGER PRIMARY KEY,
+    name TEXT,
+    description TEXT,
+    minimum_bid,
+    position INTEGER NOT NULL,
+    owner_id INTEGER
+);
+CREATE INDEX IF NOT EXISTS lots_position ON lots (position);
+CREATE INDEX IF NOT EXISTS lots_owner ON lots (owner_id);
+CREATE TABLE IF NOT EXISTS schedule (
+    lot_id INTEGER PRIMARY KEY,
+    priority INTEGER NOT NULL,
+    start_at REAL
+);
+"""
+
+_INSERT_LOT = ("INSERT OR REPLACE INTO lots (lot_id, name, description, minimum_bid, position, owner_id) "
+               "VALUES (?, ?, ?, ?, (SELECT COALESCE(MAX(position), 0) + 1 FROM lots), ?)")
+
+
+class SqliteStorage(Storage):
+    """
+    Storage that keeps the state in an SQLite database.
+
+    Participants, lots and sold lots live in indexed tables and every save touches only the rows
+    affected by the recorded changes, inside a single transaction. Pending lots are the rows without
+    an owner; sold lots are the rows owned by a participant. Both keep their order in `position`.
+    The priorities and start times of the pending lots that have one are kept in `schedule`.
+
+    Args:
+        path (str, optional): The database file. Defaults to SQLITE_FILE.
+    """
+
+    def __init__(self, path: str = SQLITE_FILE):
+        self._path = path
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.executescript(_SCHEMA)
+        self._synced = False
+
+    def __repr__(self):
+        return f"SqliteStorage(path='{self._path}')"
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    def save(self, platform, changes: List[Tuple[str, Any]]) -> None:
+        """
+        Applies the recorded changes to the database in one transaction.
+
+        The first save of a session that did not load the database replaces all rows with the current state.
+        """
+        with self._conn:
+            if not self._synced:
+                self._write_all(platform)
+                self._synced = True
+            else:
+                for op, data in changes:
+                    self._apply(op, data)
+            self._conn.executemany('INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)', [
+                ('participants_counter', AuctionParticipant.participants_counter()),
+                ('lot_counter', Lot.lot_counter())
+            ])
+
+    def needs_state(self, changes: List[Tuple[str, Any]]) -> bool:
+        """
+        Returns True only for the first save of a session that did not load the database.
+        """
+        return not self._synced
+
+    def _write_all(self, platform) -> None:
+        """
+        Replaces the content of the database with the full state of the platform.
+        """
+        conn = self._conn
+        conn.execute('DELETE FROM participants')
+        conn.execute('DELETE FROM lots')
+        conn.execute('DELETE FROM schedule')
+        conn.executemany('INSERT INTO schedule (lot_id, priority, start_at) VALUES (?, ?, ?)',
+                         platform._schedule_data())
+        conn.execute('INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)', ('timeout', platform._timeout))
+        conn.executemany('INSERT INTO participants (participant_id, nickname, balance) VALUES (?, ?, ?)',
+                         ((p.participant_id, p._nickname, p.balance) for p in platform._participants.values()))
+        owners = {lot_id: p.participant_id for p in platform._participants.values() for lot_id in p.lot_ids}
+        conn.executemany('INSERT INTO lots VALUES (?, ?, ?, ?, ?, ?)',
+                         ((lot.lot_id, lot.name, lot.description, lot.minimum_bid, position, None)
+                          for position, lot in enumerate(platform._lots.values())))
+        conn.executemany('INSERT OR REPLACE INTO lots VALUES (?, ?, ?, ?, ?, ?)',
+                         ((lot.lot_id, lot.name, lot.description, lot.minimum_bid, position, owners.get(lot.lot_id))
+                          for position, lot in enumerate(platform._sold_lots.values(), start=len(platform._lots))))
+
+    def _apply(self, op: str, data: Any) -> None:
+        """
+        Applies a single recorded mutation to the database.
+        """
+        conn = self._conn
+        if op == 'add_participant':
+            conn.execute('INSERT OR REPLACE INTO participants (participant_id, nickname, balance) VALUES (?, ?, ?)',
+                         (data['participant_id'], data['nickname'], data['balance']))
+        elif op == 'remove_participant':
+            conn.execute('DELETE FROM lots WHERE owner_id = ?', (data,))
+            conn.execute('DELETE FROM participants WHERE participant_id = ?', (data,))
+        elif op == 'add_lot':
+            conn.execute(_INSERT_LOT, (data['lot_id'], data['name'], data['description'], data['minimum_bid'], None))
+            # a priority kept by the lot is recorded right after
+            conn.execute('DELETE FROM schedule WHERE lot_id = ?', (data['lot_id'],))
+        elif op in ('remove_lot', 'take_lot'):
+            conn.execute('DELETE FROM lots WHERE lot_id = ? AND owner_id IS NULL', (data,))
+            conn.execute('DELETE FROM schedule WHERE lot_id = ?', (data,))
+        elif op == 'schedule':
+            conn.execute('UPDATE lots SET position = (SELECT MAX(position) + 1 FROM lots) '
+                         'WHERE lot_id = ? AND owner_id IS NULL', (data['lot_id'],))
+            if data['priority'] or data['start_at'] is not None:
+                conn.execute('INSERT OR REPLACE INTO schedule (lot_id, priority, start_at) VALUES (?, ?, ?)',
+                             (data['lot_id'], data['priority'], data['start_at']))
+            else:
+                conn.execute('DELETE FROM schedule WHERE lot_id = ?', (data['lot_id'],))
+        elif op == 'sell':
+            lot = data['lot']
+            conn.execute(_INSERT_LOT, (lot['lot_id'], lot['name'], lot['description'], lot['minimum_bid'],
+                                       data['participant_id']))
+            conn.execute('UPDATE participants SET balance = ? WHERE participant_id = ?',
+                         (data['balance'], data['participant_id']))
+        elif op == 'timeout':
+            conn.execute('INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)', ('timeout', data))
+        else:
+            raise ValueError(f"Unknown storage operation: {op}")
+
+    def load(self) -> Optional[dict]:
+        """
+        Reads the state from the database.
+
+        Returns:
+            Optional[dict]: The state data, or None if the database is empty.
+        """
+        self._synced = True
+        meta = dict(self._conn.execute('SELECT key, value FROM meta'))
+        if not meta:
+            return None
+
+        participants = []
+        owned = {}
+        for participant_id, nickname, balance in self._conn.execute(
+                'SELECT participant_id, nickname, balance FROM participants ORDER BY participant_id'):
+            lot_ids = []
+            owned[participant_id] = lot_ids
+            participants.append({'nickname': nickname, 'balance': balance,
+                                 'participant_id': participant_id, 'lot_ids': lot_ids})
+
+        lots = []
+        sold_lots = []
+        for lot_id, name, description, minimum_bid, owner_id in self._conn.execute(
+                'SELECT lot_id, name, description, minimum_bid, owner_id FROM lots ORDER BY position'):
+            lot = {'name': name, 'description': description, 'minimum_bid': minimum_bid, 'lot_id': lot_id}
+            if owner_id is None:
+                lots.append(lot)
+            else:
+                sold_lots.append(lot)
+                owned[owner_id].append(lot_id)
+
+        return {
+            'schema': STATE_SCHEMA,
+            'participants_counter': meta.get('participants_counter', 0),
+            'lot_counter': meta.get('lot_counter', 0),
+            'timeout': meta.get('timeout', 60),
+            'participants': participants,
+            'lots': lots,
+            'sold_lots': sold_lots,
+            'schedule': [list(row) for row in self._conn.execute('SELECT lot_id, priority, start_at FROM schedule')]
+        }
+
+    def close(self) -> None:
+        self._conn.close()
@@ -0,0 +1,175 @@
+from typing import List, Tuple, Any, Optional
+
+import json
+import os
+
+from .utils import STATE_FILE, STATE_SCHEMA
+
+
+def migrate_state_data(state_data: dict) -> dict:
+    """
+    Converts state data of an older layout to the current STATE_SCHEMA in place.
+
+    Files without a `schema` entry embed the full data of the owned lots in every participant.
+    They are converted to the normalized layout, where participants reference their lots by ID
+    and the lot data is kept only once, under `sold_lots`. Files written before lots could be scheduled
+    get an empty `schedule`.
+
+    Args:
+        state_data (dict): The loaded state data.
+
+    Returns:
+        dict: The same dictionary in the current layout.
+
+    Raises:
+        ValueError: If the state data was written by a newer version.
+    """
+    schema = state_data.get('schema', 1)
+    if schema > STATE_SCHEMA:
+        raise ValueError(f"Unsupported state schema {schema}")
+    if schema < 2:
+        sold_lots = state_data.setdefault('sold_lots', [])
+        known_ids = {lot['lot_id'] for lot in sold_lots}
+        for participant in state_data.get('participants', []):
+            owned = participant.pop('lots', [])
+            participant['lot_ids'] = [lot['lot_id'] for lot in owned]
+            for lot in owned:
+                if lot['lot_id'] not in known_ids:
+                    known_ids.add(lot['lot_id'])
+                    sold_lots.append(lot)
+    state_data.setdefault('schedule', [])
+    state_data['schema'] = STATE_SCHEMA
+    return state_data
+
+
+class Storage:
+    """
+    Base class for the trading platform state storages.
+
+    A storage receives the mutations recorded by the platform since the previous save and decides
+    how to persist them: some storages rewrite the full state, others apply only the changes.
+    """
+
+    @property
+    def path(self) -> str:
+        """
+        Returns the path of the file the state is stored in.
+        """
+        raise NotImplementedError
+
+    def save(self, platform, changes: List[Tuple[str, Any]]) -> None:
+        """
+        Persists the state of the platform.
+
+        Args:
+            platform (TradingPlatform): The platform whose state is saved.
+            changes (List[Tuple[str, Any]]): The mutations recorded since the previous save.
+        """
+        raise NotImplementedError
+
+    def needs_state(self, changes: List[Tuple[str, Any]]) -> bool:
+        """
+        Tells whether the next save reads the state of the platform rather than only the changes.
+
+        Storages that rewrite the full state always need it; incremental storages need it only for a full
+        snapshot. Wrappers that copy the state before handing it over use this to skip the copy.
+
+        Args:
+            changes (List[Tuple[str, Any]]): The mutations the next save receives.
+
+        Returns:
+            bool: True if `save` reads the platform.
+        """
+        return True
+
+    def load(self) -> Optional[dict]:
+        """
+        Loads the stored state.
+
+        Returns:
+            Optional[dict]: The state data in the format produced by `TradingPlatform._state_data`,
+                or None if there is no stored state.
+        """
+        raise NotImplementedError
+
+    def flush(self) -> None:
+        """
+        Makes sure every save made so far is written. Storages that write synchronously do nothing.
+        """
+
+    def close(self) -> None:
+        """
+        Releases the resources held by the storage.
+        """
+
+
+class JsonStorage(Storage):
+    """
+    Storage that rewrites the whole state as a single JSON document on every save.
+
+    The document is written to a temporary file first and then atomically moved over the state file,
+    so a crash in the middle of a save never leaves a truncated state file behind.
+
+    Args:
+        path (str, optional): The state file. Defaults to STATE_FILE.
+    """
+
+    def __init__(self, path: str = STATE_FILE):
+        self._path = path
+
+    def __repr__(self):
+        return f"JsonStorage(path='{self._path}')"
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    def save(self, platform, changes: List[Tuple[str, Any]]) -> None:
+        tmp_path = self._path + '.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump(platform._state_data(), f, indent=4)
+        os.replace(tmp_path, self._path)
+
+    def load(self) -> Optional[dict]:
+        try:
+            with open(self._path, 'r') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+
+
+class MemoryStorage(Storage):
+    """
+    Storage that keeps the state in memory, for tests and simulations that must not touch the disk.
+
+    Args:
+        keep_state (bool, optional): Whether every save captures the full state so that `load` can return it.
+            Simulations that never reload can pass False to make saves free. Defaults to True.
+    """
+
+    def __init__(self, keep_state: bool = True):
+        self._keep_state = keep_state
+        self._state_data = None
+        self._saves = 0
+
+    def __repr__(self):
+        return f"MemoryStorage(keep_state={self._keep_state}, saves={self._saves})"
+
+    @property
+    def path(self) -> str:
+        return '<memory>'
+
+    @property
+    def saves(self) -> int:
+        """
+        Returns the number of saves made so far.
+        """
+        return self._saves
+
+    def save(self, platform, changes: List[Tuple[str, Any]]) -> None:
+        self._saves += 1
+        if self._keep_state:
+            self._state_data = platform._state_data()
+
+    def load(self) -> Optional[dict]:
+        return self._state_data
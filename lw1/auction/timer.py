@@ -1,28 +1,216 @@
-from typing import Callable, Any
+from typing import Callable, Any, Optional
 
+import heapq
+import itertools
 import threading
+import time
+import traceback
+
+
+class Deadline:
+    """
+    A handle of a callback scheduled on a Scheduler.
+
+    Args:
+        deadline (float): The monotonic time at which the callback is due.
+        callback (Callable[..., Any]): The function to call when the deadline is reached.
+    """
+
+    def __init__(self, deadline: float, callback: Callable[..., Any]):
+        self.deadline = deadline
+        self.callback = callback
+        self.active = True
+        self._entry = None
+        self._done = threading.Event()
+
+    def __repr__(self):
+        return f"Deadline(deadline={self.deadline}, callback={self.callback}, active={self.active})"
+
+    def join(self, timeout: Optional[float] = None) -> bool:
+        """
+        Waits until the callback has been executed or the deadline has been canceled.
+
+        Args:
+            timeout (float, optional): Maximum time to wait in seconds. Defaults to None (wait forever).
+
+        Returns:
+            bool: True if the deadline is finished, False if the wait timed out.
+        """
+        return self._done.wait(timeout)
+
+
+class Scheduler:
+    """
+    Runs the callbacks of many timers on a single background thread.
+
+    Deadlines are kept in a heap. Moving a deadline later (the usual case when a new bid resets the
+    auction timer) only updates the handle in O(1); the heap entry is re-queued lazily when it surfaces.
+    Canceled deadlines are dropped lazily as well.
+    """
+    _default = None
+    _default_lock = threading.Lock()
+
+    def __init__(self):
+        self._heap = []
+        self._counter = itertools.count()
+        self._cond = threading.Condition()
+        self._thread = None
+
+    def __repr__(self):
+        return f"Scheduler(pending={len(self._heap)})"
+
+    @classmethod
+    def default(cls) -> 'Scheduler':
+        """
+        Returns the scheduler shared by all timers that do not specify their own.
+        """
+        with cls._default_lock:
+            if cls._default is None:
+                cls._default = cls()
+            return cls._default
+
+    @staticmethod
+    def now() -> float:
+        """
+        Returns the current monotonic time of the scheduler.
+        """
+        return time.monotonic()
+
+    def schedule(self, timeout: float, callback: Callable[..., Any]) -> Deadline:
+        """
+        Schedules a callback to be executed after the given timeout.
+
+        Args:
+            timeout (float): The timeout in seconds.
+            callback (Callable[..., Any]): The function to call.
+
+        Returns:
+            Deadline: The handle of the scheduled callback.
+        """
+        handle = Deadline(self.now() + timeout, callback)
+        with self._cond:
+            self._push(handle)
+            self._ensure_thread()
+        return handle
+
+    def reschedule(self, handle: Deadline, timeout: float) -> bool:
+        """
+        Moves an active deadline to `timeout` seconds from now.
+
+        Args:
+            handle (Deadline): The handle returned by `schedule`.
+            timeout (float): The new timeout in seconds.
+
+        Returns:
+            bool: True if the deadline was moved, False if it has already fired or was canceled.
+        """
+        deadline = self.now() + timeout
+        with self._cond:
+            if not handle.active:
+                return False
+            handle.deadline = deadline
+            if deadline < handle._entry[0]:
+                self._push(handle)
+        return True
+
+    def cancel(self, handle: Deadline) -> None:
+        """
+        Cancels a deadline. Does nothing if it has already fired.
+
+        Args:
+            handle (Deadline): The handle returned by `schedule`.
+        """
+        with self._cond:
+            if handle.active:
+                handle.active = False
+                handle._done.set()
+
+    def remaining(self, handle: Deadline) -> Optional[float]:
+        """
+        Returns the time left until the deadline fires.
+
+        Args:
+            handle (Deadline): The handle returned by `schedule`.
+
+        Returns:
+            Optional[float]: The remaining time in seconds, or None if the deadline is no longer active.
+        """
+        if not handle.active:
+            return None
+        return max(0.0, handle.deadline - self.now())
+
+    def _push(self, handle: Deadline) -> None:
+        handle._entry = [handle.deadline, next(self._counter), handle]
+        heapq.heappush(self._heap, handle._entry)
+        self._cond.notify()
+
+    def _ensure_thread(self) -> None:
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name='auction-scheduler', daemon=True)
+            self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                handle = self._next_due()
+            try:
+                handle.callback()
+            except Exception:
+                traceback.print_exc()
+            finally:
+                handle._done.set()
+
+    def _next_due(self) -> Deadline:
+        """
+        Waits for the next due deadline, removes it from the heap and returns it. Must hold `_cond`.
+        """
+        while True:
+            if not self._heap:
+                self._cond.wait()
+                continue
+            entry = self._heap[0]
+            key, _, handle = entry
+            if not handle.active or entry is not handle._entry:
+                heapq.heappop(self._heap)
+                continue
+            if handle.deadline > key:
+                heapq.heappop(self._heap)
+                self._push(handle)
+                continue
+            delay = key - self.now()
+            if delay > 0:
+                self._cond.wait(delay)
+                continue
+            heapq.heappop(self._heap)
+            handle.active = False
+            return handle
 
 
 class Timer:
     """
     A class for managing a timer that executes a callback after a specified timeout.
 
+    Timers do not own a thread: their callbacks run on a shared Scheduler.
+
     Args:
         timeout (float): The timeout in seconds before the callback is executed.
         callback (Callable[..., Any]): The function to call when the timer expires.
+        scheduler (Scheduler, optional): The scheduler to run on. Defaults to Scheduler.default().
     """
 
-    def __init__(self, timeout: float, callback: Callable[..., Any]):
+    def __init__(self, timeout: float, callback: Callable[..., Any], scheduler: Scheduler = None):
         """
         Initializes the Timer with a timeout and a callback function.
 
         Args:
             timeout (float): The timeout in seconds.
             callback (Callable[..., Any]): The function to call when the timer expires.
+            scheduler (Scheduler, optional): The scheduler to run on. Defaults to Scheduler.default().
         """
         self._timer = None
         self._timeout = timeout
         self._callback = callback
+        self._scheduler = scheduler if scheduler is not None else Scheduler.default()
 
     def __repr__(self):
         """
@@ -35,17 +223,25 @@ class Timer:
 
     def start(self):
         """
-        Starts the timer. If a timer is already running, it is canceled first.
+        Starts the timer. If the timer is already running, its deadline is moved instead of creating a new one.
         """
-        if self._timer:
-            self._timer.cancel()
-        self._timer = threading.Timer(self._timeout, self._callback)
-        self._timer.start()
+        if self._timer and self._scheduler.reschedule(self._timer, self._timeout):
+            return
+        self._timer = self._scheduler.schedule(self._timeout, self._callback)
 
     def cancel(self):
         """
         Cancels the timer if it is running.
         """
         if self._timer:
-            self._timer.cancel()
+            self._scheduler.cancel(self._timer)
             self._timer = None
+
+    @property
+    def remaining(self) -> Optional[float]:
+        """
+        Returns the time left before the callback is executed, or None if the timer is not running.
+        """
+        if not self._timer:
+            return None
+        return self._scheduler.remaining(self._timer)
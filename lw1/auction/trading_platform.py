@@ -1,14 +1,29 @@
 from transitions import Machine
-from typing import List, Union
+from collections import namedtuple
+from contextlib import contextmanager
+from typing import List, Union, Tuple, Any, Optional, Iterable
 
 import threading
 import json
+import time
 
-from .utils import STATE_FILE, ensure_state, save
-from . import Timer
+from .utils import ensure_state, save, STATE_SCHEMA
+from . import Timer, Scheduler
 from . import Lot
 from . import AuctionParticipant
 from . import Bid
+from .storage import Storage, JsonStorage, migrate_state_data
+from .bid_ledger import BidLedger
+from .proxy_bidding import ProxyBook
+from .bid_log import BidLog
+from .events import EventBus, Event, Subscription, DROP_OLDEST
+from .analytics import AuctionAnalytics, AuctionStats
+from .lot_scheduler import LotScheduler
+from .platform_snapshot import PlatformSnapshot, build_snapshot, apply_changes, bid_view
+
+BidResult = namedtuple('BidResult', ['participant', 'amount', 'accepted', 'reason'])
+BidResult.__doc__ = """The result of a bid placed through `TradingPlatform.place_bids`. `reason` is None for accepted bids."""
+
 
 class StateMachine:
     """
@@ -34,6 +49,7 @@ class StateMachine:
         self.machine.add_transition(trigger='on_resume_auction', source='auction_paused', dest='accepting_bids')
         self.machine.add_transition(trigger='on_restart_auction', source='auction_paused', dest='accepting_bids')
         self.machine.add_transition(trigger='on_abort_auction', source='auction_paused', dest='preparing_for_auction')
+        self.machine.add_transition(trigger='on_recover_auction', source='preparing_for_auction', dest='auction_paused')
 
 
 class TradingPlatform(StateMachine):
@@ -41,33 +57,66 @@ class TradingPlatform(StateMachine):
     A class representing a trading platform for managing auctions, inheriting from StateMachine.
 
     Attributes:
-        _participants (List[AuctionParticipant]): List of auction participants.
-        _lots (List[Lot]): List of lots available for auction.
-        _sold_lots (List[Lot]): List of sold lots.
+        _participants (Dict[int, AuctionParticipant]): Auction participants by ID.
+        _lots (Dict[int, Lot]): Lots available for auction by ID, in the order they were added or last scheduled.
+        _schedule (LotScheduler): Order the pending lots will be auctioned in.
+        _sold_lots (Dict[int, Lot]): Sold lots by ID, in the order they were sold.
         _current_bid (Bid): The current bid in the auction.
         _current_lot (Lot): The current lot being auctioned.
         _timer (Timer): Timer for managing auction timeouts.
         _timeout (int): Timeout duration for the auction.
-        _lock (threading.Lock): Lock for thread-safe operations.
+        _lock (threading.RLock): Lock for thread-safe operations, held by every saving method.
+        _storage (Storage): Storage used to persist the state.
+        _changes (List[Tuple[str, Any]]): Mutations recorded since the last save.
+        _bid_history (Dict[int, BidLedger]): Bid ledgers by lot ID.
+        _dispatch (Callable): If set, timer callbacks are passed to it instead of being run on the timer thread.
+        _proxy_book (ProxyBook): Maximum bids registered on the current lot.
+        _bid_increment (int): The step proxy bids outbid each other by.
+        _batch_depth (int): Number of nested `batch` blocks being executed; saves are deferred while positive.
+        _bid_log (BidLog): Durable log of the bids on the current lot, or None.
+        _clock (Scheduler): Scheduler of the auction timers and source of the bid timestamps.
+        _events (EventBus): Bus the auction events are published to.
+        _analytics (AuctionAnalytics): Running aggregates of the auctions closed since the platform was created.
+        _snapshot (PlatformSnapshot): The last published snapshot, or None until `snapshot` is first called.
     """
 
-    def __init__(self, load_on_init: bool = False) -> None:
+    def __init__(self, load_on_init: bool = False, storage: Storage = None, bid_log: BidLog = None,
+                 clock: Scheduler = None) -> None:
         """
         Initializes the trading platform and optionally loads the state from a file.
 
         Args:
             load_on_init (bool): Whether to load the state on initialization.
+            storage (Storage, optional): Storage to persist the state with. Defaults to JsonStorage,
+                which rewrites the whole STATE_FILE on every save.
+            bid_log (BidLog, optional): Log that makes accepted bids durable. If given, a lot that was
+                being auctioned when the process stopped is restored on load in the 'auction_paused' state.
+            clock (Scheduler, optional): Scheduler the auction timers run on and bids are timestamped with,
+                e.g. a VirtualClock for simulations. Defaults to Scheduler.default().
         """
         super().__init__()
-        self._participants = []
-        self._lots = []
-        self._sold_lots = []
+        self._participants = {}
+        self._lots = {}
+        self._schedule = LotScheduler()
+        self._sold_lots = {}
         self._current_bid = None
         self._current_lot = None
         self._winner = None
         self._timer = None
         self._timeout = 60
-        self._lock = threading.Lock()
+        self._lock = threading.RLock()
+        self._storage = storage if storage is not None else JsonStorage()
+        self._changes = []
+        self._bid_history = {}
+        self._dispatch = None
+        self._proxy_book = None
+        self._bid_increment = 1
+        self._batch_depth = 0
+        self._bid_log = bid_log
+        self._clock = clock if clock is not None else Scheduler.default()
+        self._events = EventBus()
+        self._analytics = AuctionAnalytics()
+        self._snapshot = None
 
         if load_on_init:
             self._load_state()
@@ -82,11 +131,16 @@ class TradingPlatform(StateMachine):
             raise ValueError("No lots available to start the auction")
         if not self._participants:
             raise ValueError("No participants available to start the auction")
+        lot = self._take_lot()
         self.on_start_auction()
-        self._current_lot = self._lots.pop(0)
+        self._current_lot = lot
+        if self._bid_log is not None:
+            self._bid_log.sync(self._bid_log.start_lot(self._current_lot._to_dict()))
         self._current_bid = Bid(self._current_lot)
-        self._timer = Timer(timeout=self._timeout, callback=self._timer_callback)
+        self._proxy_book = None
+        self._timer = Timer(timeout=self._timeout, callback=self._timer_expired, scheduler=self._clock)
         self._timer.start()
+        self._emit('lot_started', self._current_lot.lot_id)
 
     @ensure_state('accepting_bids', 'auction_paused')
     @save
@@ -95,37 +149,101 @@ class TradingPlatform(StateMachine):
         Stops the auction by transitioning to the 'preparing_for_auction' state and processing the current bid.
         """
         self.on_end_auction()
-        if self._current_bid and self._current_bid.participant:
-            self._current_bid.participant.lots.append(self._current_lot)
-            self._current_bid.participant.balance -= self._current_bid.amount
-            self._sold_lots.append(self._current_lot)
-            self._winner = self._current_bid.participant
-        else:
-            self._lots.append(self._current_lot)
-            self._winner = None
+        self._winner = self._settle(self._current_lot, self._current_bid)
         self._current_bid = None
         self._current_lot = None
+        self._proxy_book = None
         if self._timer:
             self._timer.cancel()
 
+    def _take_lot(self, lot_id: int = None) -> Lot:
+        """
+        Removes a lot from the pending lots so that it can be auctioned.
+
+        Args:
+            lot_id (int, optional): The ID of the lot to take. Defaults to None, which takes the next lot
+                of the schedule.
+
+        Returns:
+            Lot: The lot taken.
+
+        Raises:
+            RuntimeError: If called inside a batch, which cannot roll back a started auction.
+            ValueError: If there is no such pending lot, or no lot is ready to be auctioned.
+        """
+        if self._batch_depth:
+            raise RuntimeError("Cannot start an auction inside a batch")
+        if lot_id is None:
+            if not self._lots:
+                raise ValueError("No lots available to start the auction")
+            lot_id = self._schedule.pop(self._clock.now())
+            if lot_id is None:
+                raise ValueError("No lots are ready to be auctioned yet")
+        else:
+            self._schedule.take(lot_id)
+        lot = self._lots.pop(lot_id, None)
+        if lot is None:
+            raise ValueError(f"Lot with ID {lot_id} not found")
+        self._record('take_lot', lot.lot_id)
+        return lot
+
+    def _settle(self, lot: Lot, bid: Bid) -> AuctionParticipant:
+        """
+        Transfers an auctioned lot to the highest bidder, or returns it to the pending lots if there were no bids.
+
+        Args:
+            lot (Lot): The auctioned lot.
+            bid (Bid): The final bid on the lot.
+
+        Returns:
+            AuctionParticipant: The winner, or None if the lot was not sold.
+        """
+        if bid and bid.participant:
+            winner = bid.participant
+            winner.balance -= bid.amount
+            self._sold_lots[lot.lot_id] = lot
+            winner._add_lot(lot)
+            self._record('sell', {'lot': lot._to_dict(),
+                                  'participant_id': winner.participant_id,
+                                  'balance': winner.balance})
+            self._analytics.record_sale(winner.participant_id, bid.amount)
+            self._schedule.discard(lot.lot_id)
+            self._emit('lot_sold', lot.lot_id, winner.participant_id, bid.amount)
+            return winner
+        self._lots[lot.lot_id] = lot
+        self._schedule.relist(lot.lot_id, self._clock.now())
+        self._record('add_lot', lot._to_dict())
+        self._record_schedule(lot.lot_id)
+        self._analytics.record_unsold()
+        self._emit('lot_unsold', lot.lot_id)
+        return None
+
     @ensure_state('accepting_bids')
     def pause_auction(self) -> None:
         self.on_pause_auction()
         if self._timer:
             self._timer.cancel()
+        self._publish()
+        self._emit('paused', self._current_lot.lot_id)
 
     @ensure_state('auction_paused')
     def resume_auction(self) -> None:
         self.on_resume_auction()
-        self._timer = Timer(timeout=self._timeout, callback=self._timer_callback)
+        self._timer = Timer(timeout=self._timeout, callback=self._timer_expired, scheduler=self._clock)
         self._timer.start()
+        self._publish()
 
     @ensure_state('auction_paused')
     def restart_auction(self) -> None:
         self.on_restart_auction()
+        if self._bid_log is not None:
+            self._bid_log.sync(self._bid_log.restart_lot(self._current_lot.lot_id))
         self._current_bid = Bid(self._current_lot)
-        self._timer = Timer(timeout=self._timeout, callback=self._timer_callback)
+        self._proxy_book = None
+        self._timer = Timer(timeout=self._timeout, callback=self._timer_expired, scheduler=self._clock)
         self._timer.start()
+        self._publish()
+        self._emit('lot_started', self._current_lot.lot_id)
 
     @ensure_state('auction_paused')
     @save
@@ -134,6 +252,7 @@ class TradingPlatform(StateMachine):
         self.add(self._current_lot)
         self._current_bid = None
         self._current_lot = None
+        self._proxy_book = None
         if self._timer:
             self._timer.cancel()
 
@@ -163,13 +282,18 @@ class TradingPlatform(StateMachine):
             item (Union[AuctionParticipant, Lot]): Participant or lot to add.
         """
         if isinstance(item, AuctionParticipant):
-            if item not in self._participants:
-                self._participants.append(item)
+            if item.participant_id not in self._participants:
+                self._participants[item.participant_id] = item
+                item._bind_lots(self._sold_lots)
+                self._record('add_participant', item._to_dict())
         elif isinstance(item, Lot):
-            if item in self._sold_lots:
+            if item.lot_id in self._sold_lots:
                 raise ValueError(f"Lot '{item.name}' is already sold and cannot be added again")
-            if item not in self._lots:
-                self._lots.append(item)
+            if item.lot_id not in self._lots:
+                self._lots[item.lot_id] = item
+                self._schedule.push(item.lot_id)
+                self._record('add_lot', item._to_dict())
+                self._record_schedule(item.lot_id)
         else:
             raise TypeError(f"Unsupported type: {type(item)}. Expected AuctionParticipant or Lot")
 
@@ -182,60 +306,261 @@ class TradingPlatform(StateMachine):
         Args:
             *args (Union[AuctionParticipant, Lot, List[Union[AuctionParticipant, Lot]]]): Participants or lots to remove.
         """
-        for arg in args:
+        self._remove_items(args)
+
+    def _remove_items(self, items: Iterable[Union[AuctionParticipant, Lot, List]]) -> None:
+        """
+        Removes participants, lots and nested iterables of them, without saving.
+        """
+        for arg in items:
             if isinstance(arg, (list, tuple, set)):
-                self.remove(*arg)
+                self._remove_items(arg)
             elif isinstance(arg, AuctionParticipant):
-                if arg not in self._participants:
+                participant = self._participants.pop(arg.participant_id, None)
+                if participant is None:
                     raise ValueError(f"Participant '{arg}' not found")
-                for lot in arg.lots:
-                    if lot in self._sold_lots:
-                        self._sold_lots.remove(lot)
-                self._participants.remove(arg)
+                participant._unbind_lots()
+                for lot_id in participant.lot_ids:
+                    self._sold_lots.pop(lot_id, None)
+                self._record('remove_participant', arg.participant_id)
             elif isinstance(arg, Lot):
-                if arg not in self._lots:
+                if self._lots.pop(arg.lot_id, None) is None:
                     raise ValueError(f"Lot '{arg}' not found")
-                self._lots.remove(arg)
+                self._schedule.discard(arg.lot_id)
+                self._record('remove_lot', arg.lot_id)
             else:
                 raise TypeError(
                     f"Unsupported type: {type(arg)}. Expected AuctionParticipant, Lot, or an iterable of these types.")
 
+    @contextmanager
+    def batch(self):
+        """
+        Groups adds and removes into one transaction with a single save.
+
+        Inside the block `add` and `remove` only change the in-memory indexes. If the block raises,
+        every change made in it is rolled back and nothing is saved; otherwise the state is saved once
+        when the outermost block exits. Auctions cannot be started inside the block, as the rollback
+        does not cover the state of the auction, so the platform stays in 'preparing_for_auction'.
+
+        Yields:
+            TradingPlatform: The platform itself.
+
+        Raises:
+            RuntimeError: If the auction is not in the 'preparing_for_auction' state.
+
+        Example:
+            with platform.batch():
+                for lot in catalog:
+                    platform.add(lot)
+        """
+        with self._lock:
+            if self.state != 'preparing_for_auction':
+                raise RuntimeError(f"Cannot execute batch in state '{self.state}' (requires preparing_for_auction)")
+            saved = (self._participants.copy(), self._lots.copy(), self._schedule.copy(), self._sold_lots.copy(),
+                     len(self._changes))
+            self._batch_depth += 1
+            try:
+                yield self
+            except BaseException:
+                self._rollback(*saved)
+                raise
+            finally:
+                self._batch_depth -= 1
+            if not self._batch_depth:
+                self._save_state()
+
+    def _rollback(self, participants: dict, lots: dict, schedule: LotScheduler, sold_lots: dict,
+                  changes_count: int) -> None:
+        """
+        Restores the indexes saved at the start of a batch and drops the changes recorded since.
+        """
+        for participant in self._participants.values():
+            if participant.participant_id not in participants:
+                participant._unbind_lots()
+        self._participants = participants
+        self._lots = lots
+        self._schedule = schedule
+        # participants resolve their lots through this very mapping, so it is restored in place
+        self._sold_lots.clear()
+        self._sold_lots.update(sold_lots)
+        for participant in participants.values():
+            participant._bind_lots(self._sold_lots)
+        del self._changes[changes_count:]
+
+    def _timer_expired(self) -> None:
+        """
+        Callback function for the timer, runs `_timer_callback` directly or posts it to the dispatcher.
+        """
+        if self._dispatch is not None:
+            self._dispatch(self._timer_callback)
+        else:
+            self._timer_callback()
+
     @ensure_state('accepting_bids')
     def _timer_callback(self) -> None:
         """
-        Callback function for the timer, stops the auction when the timer expires.
+        Stops the auction when the timer expires, unless a bid has moved the deadline in the meantime.
         """
-        self.end_auction()
+        with self._lock:
+            if self._timer is not None and self._timer.remaining:
+                return
+            self.end_auction()
 
     @property
     def participants(self) -> List[AuctionParticipant]:
         """
         Returns the list of auction participants.
 
+        The list is a copy taken at the time of the call; use `snapshot` for a view consistent
+        with the other collections and the current auction.
+
         Returns:
             List[AuctionParticipant]: List of auction participants.
         """
-        return self._participants
+        return list(self._participants.values())
 
     @property
     def lots(self) -> List[Lot]:
         """
         Returns the list of lots available for auction.
 
+        The list is a copy taken at the time of the call; use `snapshot` for a view consistent
+        with the other collections and the current auction.
+
         Returns:
             List[Lot]: List of lots available for auction.
         """
-        return self._lots
+        return list(self._lots.values())
 
     @property
     def sold_lots(self) -> List[Lot]:
         """
         Returns the list of sold lots.
 
+        The list is a copy taken at the time of the call; use `snapshot` for a view consistent
+        with the other collections and the current auction.
+
         Returns:
             List[Lot]: List of sold lots.
         """
-        return self._sold_lots
+        return list(self._sold_lots.values())
+
+    def get_participant(self, participant_id: int) -> Optional[AuctionParticipant]:
+        """
+        Returns the participant with the given ID.
+
+        Args:
+            participant_id (int): The ID of the participant.
+
+        Returns:
+            Optional[AuctionParticipant]: The participant, or None if there is no such participant.
+        """
+        return self._participants.get(participant_id)
+
+    def get_lot(self, lot_id: int) -> Optional[Lot]:
+        """
+        Returns the lot with the given ID, whether it is pending, being auctioned or sold.
+
+        Args:
+            lot_id (int): The ID of the lot.
+
+        Returns:
+            Optional[Lot]: The lot, or None if there is no such lot.
+        """
+        lot = self._lots.get(lot_id)
+        if lot is None:
+            lot = self._sold_lots.get(lot_id)
+        if lot is None and self._current_lot is not None and self._current_lot.lot_id == lot_id:
+            lot = self._current_lot
+        return lot
+
+    def bid_history(self, lot_id: int) -> BidLedger:
+        """
+        Returns the history of the bids placed on a lot.
+
+        Args:
+            lot_id (int): The ID of the lot.
+
+        Returns:
+            BidLedger: The bid ledger of the lot (empty if no bids were placed).
+        """
+        ledger = self._bid_history.get(lot_id)
+        return ledger if ledger is not None else BidLedger(lot_id)
+
+    def session_stats(self, top: int = 10) -> AuctionStats:
+        """
+        Returns the revenue, the sold and unsold counts and the top spenders of the auctions closed in this session.
+
+        The aggregates are maintained as the auctions close, so the call does not scan the lots or the
+        participants and is cheap enough for frequent polling. They cover only the auctions closed since the
+        platform was created, not the state it loaded: the storage keeps the lots sold, not the prices they
+        were sold at. Removing a participant does not undo the sales of the session, but the participant is
+        no longer listed among the top spenders.
+
+        Args:
+            top (int, optional): Number of top spenders to include. Defaults to 10.
+
+        Returns:
+            AuctionStats: The aggregates.
+        """
+        with self._lock:
+            return self._analytics.stats(top, self._participants)
+
+    def snapshot(self) -> PlatformSnapshot:
+        """
+        Returns an immutable, consistent view of the participants, the lots and the current auction.
+
+        Every saved change, state transition and accepted bid publishes a new snapshot version. The new
+        version shares every entry the change did not touch with the previous one, so publishing costs
+        O(log n) per changed entry, and reading takes no lock: a reporting thread can hold and iterate
+        a snapshot for as long as it likes while the auction goes on. Only the first call builds the
+        snapshot under the lock; until then nothing is published. Changes made to participant objects
+        directly, such as setting a balance, are seen once the platform next changes that participant.
+
+        Returns:
+            PlatformSnapshot: The latest snapshot.
+        """
+        snapshot = self._snapshot
+        if snapshot is None:
+            with self._lock:
+                if self._snapshot is None:
+                    self._rebuild_snapshot()
+                snapshot = self._snapshot
+        return snapshot
+
+    def _rebuild_snapshot(self) -> None:
+        """
+        Publishes a snapshot built from scratch. Must hold `_lock`.
+        """
+        version = self._snapshot.version + 1 if self._snapshot is not None else 1
+        self._snapshot = build_snapshot(version, self.state, self._participants, self._lots, self._sold_lots,
+                                        self._current_lot, self._current_bid)
+
+    def _publish(self, changes: List[Tuple[str, Any]] = None) -> None:
+        """
+        Publishes the next snapshot version, if snapshots are in use.
+
+        Args:
+            changes (List[Tuple[str, Any]], optional): Changes recorded since the last published version.
+                Defaults to None, for changes of the state or the current bid only.
+        """
+        if self._snapshot is None:
+            return
+        with self._lock:
+            snapshot = self._snapshot
+            if changes:
+                snapshot = apply_changes(snapshot, changes, self._participants, self._lots, self._sold_lots)
+            self._snapshot = PlatformSnapshot(snapshot.version + 1, self.state, snapshot.participants, snapshot.lots,
+                                              snapshot.sold_lots, self._current_lot, bid_view(self._current_bid))
+
+    def _ledger(self, lot_id: int) -> BidLedger:
+        """
+        Returns the bid ledger of a lot, creating it on first use.
+        """
+        ledger = self._bid_history.get(lot_id)
+        if ledger is None:
+            ledger = self._bid_history.setdefault(lot_id, BidLedger(lot_id))
+        return ledger
 
     @property
     @ensure_state('preparing_for_auction')
@@ -259,6 +584,125 @@ class TradingPlatform(StateMachine):
             value (int): Timeout duration for the auction.
         """
         self._timeout = value
+        self._record('timeout', value)
+
+    @property
+    def bid_increment(self) -> int:
+        """
+        Returns the step proxy bids outbid each other by.
+
+        Returns:
+            int: The bid increment.
+        """
+        return self._bid_increment
+
+    @bid_increment.setter
+    @ensure_state('preparing_for_auction')
+    def bid_increment(self, value: int) -> None:
+        """
+        Sets the step proxy bids outbid each other by.
+
+        Args:
+            value (int): The bid increment.
+        """
+        if value <= 0:
+            raise ValueError('Bid increment must be positive.')
+        self._bid_increment = value
+
+    @property
+    def relist_backoff(self) -> float:
+        """
+        Returns the delay in seconds before a lot that closed without bids is auctioned again.
+
+        Returns:
+            float: The delay of the first relisting; it doubles with every further relisting of the lot.
+        """
+        return self._schedule.relist_backoff
+
+    @relist_backoff.setter
+    @ensure_state('preparing_for_auction')
+    def relist_backoff(self, value: float) -> None:
+        """
+        Sets the delay before a lot that closed without bids is auctioned again.
+
+        Args:
+            value (float): The delay of the first relisting in seconds, 0 to relist immediately.
+        """
+        if value < 0:
+            raise ValueError('Relisting backoff must be non-negative.')
+        self._schedule.relist_backoff = value
+
+    @save
+    def schedule(self, lot: Lot, priority: int = 0, start_at: Optional[float] = None) -> None:
+        """
+        Sets when a pending lot is auctioned.
+
+        Lots ready to be auctioned are taken by decreasing priority and, for equal priorities,
+        in the order they were scheduled; `start_at` keeps a lot back until the given time.
+        The lot moves to the end of the pending lots, so that their saved order stays the order
+        they were scheduled in. The start time is saved as wall-clock time, so a lot held back
+        across a restart is released at the same moment.
+
+        Args:
+            lot (Lot): The pending lot.
+            priority (int, optional): Higher priorities are auctioned first. Defaults to 0.
+            start_at (float, optional): Time of the platform clock before which the lot is not auctioned.
+                Defaults to None (ready immediately).
+
+        Raises:
+            ValueError: If the lot is not pending.
+        """
+        if lot.lot_id not in self._lots:
+            raise ValueError(f"Lot with ID {lot.lot_id} not found")
+        self._lots[lot.lot_id] = self._lots.pop(lot.lot_id)
+        self._schedule.push(lot.lot_id, priority, start_at)
+        self._record_schedule(lot.lot_id, always=True)
+
+    def _record_schedule(self, lot_id: int, always: bool = False) -> None:
+        """
+        Records the schedule of a pending lot, by default only if it has a priority or a start time.
+        """
+        priority, start_at = self._schedule.get(lot_id)
+        if always or priority or start_at is not None:
+            self._record('schedule', {'lot_id': lot_id, 'priority': priority,
+                                      'start_at': self._wall_time(start_at)})
+
+    def _wall_time(self, clock_time: Optional[float]) -> Optional[float]:
+        """
+        Converts a time of the platform clock to wall-clock time (seconds since the epoch).
+        """
+        return clock_time - self._clock.now() + time.time() if clock_time is not None else None
+
+    def _schedule_data(self) -> List[list]:
+        """
+        Returns `[lot_id, priority, start_at]` of the pending lots with a priority or a start time,
+        start times in wall-clock time.
+        """
+        return [[lot_id, priority, self._wall_time(start_at)]
+                for lot_id, priority, start_at in self._schedule.schedules()]
+
+    def _reset_schedule(self, schedule_data: List[list]) -> None:
+        """
+        Schedules the pending lots in their order, with the schedules saved by `_schedule_data`.
+        """
+        offset = self._clock.now() - time.time()
+        self._schedule.reset(self._lots, {lot_id: (priority, start_at + offset if start_at is not None else None)
+                                          for lot_id, priority, start_at in schedule_data})
+
+    def lineup(self, count: int = 10) -> List[Lot]:
+        """
+        Returns the lots that will be auctioned next, in order, without scanning the catalog.
+
+        Lots ready now come first, followed by the lots waiting for their start time.
+
+        Args:
+            count (int, optional): Maximum number of lots to return. Defaults to 10.
+
+        Returns:
+            List[Lot]: The upcoming lots.
+        """
+        with self._lock:
+            return [self._lots[lot_id] for lot_id in self._schedule.lineup(self._clock.now(), count)]
 
     @property
     @ensure_state('accepting_bids')
@@ -306,81 +750,353 @@ class TradingPlatform(StateMachine):
             RuntimeError: If no current bid is available (auction not active).
             ValueError: If the bid amount is not higher than the current bid or exceeds balance.
         """
-        if not self._current_bid:
-            raise RuntimeError("No current bid available. Auction may not be active.")
-        if amount <= self._current_bid.amount:
-            raise ValueError("Bid amount must be greater than the current bid")
+        with self._lock:
+            if not self._current_bid:
+                raise RuntimeError("No current bid available. Auction may not be active.")
+            reason = self._bid_rejection(participant, amount, self._current_bid.amount)
+            if reason:
+                raise ValueError(reason)
+            self._current_bid.increase_bid(amount, participant)
+            seq = self._log_bid(participant, amount)
+            seq = self._apply_proxies() or seq
+            self._timer.start()
+            self._publish()
+        self._sync_bids(seq)
+
+    @ensure_state('accepting_bids')
+    def place_bids(self, bids: Iterable[Tuple[AuctionParticipant, int]]) -> List[BidResult]:
+        """
+        Places a batch of bids on the current lot, in order, under a single lock acquisition.
+
+        Bids that are not higher than the best bid so far, are below the minimum bid or exceed
+        the participant's balance are rejected without raising. Only the highest accepted bid is
+        applied to the current bid and the timer is reset once for the whole batch; every accepted
+        bid is still recorded in the bid history.
+
+        Args:
+            bids (Iterable[Tuple[AuctionParticipant, int]]): Pairs of participant and bid amount.
+
+        Returns:
+            List[BidResult]: The result of every bid, in the order of the batch.
+
+        Raises:
+            RuntimeError: If no current bid is available (auction not active).
+            TypeError, ValueError: If an item of the batch is malformed; no bid of the batch is then placed.
+        """
+        results = []
+        accepted = []
+        seq = 0
+        with self._lock:
+            if not self._current_bid:
+                raise RuntimeError("No current bid available. Auction may not be active.")
+            best_amount = self._current_bid.amount
+            # the whole batch is checked before anything is logged, so a malformed item leaves no trace
+            for participant, amount in bids:
+                reason = self._bid_rejection(participant, amount, best_amount)
+                if not reason:
+                    accepted.append(len(results))
+                    best_amount = amount
+                results.append(BidResult(participant, amount, reason is None, reason))
+            for index in accepted:
+                seq = self._log_bid(results[index].participant, results[index].amount)
+            if accepted:
+                best = results[accepted[-1]]
+                self._current_bid.increase_bid(best.amount, best.participant)
+                seq = self._apply_proxies() or seq
+                self._timer.start()
+                self._publish()
+        self._sync_bids(seq)
+        return results
+
+    @ensure_state('accepting_bids')
+    def place_proxy_bid(self, participant: AuctionParticipant, maximum: int) -> None:
+        """
+        Registers the maximum amount a participant is willing to pay for the current lot.
+
+        The platform then bids on behalf of the participant: competing proxies are resolved at once
+        and only the resulting price change is applied, so a bidding war between proxies costs a single
+        bid and a single timer reset.
+
+        Args:
+            participant (AuctionParticipant): The participant.
+            maximum (int): The maximum bid amount.
+
+        Raises:
+            RuntimeError: If no current bid is available (auction not active).
+            ValueError: If the maximum is not higher than the current bid or the participant's previous maximum,
+                is below the minimum bid or exceeds the participant's balance.
+        """
+        with self._lock:
+            if not self._current_bid:
+                raise RuntimeError("No current bid available. Auction may not be active.")
+            reason = self._bid_rejection(participant, maximum, self._current_bid.amount)
+            if reason:
+                raise ValueError(reason)
+            if self._proxy_book is None:
+                self._proxy_book = ProxyBook(self._bid_increment)
+            book = self._proxy_book
+            previous = book.maximum(participant)
+            book.submit(participant, maximum)
+            try:
+                seq = self._apply_proxies()
+            except ValueError:
+                # a proxy whose bid cannot be applied must not stay in the book
+                book.withdraw(participant)
+                if previous is not None:
+                    book.submit(participant, previous)
+                raise
+            if seq is not None:
+                self._timer.start()
+                self._publish()
+        self._sync_bids(seq or 0)
+
+    def _apply_proxies(self) -> Optional[int]:
+        """
+        Applies the bid produced by the proxies to the current bid. Must hold `_lock`.
+
+        Proxies whose price no longer fits into their participant's balance are withdrawn.
+
+        Returns:
+            Optional[int]: The bid log sequence number of the proxy bid placed (0 without a bid log),
+                or None if no proxy bid was placed and the current bid stands.
+        """
+        book = self._proxy_book
+        if book is None:
+            return None
+        bid = self._current_bid
+        while True:
+            resolved = book.resolve(bid.amount, bid.participant, self._current_lot.minimum_bid)
+            if resolved is None:
+                return None
+            participant, price = resolved
+            if price <= participant.balance:
+                break
+            book.withdraw(participant)
+        bid.increase_bid(price, participant)
+        return self._log_bid(participant, price)
+
+    def _log_bid(self, participant: AuctionParticipant, amount: int) -> int:
+        """
+        Records an accepted bid on the current lot in the bid history and the bid log. Must hold `_lock`.
+
+        Returns:
+            int: The bid log sequence number to sync, or 0 without a bid log.
+        """
+        lot_id = self._current_lot.lot_id
+        self._ledger(lot_id).append(participant.participant_id, amount, self._timestamp())
+        self._emit('bid_accepted', lot_id, participant.participant_id, amount)
+        if self._bid_log is None:
+            return 0
+        return self._bid_log.append_bid(lot_id, participant.participant_id, amount)
+
+    def subscribe(self, maxsize: int = 1000, policy: str = DROP_OLDEST, kinds: Iterable[str] = None) -> Subscription:
+        """
+        Subscribes to the auction events: `bid_accepted`, `lot_started`, `lot_sold`, `lot_unsold` and `paused`.
+
+        The events are queued in a bounded Subscription, which is read without taking the platform lock.
+
+        Args:
+            maxsize (int, optional): Maximum number of queued events. Defaults to 1000.
+            policy (str, optional): What to do when the reader falls behind: DROP_OLDEST drops the oldest event,
+                COALESCE also keeps only the latest undelivered bid of every lot. Defaults to DROP_OLDEST.
+            kinds (Iterable[str], optional): Event kinds to receive. Defaults to None (all kinds).
+
+        Returns:
+            Subscription: The queue of events.
+        """
+        return self._events.subscribe(maxsize, policy, kinds)
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        """
+        Stops delivering events to a subscription and closes it.
+        """
+        self._events.unsubscribe(subscription)
+
+    def _emit(self, kind: str, lot_id: int, participant_id: int = None, amount: float = None) -> None:
+        """
+        Publishes an auction event, if anybody is subscribed.
+        """
+        if self._events.active:
+            self._events.publish(Event(kind, lot_id, participant_id, amount, self._clock.now()))
+
+    def _timestamp(self) -> int:
+        """
+        Returns the current time of the platform clock in nanoseconds, for the bid history.
+        """
+        return int(self._clock.now() * 1e9)
+
+    def _sync_bids(self, seq: int) -> None:
+        """
+        Waits until the logged bids up to `seq` are durable. Called without holding `_lock`,
+        so that concurrent bidders share an fsync.
+        """
+        if seq and self._bid_log is not None:
+            self._bid_log.sync(seq)
+
+    def _bid_rejection(self, participant: AuctionParticipant, amount: int, current_amount: int) -> Optional[str]:
+        """
+        Validates a bid on the current lot.
+
+        Args:
+            participant (AuctionParticipant): The participant placing the bid.
+            amount (int): The bid amount.
+            current_amount (int): The amount the bid has to exceed.
+
+        Returns:
+            Optional[str]: The reason the bid is rejected, or None if it is valid.
+        """
+        if amount <= current_amount:
+            return "Bid amount must be greater than the current bid"
         if amount > participant.balance:
-            raise ValueError("Bid amount exceeds participant balance")
+            return "Bid amount exceeds participant balance"
         if amount < self._current_lot.minimum_bid:
-            raise ValueError("")
-        self._current_bid.increase_bid(amount, participant)
-        if self._timer:
-            self._timer.cancel()
-        self._timer = Timer(timeout=self._timeout, callback=self.end_auction)
-        self._timer.start()
+            return "Bid amount is less than the minimum bid"
+        return None
 
-    def _save_state(self) -> None:
+    def _record(self, op: str, data: Any) -> None:
         """
-        Saves the current state of the auction to a file.
+        Records a mutation so that the storage can persist only what has changed.
+
+        Args:
+            op (str): The name of the operation.
+            data (Any): JSON-serializable payload of the operation.
+        """
+        self._changes.append((op, data))
+
+    def _state_data(self) -> dict:
+        """
+        Returns the full state of the auction as a JSON-serializable dictionary.
         """
-        state_data = {
+        return {
+            'schema': STATE_SCHEMA,
             'participants_counter': AuctionParticipant._participants_counter,
             'lot_counter': Lot._lot_counter,
             'timeout': self._timeout,
-            'participants': [p._to_dict() for p in self._participants],
-            'lots': [lot._to_dict() for lot in self._lots],
-            'sold_lots': [lot._to_dict() for lot in self._sold_lots]
+            'participants': [p._to_dict() for p in self._participants.values()],
+            'lots': [lot._to_dict() for lot in self._lots.values()],
+            'sold_lots': [lot._to_dict() for lot in self._sold_lots.values()],
+            'schedule': self._schedule_data()
         }
-        with open(STATE_FILE, 'w') as f:
-            json.dump(state_data, f, indent=4)
+
+    def _save_state(self) -> None:
+        """
+        Saves the current state of the auction to the storage.
+        """
+        changes, self._changes = self._changes, []
+        self._storage.save(self, changes)
+        self._publish(changes)
+        if self._bid_log is not None and self._current_lot is None and not self._bid_log.empty:
+            # the outcome of the logged lot must be on disk before its bids are dropped
+            self._storage.flush()
+            self._bid_log.reset()
+
+    def flush(self) -> None:
+        """
+        Writes the state saved so far to the storage, waiting for deferred writes to complete.
+        """
+        self._storage.flush()
 
     def _load_state(self) -> None:
         """
-        Loads the state of the auction from a file.
+        Loads the state of the auction from the storage.
         """
+        source = self._storage.path
         try:
-            with open(STATE_FILE, 'r') as f:
-                state_data = json.load(f)
+            state_data = self._storage.load()
+            if state_data is None:
+                raise FileNotFoundError(source)
+            self._apply_state_data(state_data)
+            if self._snapshot is not None:
+                self._rebuild_snapshot()
+            print(f"State loaded from {source}")
 
-            max_lot_ID = 0
-            max_participant_ID = 0
+        except FileNotFoundError:
+            print(f"State file {source} not found. Starting with default state.")
+        except json.JSONDecodeError:
+            print(f"Error decoding JSON from {source}. Starting with default state.")
+        if self._bid_log is not None:
+            self._recover_bids()
 
-            loaded_lots_data = state_data.get('lots', [])
-            loaded_lots = []
-            for lot_data in loaded_lots_data:
-                lot = Lot._from_dict(lot_data)
-                max_lot_ID = max(max_lot_ID, lot.lot_id)
-                loaded_lots.append(lot)
-            self._lots = loaded_lots
-
-            sold_lot_map = {}
-            sold_lots_data = state_data.get('sold_lots', [])
-            loaded_sold_lots = []
-            for lot_data in sold_lots_data:
+    def _recover_bids(self) -> None:
+        """
+        Restores the lot that was being auctioned from the bid log, in the 'auction_paused' state.
+
+        The current bid is set to the last logged bid whose participant is still registered.
+        The auction can then be resumed, restarted, ended or aborted.
+        """
+        recovered = self._bid_log.recover()
+        if recovered is None:
+            return
+        lot_data, bids = recovered
+        with self._lock:
+            if lot_data['lot_id'] in self._sold_lots:
+                # the sale was saved, only the truncation of the log was missed
+                self._bid_log.reset()
+                return
+            lot = self._lots.get(lot_data['lot_id'])
+            if lot is not None:
+                self._take_lot(lot.lot_id)
+            else:
                 lot = Lot._from_dict(lot_data)
-                max_lot_ID = max(max_lot_ID, lot.lot_id)
-                loaded_sold_lots.append(lot)
-                sold_lot_map[lot.lot_id] = lot
-            self._sold_lots = loaded_sold_lots
-
-            loaded_participants_data = state_data.get('participants', [])
-            loaded_participants = []
-            for participant_data in loaded_participants_data:
-                participant = AuctionParticipant._from_dict(participant_data, sold_lot_map)
-                max_participant_ID = max(max_participant_ID, participant.participant_id)
-                loaded_participants.append(participant)
-            self._participants = loaded_participants
-
-            AuctionParticipant._participants_counter = max(state_data.get('participants_counter', 0),
-                                                           max_participant_ID + 1)
-
-            Lot._lot_counter = max(state_data.get('lot_counter', 0), max_lot_ID + 1)
+            self._current_lot = lot
+            self._current_bid = Bid(lot)
+            for participant_id, amount in reversed(bids):
+                participant = self._participants.get(participant_id)
+                if participant is not None and amount <= participant.balance:
+                    self._current_bid.increase_bid(amount, participant)
+                    break
+            self.on_recover_auction()
+            self._save_state()
+            print(f"Auction of lot {lot.lot_id} recovered from {self._bid_log.path}")
+
+    def _apply_state_data(self, state_data: dict) -> None:
+        """
+        Replaces the current state of the auction with the given state data.
+
+        Args:
+            state_data (dict): State data in the format produced by `_state_data`; older layouts are migrated
+                with `migrate_state_data`. Instead of the entity lists it may carry an `indexes` entry
+                with ready-made (participants, lots, sold lots) indexes, which are used as they are.
+        """
+        if 'indexes' in state_data:
+            self._participants, self._lots, self._sold_lots = state_data['indexes']
+            self._reset_schedule(state_data.get('schedule', []))
+            AuctionParticipant._participants_counter = state_data.get('participants_counter', 0)
+            Lot._lot_counter = state_data.get('lot_counter', 0)
             self._timeout = state_data.get('timeout', 60)
+            return
 
-            print(f"State loaded from {STATE_FILE}")
+        state_data = migrate_state_data(state_data)
+        max_lot_ID = 0
+        max_participant_ID = 0
 
-        except FileNotFoundError:
-            print(f"State file {STATE_FILE} not found. Starting with default state.")
-        except json.JSONDecodeError:
-            print(f"Error decoding JSON from {STATE_FILE}. Starting with default state.")
+        loaded_lots_data = state_data.get('lots', [])
+        loaded_lots = {}
+        for lot_data in loaded_lots_data:
+            lot = Lot._from_dict(lot_data)
+            max_lot_ID = max(max_lot_ID, lot.lot_id)
+            loaded_lots[lot.lot_id] = lot
+        self._lots = loaded_lots
+        self._reset_schedule(state_data.get('schedule', []))
+
+        sold_lots_data = state_data.get('sold_lots', [])
+        loaded_sold_lots = {}
+        for lot_data in sold_lots_data:
+            lot = Lot._from_dict(lot_data)
+            max_lot_ID = max(max_lot_ID, lot.lot_id)
+            loaded_sold_lots[lot.lot_id] = lot
+        self._sold_lots = loaded_sold_lots
+
+        loaded_participants_data = state_data.get('participants', [])
+        loaded_participants = {}
+        for participant_data in loaded_participants_data:
+            participant = AuctionParticipant._from_dict(participant_data, loaded_sold_lots)
+            max_participant_ID = max(max_participant_ID, participant.participant_id)
+            loaded_participants[participant.participant_id] = participant
+        self._participants = loaded_participants
+
+        AuctionParticipant._participants_counter = max(state_data.get('participants_counter', 0),
+                                                       max_participant_ID + 1)
+
+        Lot._lot_counter = max(state_data.get('lot_counter', 0), max_lot_ID + 1)
+        self._timeout = state_data.get('timeout', 60)
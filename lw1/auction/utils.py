@@ -1,6 +1,11 @@
 import functools
 
 STATE_FILE = 'auction_state.json'  # File to save and load state
+JOURNAL_FILE = 'auction_state.journal'  # Append-only journal of mutations since the last snapshot
+SQLITE_FILE = 'auction_state.sqlite3'  # Database used by SqliteStorage
+BINARY_STATE_FILE = 'auction_state.bin'  # Binary snapshot used by BinarySnapshotStorage
+BID_LOG_FILE = 'auction_bids.log'  # Durable log of the bids on the lot being auctioned
+STATE_SCHEMA = 2  # Version of the state data layout; participants reference their lots by ID since version 2
 
 def ensure_state(*required_state):
     """
@@ -51,12 +56,16 @@ def save(func):
     """
     Decorator to save state after the decorated function execution.
     This decorator works for methods as before. No changes needed for property setters if you intend to use it there.
+    The function and the save run while holding the object's `_lock`, so the saved state is consistent.
+    Inside a batch (`_batch_depth` > 0) the save is left to the end of the batch.
     """
 
     @functools.wraps(func)
     def wrapper(self, *args, **kwargs):
-        result = func(self, *args, **kwargs)
-        self._save_state()
+        with self._lock:
+            result = func(self, *args, **kwargs)
+            if not self._batch_depth:
+                self._save_state()
         return result
 
     return wrapper
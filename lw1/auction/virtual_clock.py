@@ -0,0 +1,124 @@
+from typing import Optional
+
+import heapq
+
+from .timer import Scheduler, Deadline
+
+
+class VirtualClock(Scheduler):
+    """
+    A Scheduler driven by virtual time instead of the wall clock.
+
+    Time only moves when `advance`, `run_until` or `run_next` is called. Due callbacks are then
+    executed on the calling thread, in deadline order, with `now()` set to their deadline, so an
+    auction day with a 60 second timeout per lot can be simulated in milliseconds and the result
+    does not depend on thread scheduling.
+
+    Args:
+        start (float, optional): The initial virtual time in seconds. Defaults to 0.0.
+    """
+
+    def __init__(self, start: float = 0.0):
+        super().__init__()
+        self._now = start
+
+    def __repr__(self):
+        return f"VirtualClock(now={self._now}, pending={len(self._heap)})"
+
+    def now(self) -> float:
+        """
+        Returns the current virtual time.
+        """
+        return self._now
+
+    def advance(self, seconds: float) -> int:
+        """
+        Moves the virtual time forward, executing the callbacks that become due.
+
+        Args:
+            seconds (float): The time to advance by.
+
+        Returns:
+            int: The number of callbacks executed.
+        """
+        if seconds < 0:
+            raise ValueError('Cannot move virtual time backwards.')
+        return self.run_until(self._now + seconds)
+
+    def run_until(self, until: float) -> int:
+        """
+        Executes the callbacks due up to the given time, then sets the time to it.
+
+        Callbacks may schedule new deadlines; those due before `until` are executed as well.
+
+        Args:
+            until (float): The virtual time to stop at. Times in the past leave the clock unchanged.
+
+        Returns:
+            int: The number of callbacks executed.
+        """
+        executed = 0
+        while True:
+            handle = self._pop_due(until)
+            if handle is None:
+                break
+            self._execute(handle)
+            executed += 1
+        self._now = max(self._now, until)
+        return executed
+
+    def run_next(self) -> bool:
+        """
+        Jumps to the next deadline and executes its callback.
+
+        Returns:
+            bool: False if there are no pending deadlines.
+        """
+        handle = self._pop_due(float('inf'))
+        if handle is None:
+            return False
+        self._execute(handle)
+        return True
+
+    @property
+    def next_deadline(self) -> Optional[float]:
+        """
+        Returns the time of the earliest pending deadline, or None if there is none.
+        """
+        with self._cond:
+            deadlines = [handle.deadline for _, _, handle in self._heap if handle.active]
+        return min(deadlines) if deadlines else None
+
+    def _ensure_thread(self) -> None:
+        # callbacks run on the thread that advances the clock
+        pass
+
+    def _execute(self, handle: Deadline) -> None:
+        try:
+            handle.callback()
+        finally:
+            handle._done.set()
+
+    def _pop_due(self, until: float) -> Optional[Deadline]:
+        """
+        Removes the earliest deadline due at or before `until` from the heap and moves the time to it.
+        """
+        with self._cond:
+            heap = self._heap
+            while heap:
+                entry = heap[0]
+                key, _, handle = entry
+                if not handle.active or entry is not handle._entry:
+                    heapq.heappop(heap)
+                    continue
+                if handle.deadline > key:
+                    heapq.heappop(heap)
+                    self._push(handle)
+                    continue
+                if key > until:
+                    return None
+                heapq.heappop(heap)
+                handle.active = False
+                self._now = max(self._now, key)
+                return handle
+            return None
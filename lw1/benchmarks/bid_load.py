@@ -0,0 +1,125 @@
+"""
+Load test of the bid server: N concurrent bidders outbid each other over TCP.
+
+Every bidder keeps one connection and sends its next bid as soon as the previous one is answered.
+Amounts come from a shared counter, so bids that overtake each other on the way are rejected by
+the platform, like late bids of real bidders. Prints the bid throughput and the p50/p99 latency
+of the accepted bids.
+
+Without --port an in-process server with an in-memory storage is started on a separate thread.
+
+Usage (from the lw1 directory):
+    python -m benchmarks.bid_load [--bidders 50] [--duration 5] [--host 127.0.0.1] [--port PORT]
+"""
+import argparse
+import asyncio
+import itertools
+import json
+import threading
+import time
+
+from auction.server import BidServer
+from auction.aio import AsyncTradingPlatform
+from auction.storage import MemoryStorage
+
+
+class Connection:
+    def __init__(self, reader, writer):
+        self._reader = reader
+        self._writer = writer
+        self._ids = itertools.count()
+
+    @classmethod
+    async def open(cls, host, port):
+        return cls(*await asyncio.open_connection(host, port))
+
+    async def request(self, op, **arguments):
+        self._writer.write(json.dumps(dict(arguments, op=op, id=next(self._ids))).encode() + b'\n')
+        await self._writer.drain()
+        return json.loads(await self._reader.readline())
+
+    async def close(self):
+        self._writer.close()
+        await self._writer.wait_closed()
+
+
+async def run_load(host, port, bidders=50, duration=5.0):
+    admin = await Connection.open(host, port)
+    if (await admin.request('state'))['result'] != 'preparing_for_auction':
+        await admin.request('pause_auction')
+        await admin.request('abort_auction')
+    participant_ids = [(await admin.request('add_participant', nickname=f'bidder_{i}', balance=10 ** 12))['result']
+                       for i in range(bidders)]
+    await admin.request('add_lot', name='Load test lot', minimum_bid=1)
+    await admin.request('timeout', value=duration * 10)
+    await admin.request('start_auction')
+
+    amounts = itertools.count(1)
+    accepted_latencies = []
+    counts = {'accepted': 0, 'rejected': 0}
+    stop_at = time.perf_counter() + duration
+
+    async def bidder(participant_id):
+        connection = await Connection.open(host, port)
+        while time.perf_counter() < stop_at:
+            started = time.perf_counter()
+            response = await connection.request('place_bid', participant_id=participant_id, amount=next(amounts))
+            if response['ok']:
+                accepted_latencies.append(time.perf_counter() - started)
+                counts['accepted'] += 1
+            else:
+                counts['rejected'] += 1
+        await connection.close()
+
+    started = time.perf_counter()
+    await asyncio.gather(*(bidder(participant_id) for participant_id in participant_ids))
+    elapsed = time.perf_counter() - started
+    await admin.request('end_auction')
+    await admin.close()
+
+    accepted_latencies.sort()
+    total = counts['accepted'] + counts['rejected']
+    return {
+        'bidders': bidders,
+        'bids': total,
+        'accepted': counts['accepted'],
+        'bids_per_second': total / elapsed,
+        'p50': accepted_latencies[len(accepted_latencies) // 2] if accepted_latencies else 0.0,
+        'p99': accepted_latencies[len(accepted_latencies) * 99 // 100] if accepted_latencies else 0.0,
+    }
+
+
+def start_local_server():
+    ready = threading.Event()
+    address = []
+
+    async def serve():
+        async with AsyncTradingPlatform(storage=MemoryStorage(keep_state=False)) as platform:
+            server = BidServer(platform)
+            address.extend(await server.start())
+            ready.set()
+            await server.serve_forever()
+
+    threading.Thread(target=asyncio.run, args=(serve(),), daemon=True).start()
+    ready.wait()
+    return address
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Load test of the bid server.')
+    parser.add_argument('--bidders', type=int, default=50)
+    parser.add_argument('--duration', type=float, default=5.0)
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int)
+    args = parser.parse_args()
+
+    host, port = (args.host, args.port) if args.port else start_local_server()
+    report = asyncio.run(run_load(host, port, args.bidders, args.duration))
+    print(f"bidders: {report['bidders']}")
+    print(f"bids: {report['bids']} ({report['accepted']} accepted)")
+    print(f"bids/sec: {report['bids_per_second']:.0f}")
+    print(f"accept latency p50: {report['p50'] * 1000:.2f} ms, p99: {report['p99'] * 1000:.2f} ms")
+
+
+if __name__ == '__main__':
+    main()
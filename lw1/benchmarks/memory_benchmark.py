@@ -0,0 +1,90 @@
+"""
+Measures the memory taken by the auction entities.
+
+Compares the slotted Lot, Bid and AuctionParticipant classes with replicas of the previous
+dict-based classes (participants holding a list of Lot objects).
+
+Usage (from the lw1 directory):
+    python -m benchmarks.memory_benchmark [count]
+"""
+import sys
+import tracemalloc
+
+from auction import Lot, Bid, AuctionParticipant
+
+
+class LegacyLot:
+    def __init__(self, name=None, description=None, minimum_bid=0, lot_id=0):
+        self._name = name
+        self._description = description
+        self._minimum_bid = minimum_bid
+        self._lot_id = lot_id
+
+
+class LegacyBid:
+    def __init__(self, lot, amount=0, participant=None):
+        self._amount = amount
+        self._lot = lot
+        self._participant = participant
+
+
+class LegacyParticipant:
+    def __init__(self, nickname, balance=0, participant_id=0):
+        self._nickname = nickname
+        self._balance = balance
+        self._lots = []
+        self._participant_id = participant_id
+
+
+def measure(factory, count: int) -> float:
+    """
+    Returns the number of bytes allocated per entity created by the factory.
+    """
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    entities = [factory(i) for i in range(count)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    # the list holding the entities is not part of their cost
+    per_entity = (after - before - sys.getsizeof(entities)) / count
+    del entities
+    return per_entity
+
+
+def main(count: int = 100000) -> None:
+    names = [f'Lot {i}' for i in range(count)]
+    legacy_lots = [LegacyLot(names[i], None, i, i) for i in range(count)]
+    lots = [Lot(names[i], None, i) for i in range(count)]
+
+    lot_index = {lot.lot_id: lot for lot in lots}
+
+    def legacy_participant(i, owned):
+        participant = LegacyParticipant('Alice', 100, i)
+        participant._lots.extend(legacy_lots[i:i + owned])
+        return participant
+
+    def participant(i, owned):
+        p = AuctionParticipant('Alice', 100)
+        # participants of a platform resolve their lots through the platform's sold lots index
+        p._lot_source = lot_index
+        for lot in lots[i:i + owned]:
+            p._add_lot(lot)
+        return p
+
+    rows = [
+        ('Lot', measure(lambda i: LegacyLot(names[i], None, i, i), count),
+         measure(lambda i: Lot(names[i], None, i), count)),
+        ('Bid', measure(lambda i: LegacyBid(legacy_lots[i], i), count),
+         measure(lambda i: Bid(lots[i], i), count)),
+        ('AuctionParticipant (no lots)', measure(lambda i: legacy_participant(i, 0), count),
+         measure(lambda i: participant(i, 0), count)),
+        ('AuctionParticipant (3 lots)', measure(lambda i: legacy_participant(i, 3), count),
+         measure(lambda i: participant(i, 3), count)),
+    ]
+    print(f"{'entity':<30}{'before, B':>12}{'after, B':>12}")
+    for name, before, after in rows:
+        print(f"{name:<30}{before:>12.1f}{after:>12.1f}")
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
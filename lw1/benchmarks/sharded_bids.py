@@ -0,0 +1,55 @@
+"""
+Bid throughput of a ShardedAuction by number of shards.
+
+Every round sends one batch of bids spread over all the lots; the shards resolve their parts
+in parallel. Throughput should grow with the shards up to the number of CPU cores.
+
+Usage (from the lw1 directory):
+    python -m benchmarks.sharded_bids [--shards 1 2 4] [--lots 64] [--bidders 100] [--batch 2000] [--rounds 50]
+"""
+import argparse
+import os
+import random
+import time
+
+from auction import AuctionParticipant, Lot, ShardedAuction
+
+
+def measure(shards, lots, bidders, batch, rounds, seed=0):
+    rng = random.Random(seed)
+    participants = [AuctionParticipant(nickname=f'bidder_{i}', balance=10 ** 12) for i in range(bidders)]
+    catalog = [Lot(name=f'Lot {i}', minimum_bid=1) for i in range(lots)]
+    lot_ids = [lot.lot_id for lot in catalog]
+    participant_ids = [p.participant_id for p in participants]
+    amount = 0
+    accepted = 0
+    with ShardedAuction(shards=shards, timeout=3600) as auction:
+        auction.add(participants, catalog)
+        auction.start_all()
+        start = time.perf_counter()
+        for _ in range(rounds):
+            bids = []
+            for _ in range(batch):
+                amount += 1
+                bids.append((rng.choice(lot_ids), rng.choice(participant_ids), amount))
+            accepted += sum(result.accepted for result in auction.place_bids(bids))
+        elapsed = time.perf_counter() - start
+    return batch * rounds / elapsed, accepted
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Measure the bid throughput of a ShardedAuction.')
+    parser.add_argument('--shards', type=int, nargs='+', default=[1, 2, 4])
+    parser.add_argument('--lots', type=int, default=64)
+    parser.add_argument('--bidders', type=int, default=100)
+    parser.add_argument('--batch', type=int, default=2000)
+    parser.add_argument('--rounds', type=int, default=50)
+    args = parser.parse_args()
+    print(f"CPUs: {os.cpu_count()}")
+    for shards in args.shards:
+        rate, accepted = measure(shards, args.lots, args.bidders, args.batch, args.rounds)
+        print(f"shards: {shards:<3} bids/s: {rate:>10.0f}   accepted: {accepted}")
+
+
+if __name__ == '__main__':
+    main()
@@ -24,6 +24,7 @@ class MainMenu:
                    '6 - participants info, '
                    '7 - lots info, '
                    '8 - start auction, '
+                   '9 - import from file, '
                    'other - EXIT'))
 
             choice = input('[prep]: ')
@@ -47,6 +48,8 @@ class MainMenu:
                     self._accepting_bids_menu()
                 except ValueError as e:
                     print(e)
+            elif choice == '9':
+                self._import_file()
             else:
                 break
 
@@ -66,7 +69,7 @@ class MainMenu:
         except ValueError as e:
             print(e)
             return
-        participant = next((p for p in self._auction.participants if p.participant_id == ID), None)
+        participant = self._auction.get_participant(ID)
         if participant:
             self._auction.remove(participant)
         else:
@@ -94,12 +97,27 @@ class MainMenu:
         except ValueError as e:
             print(e)
             return
-        lot = next((l for l in self._auction.lots if l.lot_id == ID), None)
+        lot = self._auction.get_lot(ID)
         if lot:
-            self._auction.remove(lot)
+            try:
+                self._auction.remove(lot)
+            except ValueError as e:
+                print(e)
         else:
             print(f"Lot with ID {ID} not found.")
 
+    def _import_file(self):
+        path = input('Enter the path of a CSV or JSONL file: ')
+        kind = input('Enter the kind of rows without a type column (lot/participant, default: none): ') or None
+        try:
+            report = BulkImporter(self._auction).import_file(path, kind)
+        except (OSError, ValueError) as e:
+            print(e)
+            return
+        for error in report.errors:
+            print(f"line {error.line}: {error.message}")
+        print(f"{report.imported} of {report.rows} rows imported ({report.rows_per_second:.0f} rows/s)")
+
     def _change_timeout(self):
         try:
             new_timeout = get_positive_int('Enter the new timeout in seconds: ')
@@ -140,7 +158,7 @@ class MainMenu:
                     print(e)
                     return
 
-                participant = next((p for p in self._auction.participants if p.participant_id == ID), None)
+                participant = self._auction.get_participant(ID)
                 if not participant:
                     print(f"Participant with ID {ID} not found.")
                     continue
@@ -0,0 +1,92 @@
+import asyncio
+import threading
+import unittest
+from unittest.mock import Mock
+
+from auction import (AsyncTradingPlatform, AsyncioScheduler, AuctionParticipant, Lot, MemoryStorage, Timer,
+                     TradingPlatform)
+
+
+class TestAsyncioScheduler(unittest.IsolatedAsyncioTestCase):
+    async def test_timer_fires_on_loop_thread(self):
+        fired = asyncio.Event()
+        threads = []
+
+        def callback():
+            threads.append(threading.current_thread())
+            fired.set()
+
+        timer = Timer(0.05, callback, scheduler=AsyncioScheduler())
+        timer.start()
+        await asyncio.wait_for(fired.wait(), 2)
+        self.assertEqual(threads, [threading.current_thread()])
+
+    async def test_restart_moves_deadline(self):
+        callback = Mock()
+        scheduler = AsyncioScheduler()
+        timer = Timer(0.1, callback, scheduler=scheduler)
+        timer.start()
+        await asyncio.sleep(0.06)
+        timer.start()
+        await asyncio.sleep(0.06)
+        callback.assert_not_called()
+        await asyncio.sleep(0.1)
+        callback.assert_called_once()
+
+    async def test_cancel_prevents_callback(self):
+        callback = Mock()
+        timer = Timer(0.02, callback, scheduler=AsyncioScheduler())
+        timer.start()
+        timer.cancel()
+        await asyncio.sleep(0.05)
+        callback.assert_not_called()
+
+    async def test_schedule_from_another_thread(self):
+        fired = asyncio.Event()
+        scheduler = AsyncioScheduler()
+        loop = asyncio.get_running_loop()
+        thread = threading.Thread(target=lambda: scheduler.schedule(0.01, lambda: loop.call_soon(fired.set)))
+        thread.start()
+        thread.join()
+        await asyncio.wait_for(fired.wait(), 2)
+
+
+class TestAsyncTradingPlatform(unittest.IsolatedAsyncioTestCase):
+    async def test_auction_ends_when_deadline_passes(self):
+        async with AsyncTradingPlatform(storage=MemoryStorage()) as aplatform:
+            alice = AuctionParticipant(nickname="Alice", balance=500)
+            lot = Lot(name="Painting", minimum_bid=100)
+            await aplatform.add(alice, lot)
+            aplatform.platform.timeout = 0.05
+            threads = threading.active_count()
+            await aplatform.start_auction()
+            await aplatform.place_bid(alice, 150)
+            for _ in range(100):
+                if aplatform.state == 'preparing_for_auction':
+                    break
+                await asyncio.sleep(0.01)
+            self.assertEqual(aplatform.platform.sold_lots, [lot])
+            self.assertEqual(alice.balance, 350)
+            self.assertLessEqual(threading.active_count(), threads + 1)
+
+    async def test_errors_are_raised_to_the_caller(self):
+        async with AsyncTradingPlatform(storage=MemoryStorage()) as aplatform:
+            alice = AuctionParticipant(nickname="Alice", balance=500)
+            await aplatform.add(alice, Lot(name="Painting", minimum_bid=100))
+            await aplatform.start_auction()
+            with self.assertRaises(ValueError):
+                await aplatform.place_bid(alice, 1000)
+            await aplatform.end_auction()
+            self.assertEqual(aplatform.state, 'preparing_for_auction')
+
+    async def test_wraps_existing_platform(self):
+        platform = TradingPlatform(storage=MemoryStorage())
+        aplatform = AsyncTradingPlatform(platform)
+        self.assertIsInstance(platform._clock, AsyncioScheduler)
+        self.assertIs(aplatform.platform, platform)
+        await aplatform.close()
+        self.assertIsNone(platform._dispatch)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,111 @@
+import random
+import unittest
+
+from auction import (TradingPlatform, AuctionParticipant, Lot, MemoryStorage, VirtualClock, AuctionAnalytics,
+                     AuctionHouse)
+
+
+class TestAuctionAnalytics(unittest.TestCase):
+    def test_aggregates(self):
+        analytics = AuctionAnalytics()
+        analytics.record_sale(1, 100)
+        analytics.record_sale(2, 300)
+        analytics.record_sale(1, 250)
+        analytics.record_unsold()
+        stats = analytics.stats(k=2)
+        self.assertEqual(stats.revenue, 650)
+        self.assertEqual((stats.sold, stats.unsold), (3, 1))
+        self.assertEqual(stats.sell_through, 0.75)
+        self.assertEqual(stats.top_spenders, [(1, 350), (2, 300)])
+        self.assertEqual(analytics.spend(3), 0)
+
+    def test_top_spenders_of_given_participants(self):
+        analytics = AuctionAnalytics()
+        for participant_id, amount in [(1, 500), (2, 300), (3, 100)]:
+            analytics.record_sale(participant_id, amount)
+        self.assertEqual(analytics.top_spenders(2, {2, 3}), [(2, 300), (3, 100)])
+        self.assertEqual(analytics.top_spenders(2), [(1, 500), (2, 300)])
+
+    def test_empty(self):
+        stats = AuctionAnalytics().stats()
+        self.assertEqual(stats, (0, 0, 0, 0.0, []))
+
+    def test_top_spenders_match_full_scan(self):
+        rng = random.Random(7)
+        analytics = AuctionAnalytics()
+        spend = {}
+        for _ in range(2000):
+            participant_id, amount = rng.randrange(50), rng.randrange(1, 1000)
+            analytics.record_sale(participant_id, amount)
+            spend[participant_id] = spend.get(participant_id, 0) + amount
+            if rng.random() < 0.05:
+                expected = sorted(spend.items(), key=lambda item: -item[1])[:5]
+                self.assertEqual([s for _, s in analytics.top_spenders(5)], [s for _, s in expected])
+        self.assertLessEqual(len(analytics._heap), 2 * len(spend) + 16)
+
+
+class TestPlatformStats(unittest.TestCase):
+    def setUp(self):
+        self.clock = VirtualClock()
+        self.platform = TradingPlatform(storage=MemoryStorage(), clock=self.clock)
+        self.alice = AuctionParticipant(nickname="Alice", balance=1000)
+        self.bob = AuctionParticipant(nickname="Bob", balance=1000)
+        self.lots = [Lot(name=f"Lot {i}", minimum_bid=10) for i in range(3)]
+        self.platform.add(self.alice, self.bob, *self.lots)
+
+    def test_stats_follow_auctions(self):
+        platform = self.platform
+        platform.start_auction()
+        platform.place_bid(self.alice, 100)
+        platform.end_auction()
+        platform.start_auction()
+        platform.place_bid(self.alice, 50)
+        platform.place_bid(self.bob, 200)
+        self.clock.advance(platform._timeout)
+        platform.start_auction()
+        platform.end_auction()
+
+        stats = platform.session_stats(top=1)
+        self.assertEqual(stats.revenue, 300)
+        self.assertEqual((stats.sold, stats.unsold), (2, 1))
+        self.assertEqual(stats.top_spenders, [(self.bob.participant_id, 200)])
+        self.assertEqual(stats.revenue, sum(1000 - p.balance for p in platform.participants))
+
+    def test_removed_participant_is_not_a_top_spender(self):
+        platform = self.platform
+        platform.start_auction()
+        platform.place_bid(self.alice, 300)
+        platform.end_auction()
+        platform.start_auction()
+        platform.place_bid(self.bob, 100)
+        platform.end_auction()
+        platform.remove(self.alice)
+        stats = platform.session_stats()
+        self.assertEqual(stats.top_spenders, [(self.bob.participant_id, 100)])
+        self.assertEqual((stats.revenue, stats.sold), (400, 2))
+
+    def test_stats_cover_only_the_session(self):
+        storage = MemoryStorage()
+        platform = TradingPlatform(storage=storage, clock=self.clock)
+        alice = AuctionParticipant(nickname="Alice", balance=1000)
+        platform.add(alice, Lot(name="Painting"))
+        platform.start_auction()
+        platform.place_bid(alice, 100)
+        platform.end_auction()
+        loaded = TradingPlatform(load_on_init=True, storage=storage, clock=self.clock)
+        self.assertEqual(len(loaded.sold_lots), 1)
+        self.assertEqual(loaded.session_stats(), (0, 0, 0, 0.0, []))
+
+    def test_auction_house_sales_are_counted(self):
+        house = AuctionHouse(self.platform)
+        first = house.start_auction()
+        second = house.start_auction()
+        house.place_bid(first.lot_id, self.alice, 120)
+        house.end_auction(first.lot_id)
+        house.end_auction(second.lot_id)
+        stats = self.platform.session_stats()
+        self.assertEqual((stats.revenue, stats.sold, stats.unsold), (120, 1, 1))
+
+
+if __name__ == '__main__':
+    unittest.main()
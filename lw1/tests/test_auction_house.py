@@ -0,0 +1,120 @@
+import os
+import tempfile
+import threading
+import unittest
+
+from auction import TradingPlatform, AuctionHouse, AuctionParticipant, Lot, JsonStorage
+
+
+class TestAuctionHouse(unittest.TestCase):
+    def setUp(self):
+        self._dir = tempfile.TemporaryDirectory()
+        self.platform = TradingPlatform(storage=JsonStorage(os.path.join(self._dir.name, 'state.json')))
+        self.alice = AuctionParticipant(nickname="Alice", balance=200)
+        self.bob = AuctionParticipant(nickname="Bob", balance=300)
+        self.painting = Lot(name="Painting", minimum_bid=100)
+        self.vase = Lot(name="Vase", minimum_bid=10)
+        self.platform.add(self.alice, self.bob, self.painting, self.vase)
+        self.platform.timeout = 5
+        self.house = AuctionHouse(self.platform)
+
+    def tearDown(self):
+        self.house.end_all()
+        self._dir.cleanup()
+
+    def test_ending_an_auction_charges_and_releases_in_one_step(self):
+        self.house.start_auction(self.painting.lot_id)
+        self.house.start_auction(self.vase.lot_id)
+        self.house.place_bid(self.painting.lot_id, self.alice, 150)
+        settle = self.platform._settle
+        errors = []
+
+        def bid_on_vase():
+            try:
+                self.house.place_bid(self.vase.lot_id, self.alice, 50)
+            except ValueError as e:
+                errors.append(e)
+
+        def settle_and_bid(lot, bid):
+            winner = settle(lot, bid)
+            bidder = threading.Thread(target=bid_on_vase)
+            bidder.start()
+            bidder.join(0.2)
+            threads.append(bidder)
+            return winner
+
+        threads = []
+        self.platform._settle = settle_and_bid
+        self.assertIs(self.house.end_auction(self.painting.lot_id), self.alice)
+        del self.platform._settle
+        threads[0].join(2)
+        self.assertEqual(errors, [])
+        self.assertEqual(self.alice.balance, 50)
+        self.assertEqual(self.house._funds.reserved(self.alice), 50)
+
+    def test_start_auction_runs_many_lots_at_once(self):
+        self.house.start_auction(self.vase.lot_id)
+        self.house.start_auction()
+        self.assertEqual(self.house.active_lots, [self.vase, self.painting])
+        self.assertEqual(self.platform.lots, [])
+
+    def test_bids_are_kept_per_lot(self):
+        self.house.start_auction(self.painting.lot_id)
+        self.house.start_auction(self.vase.lot_id)
+        self.house.place_bid(self.painting.lot_id, self.alice, 150)
+        self.house.place_bid(self.vase.lot_id, self.bob, 20)
+        self.assertEqual(self.house.current_bid(self.painting.lot_id).participant, self.alice)
+        self.assertEqual(self.house.current_bid(self.vase.lot_id).amount, 20)
+
+    def test_end_auction_settles_lot(self):
+        self.house.start_auction(self.painting.lot_id)
+        self.house.start_auction(self.vase.lot_id)
+        self.house.place_bid(self.painting.lot_id, self.alice, 150)
+        self.assertEqual(self.house.end_auction(self.painting.lot_id), self.alice)
+        self.assertIsNone(self.house.end_auction(self.vase.lot_id))
+        self.assertEqual(self.alice.balance, 50)
+        self.assertEqual(self.platform.sold_lots, [self.painting])
+        self.assertEqual(self.platform.lots, [self.vase])
+
+    def test_participant_cannot_lead_lots_beyond_balance(self):
+        self.house.start_auction(self.painting.lot_id)
+        self.house.start_auction(self.vase.lot_id)
+        self.house.place_bid(self.painting.lot_id, self.alice, 150)
+        with self.assertRaises(ValueError):
+            self.house.place_bid(self.vase.lot_id, self.alice, 60)
+        self.house.place_bid(self.painting.lot_id, self.bob, 160)
+        self.house.place_bid(self.vase.lot_id, self.alice, 60)
+
+    def test_bid_on_inactive_lot_raises_error(self):
+        with self.assertRaises(ValueError):
+            self.house.place_bid(self.painting.lot_id, self.alice, 150)
+
+    def test_timer_ends_lot_auction(self):
+        self.platform.timeout = 0.01
+        self.house.start_auction(self.painting.lot_id)
+        active = self.house._active[self.painting.lot_id]
+        active.timer._timer.join()
+        self.assertEqual(self.house.active_lots, [])
+        self.assertIn(self.painting, self.platform.lots)
+
+    def test_concurrent_bids_on_different_lots(self):
+        lots = [Lot(name=f"Lot {i}") for i in range(20)]
+        rich = AuctionParticipant(nickname="Rich", balance=10 ** 6)
+        self.platform.add(rich, lots)
+        for lot in lots:
+            self.house.start_auction(lot.lot_id)
+
+        def bid(lot):
+            for amount in range(1, 51):
+                self.house.place_bid(lot.lot_id, rich, amount)
+
+        threads = [threading.Thread(target=bid, args=(lot,)) for lot in lots]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertTrue(all(self.house.current_bid(lot.lot_id).amount == 50 for lot in lots))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -17,7 +17,7 @@ class TestAuctionParticipant(unittest.TestCase):
     def test_participant_lots_assignment_with_empty_list(self):
         participant = AuctionParticipant(nickname="Alice", balance=100.0)
         participant.lots = []
-        self.assertEqual(participant.lots, [])
+        self.assertEqual(participant.lots, ())
 
     def test_participant_to_dict_with_no_lots(self):
         participant = AuctionParticipant(nickname="Alice", balance=100.0)
@@ -25,7 +25,7 @@ class TestAuctionParticipant(unittest.TestCase):
             'nickname': "Alice",
             'balance': 100.0,
             'participant_id': participant.participant_id,
-            'lots': []
+            'lot_ids': []
         }
         self.assertEqual(participant._to_dict(), expected_dict)
 
@@ -40,7 +40,56 @@ class TestAuctionParticipant(unittest.TestCase):
         self.assertEqual(participant.nickname, "Alice")
         self.assertEqual(participant.balance, 100.0)
         self.assertEqual(participant.participant_id, 1)
-        self.assertEqual(participant.lots, [])
+        self.assertEqual(participant.lots, ())
+
+    def test_participant_has_no_instance_dict(self):
+        participant = AuctionParticipant(nickname="Alice", balance=100.0)
+        self.assertFalse(hasattr(participant, '__dict__'))
+
+    def test_participant_lots_are_stored_as_ids(self):
+        participant = AuctionParticipant(nickname="Alice", balance=100.0)
+        lot1 = Lot(name="Painting")
+        lot2 = Lot(name="Vase")
+        participant._add_lot(lot1)
+        participant._add_lot(lot2)
+        self.assertEqual(list(participant.lot_ids), [lot1.lot_id, lot2.lot_id])
+        self.assertEqual(participant.lots, (lot1, lot2))
+
+    def test_participant_lots_cannot_be_changed_in_place(self):
+        participant = AuctionParticipant(nickname="Alice", balance=100.0)
+        participant._add_lot(Lot(name="Painting"))
+        with self.assertRaises(AttributeError):
+            participant.lots.append(Lot(name="Vase"))
+        self.assertEqual(len(participant.lots), 1)
+
+    def test_participant_to_dict_references_lots_by_id(self):
+        participant = AuctionParticipant(nickname="Alice", balance=100.0)
+        lot = Lot(name="Painting")
+        participant._add_lot(lot)
+        self.assertEqual(participant._to_dict()['lot_ids'], [lot.lot_id])
+        self.assertNotIn('lots', participant._to_dict())
+
+    def test_participant_from_dict_resolves_lot_ids_through_lot_map(self):
+        lot = Lot(name="Painting")
+        data = {
+            'nickname': "Alice",
+            'balance': 100.0,
+            'participant_id': 1,
+            'lot_ids': [lot.lot_id]
+        }
+        participant = AuctionParticipant._from_dict(data, lot_map={lot.lot_id: lot})
+        self.assertIs(participant.lots[0], lot)
+
+    def test_participant_from_dict_resolves_lots_through_lot_map(self):
+        lot = Lot(name="Painting")
+        data = {
+            'nickname': "Alice",
+            'balance': 100.0,
+            'participant_id': 1,
+            'lots': [lot._to_dict()]
+        }
+        participant = AuctionParticipant._from_dict(data, lot_map={lot.lot_id: lot})
+        self.assertIs(participant.lots[0], lot)
 
 
 if __name__ == "__main__":
@@ -62,5 +62,9 @@ class TestBid(unittest.TestCase):
         self.assertEqual(bid1, bid2)
         self.assertNotEqual(bid1, bid3)
 
+    def test_bid_has_no_instance_dict(self):
+        """Test that bids are slotted."""
+        self.assertFalse(hasattr(Bid(self.lot), '__dict__'))
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,60 @@
+import unittest
+
+from auction import BidLedger, BidRecord, TradingPlatform, AuctionParticipant, Lot
+
+
+class TestBidLedger(unittest.TestCase):
+    def setUp(self):
+        self.ledger = BidLedger(lot_id=7)
+        self.ledger.append(1, 100, timestamp=0)
+        self.ledger.append(2, 150, timestamp=500_000_000)
+        self.ledger.append(1, 200, timestamp=1_000_000_000)
+        self.ledger.append(3, 250, timestamp=2_500_000_000)
+
+    def test_records_are_kept_in_order(self):
+        self.assertEqual(len(self.ledger), 4)
+        self.assertEqual(self.ledger[1], BidRecord(2, 150, 500_000_000))
+        self.assertEqual([record.amount for record in self.ledger], [100, 150, 200, 250])
+
+    def test_top_returns_highest_bids_first(self):
+        self.assertEqual([record.participant_id for record in self.ledger.top(2)], [3, 1])
+
+    def test_by_participant(self):
+        self.assertEqual([record.amount for record in self.ledger.by_participant(1)], [100, 200])
+        self.assertEqual(self.ledger.by_participant(42), [])
+
+    def test_bid_rate_over_whole_history(self):
+        self.assertAlmostEqual(self.ledger.bid_rate(), 4 / 2.5)
+
+    def test_bid_rate_over_window(self):
+        self.assertAlmostEqual(self.ledger.bid_rate(window=2, now=2_500_000_000), 3 / 2)
+
+    def test_rate_series(self):
+        self.assertEqual(self.ledger.rate_series(1), [2, 1, 1])
+
+    def test_empty_ledger(self):
+        ledger = BidLedger(lot_id=1)
+        self.assertEqual(ledger.top(3), [])
+        self.assertEqual(ledger.bid_rate(), 0.0)
+        self.assertEqual(ledger.rate_series(1), [])
+
+    def test_platform_records_bid_history(self):
+        platform = TradingPlatform()
+        alice = AuctionParticipant(nickname="Alice", balance=500)
+        bob = AuctionParticipant(nickname="Bob", balance=500)
+        lot = Lot(name="Painting", minimum_bid=100)
+        platform.add(alice, bob, lot)
+        platform.timeout = 0.1
+        platform.start_auction()
+        platform.place_bid(alice, 150)
+        platform.place_bid(bob, 200)
+        with self.assertRaises(ValueError):
+            platform.place_bid(alice, 180)
+        platform.end_auction()
+        history = platform.bid_history(lot.lot_id)
+        self.assertEqual([(r.participant_id, r.amount) for r in history],
+                         [(alice.participant_id, 150), (bob.participant_id, 200)])
+
+
+if __name__ == "__main__":
+    unittest.main()
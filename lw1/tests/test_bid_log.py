@@ -0,0 +1,152 @@
+import os
+import tempfile
+import threading
+import unittest
+
+from auction import TradingPlatform, AuctionParticipant, Lot, JsonStorage, BidLog
+
+
+class TestBidLog(unittest.TestCase):
+    def setUp(self):
+        self._dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self._dir.name, 'bids.log')
+        self.state_path = os.path.join(self._dir.name, 'state.json')
+
+    def tearDown(self):
+        self._dir.cleanup()
+
+    def _platform(self, load_on_init=False):
+        return TradingPlatform(load_on_init=load_on_init, storage=JsonStorage(self.state_path),
+                               bid_log=BidLog(self.path))
+
+    def test_recover_returns_lot_and_bids(self):
+        log = BidLog(self.path)
+        log.start_lot({'name': "Painting", 'description': None, 'minimum_bid': 100, 'lot_id': 1})
+        log.append_bid(1, 7, 150)
+        log.restart_lot(1)
+        log.sync(log.append_bid(1, 8, 120))
+        log.close()
+        with open(self.path, 'a') as f:
+            f.write('["bid",[1,')
+        lot_data, bids = BidLog(self.path).recover()
+        self.assertEqual(lot_data['lot_id'], 1)
+        self.assertEqual(bids, [(8, 120)])
+
+    def test_recover_missing_file_returns_none(self):
+        self.assertIsNone(BidLog(self.path).recover())
+
+    def test_concurrent_bidders_share_fsyncs(self):
+        log = BidLog(self.path)
+
+        def bid(participant_id):
+            for amount in range(50):
+                log.sync(log.append_bid(1, participant_id, amount))
+
+        threads = [threading.Thread(target=bid, args=(i,)) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertLessEqual(log.sync_count, 400)
+        log.close()
+        with open(self.path) as f:
+            self.assertEqual(len(f.readlines()), 400)
+
+    def test_place_bids_syncs_once(self):
+        platform = self._platform()
+        alice = AuctionParticipant(nickname="Alice", balance=500)
+        bob = AuctionParticipant(nickname="Bob", balance=500)
+        platform.add(alice, bob, Lot(name="Painting", minimum_bid=100))
+        platform.start_auction()
+        syncs = platform._bid_log.sync_count
+        platform.place_bids([(alice, 150), (bob, 160), (alice, 170)])
+        self.assertEqual(platform._bid_log.sync_count, syncs + 1)
+        platform.pause_auction()
+        platform.abort_auction()
+
+    def test_in_flight_lot_is_recovered_paused(self):
+        platform = self._platform()
+        alice = AuctionParticipant(nickname="Alice", balance=500)
+        bob = AuctionParticipant(nickname="Bob", balance=500)
+        lot = Lot(name="Painting", minimum_bid=100)
+        platform.add(alice, bob, lot)
+        platform.start_auction()
+        platform.place_bid(alice, 150)
+        platform.place_bid(bob, 200)
+        platform._timer.cancel()  # the process "crashes" here
+
+        recovered = self._platform(load_on_init=True)
+        self.assertEqual(recovered.state, 'auction_paused')
+        self.assertEqual(recovered._current_lot.lot_id, lot.lot_id)
+        self.assertEqual(recovered._current_bid.amount, 200)
+        self.assertEqual(recovered._current_bid.participant.nickname, "Bob")
+        self.assertEqual(recovered.lots, [])
+
+        recovered.end_auction()
+        self.assertEqual([l.lot_id for l in recovered.sold_lots], [lot.lot_id])
+        self.assertTrue(recovered._bid_log.empty)
+        self.assertEqual(os.path.getsize(self.path), 0)
+
+    def test_log_is_truncated_after_lot_ends(self):
+        platform = self._platform()
+        alice = AuctionParticipant(nickname="Alice", balance=500)
+        platform.add(alice, Lot(name="Painting", minimum_bid=100))
+        platform.start_auction()
+        platform.place_bid(alice, 150)
+        platform.end_auction()
+        self.assertEqual(os.path.getsize(self.path), 0)
+
+        recovered = self._platform(load_on_init=True)
+        self.assertEqual(recovered.state, 'preparing_for_auction')
+
+    def test_timer_reset_between_append_and_sync(self):
+        platform = self._platform()
+        alice = AuctionParticipant(nickname="Alice", balance=500)
+        platform.add(alice, Lot(name="Painting", minimum_bid=100))
+        platform.start_auction()
+        sync_bids = platform._sync_bids
+
+        def expire_then_sync(seq):
+            # the timer ends the auction after the bid is appended, before it is synced
+            timer = threading.Thread(target=platform.end_auction)
+            timer.start()
+            timer.join()
+            sync_bids(seq)
+
+        platform._sync_bids = expire_then_sync
+        platform.place_bid(alice, 150)
+        self.assertEqual(platform.state, 'preparing_for_auction')
+        self.assertTrue(platform._bid_log.empty)
+
+    def test_reset_waits_for_sync(self):
+        log = BidLog(self.path)
+        seqs = [log.append_bid(1, 7, amount) for amount in range(100)]
+        threads = [threading.Thread(target=log.sync, args=(seq,)) for seq in seqs]
+        for thread in threads:
+            thread.start()
+        log.reset()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(os.path.getsize(self.path), 0)
+        log.sync(log.append_bid(1, 7, 100))
+
+    def test_torn_record_is_cut_before_new_appends(self):
+        log = BidLog(self.path)
+        log.start_lot({'name': "Painting", 'description': None, 'minimum_bid': 100, 'lot_id': 1})
+        for amount in range(30):
+            log.append_bid(1, 7, amount)
+        log.close()
+        with open(self.path, 'a') as f:
+            f.write('["bid",[1,')
+
+        log = BidLog(self.path)
+        self.assertEqual(len(log.recover()[1]), 30)
+        for amount in range(30, 60):
+            log.append_bid(1, 7, amount)
+        log.close()
+        lot_data, bids = BidLog(self.path).recover()
+        self.assertEqual(bids, [(7, amount) for amount in range(60)])
+
+
+if __name__ == '__main__':
+    unittest.main()
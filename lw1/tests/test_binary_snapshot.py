@@ -0,0 +1,127 @@
+import os
+import tempfile
+import unittest
+
+from auction import TradingPlatform, AuctionParticipant, Lot, BinarySnapshotStorage, LazyLotIndex
+
+
+class TestBinarySnapshotStorage(unittest.TestCase):
+    def setUp(self):
+        self._dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self._dir.name, 'state.bin')
+
+    def tearDown(self):
+        self._dir.cleanup()
+
+    def _sold_platform(self):
+        platform = TradingPlatform(storage=BinarySnapshotStorage(self.path))
+        participant = AuctionParticipant(nickname="Алиса", balance=200.0)
+        lot = Lot(name="Painting", description="A beautiful painting", minimum_bid=100.0)
+        unsold = Lot(name="Vase", minimum_bid=10)
+        platform.add(participant, lot, unsold)
+        platform.timeout = 0.1
+        platform.start_auction()
+        platform.place_bid(participant, 150.0)
+        platform.end_auction()
+        return platform
+
+    def test_save_and_load(self):
+        self._sold_platform()
+        storage = BinarySnapshotStorage(self.path)
+        platform = TradingPlatform(load_on_init=True, storage=storage)
+        self.assertEqual([l.name for l in platform.lots], ["Vase"])
+        self.assertEqual(platform.lots[0].minimum_bid, 10)
+        self.assertIsInstance(platform.lots[0].minimum_bid, int)
+        self.assertIsNone(platform.lots[0].description)
+        self.assertEqual([l.name for l in platform.sold_lots], ["Painting"])
+        self.assertEqual(platform.sold_lots[0].description, "A beautiful painting")
+        self.assertEqual(platform.participants[0].nickname, "Алиса")
+        self.assertEqual(platform.participants[0].balance, 50.0)
+        self.assertEqual(list(platform.participants[0].lots), platform.sold_lots)
+        self.assertEqual(platform._timeout, 0.1)
+        storage.close()
+
+    def test_lots_are_materialized_on_access(self):
+        platform = TradingPlatform(storage=BinarySnapshotStorage(self.path))
+        lots = [Lot(name=f"Lot {i}", minimum_bid=i) for i in range(100)]
+        platform.add(lots)
+
+        storage = BinarySnapshotStorage(self.path)
+        loaded = TradingPlatform(load_on_init=True, storage=storage)
+        self.assertIsInstance(loaded._lots, LazyLotIndex)
+        self.assertEqual(loaded._lots.loaded_count, 0)
+        self.assertEqual(loaded.get_lot(lots[42].lot_id).name, "Lot 42")
+        self.assertEqual(loaded._lots.loaded_count, 1)
+        self.assertEqual([l.lot_id for l in loaded.lots], [l.lot_id for l in lots])
+        storage.close()
+
+    def test_materializing_lots_keeps_lot_counter(self):
+        platform = TradingPlatform(storage=BinarySnapshotStorage(self.path))
+        platform.add([Lot(name=f"Lot {i}") for i in range(10)])
+        counter = Lot.lot_counter()
+
+        storage = BinarySnapshotStorage(self.path)
+        loaded = TradingPlatform(load_on_init=True, storage=storage)
+        self.assertEqual(Lot.lot_counter(), counter)
+        loaded.lots
+        self.assertEqual(Lot.lot_counter(), counter)
+        self.assertEqual(Lot(name="New").lot_id, counter)
+        storage.close()
+
+    def test_loaded_platform_keeps_working(self):
+        self._sold_platform()
+        storage = BinarySnapshotStorage(self.path)
+        platform = TradingPlatform(load_on_init=True, storage=storage)
+        new_lot = Lot(name="Clock", minimum_bid=5)
+        platform.add(new_lot)
+        platform.remove(platform.lots[0])
+        self.assertEqual(platform.lots, [new_lot])
+        self.assertGreater(new_lot.lot_id, platform.sold_lots[0].lot_id)
+
+        storage2 = BinarySnapshotStorage(self.path)
+        platform2 = TradingPlatform(load_on_init=True, storage=storage2)
+        self.assertEqual([l.name for l in platform2.lots], ["Clock"])
+        self.assertEqual([l.name for l in platform2.participants[0].lots], ["Painting"])
+        storage.close()
+        storage2.close()
+
+    def test_save_keeps_lots_unloaded(self):
+        platform = self._sold_platform()
+        platform.add([Lot(name=f"Lot {i}", description="Same" if i % 2 else None, minimum_bid=i * 1.5)
+                      for i in range(20)])
+        expected = [(l.lot_id, l.name, l.description, l.minimum_bid) for l in platform.lots]
+
+        storage = BinarySnapshotStorage(self.path)
+        loaded = TradingPlatform(load_on_init=True, storage=storage)
+        clock = Lot(name="Clock", minimum_bid=5)
+        loaded.add(clock)
+        loaded.remove(loaded._lots[expected[0][0]])
+        self.assertEqual(loaded._lots.loaded_count, 1)
+        self.assertEqual(loaded._sold_lots.loaded_count, 0)
+
+        storage2 = BinarySnapshotStorage(self.path)
+        platform2 = TradingPlatform(load_on_init=True, storage=storage2)
+        self.assertEqual([(l.lot_id, l.name, l.description, l.minimum_bid) for l in platform2.lots],
+                         expected[1:] + [(clock.lot_id, "Clock", None, 5)])
+        self.assertEqual([l.name for l in platform2.sold_lots], ["Painting"])
+        self.assertEqual(platform2.sold_lots[0].description, "A beautiful painting")
+        storage.close()
+        storage2.close()
+
+    def test_save_does_not_leave_temporary_file(self):
+        platform = TradingPlatform(storage=BinarySnapshotStorage(self.path))
+        platform.add(Lot(name="Painting"))
+        self.assertEqual(os.listdir(self._dir.name), ['state.bin'])
+
+    def test_load_missing_file_returns_none(self):
+        self.assertIsNone(BinarySnapshotStorage(self.path).load())
+
+    def test_load_rejects_foreign_file(self):
+        with open(self.path, 'wb') as f:
+            f.write(b'{"lots": []}' + bytes(100))
+        with self.assertRaises(ValueError):
+            BinarySnapshotStorage(self.path).load()
+
+
+if __name__ == '__main__':
+    unittest.main()
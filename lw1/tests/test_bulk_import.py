@@ -0,0 +1,95 @@
+import csv
+import io
+import os
+import tempfile
+import unittest
+
+from auction import TradingPlatform, Lot, AuctionParticipant, MemoryStorage, BulkImporter
+from auction.bulk_import import read_csv, read_jsonl
+
+
+class TestBulkImporter(unittest.TestCase):
+    def setUp(self):
+        self.storage = MemoryStorage()
+        self.platform = TradingPlatform(storage=self.storage)
+
+    def test_csv_lots_are_committed_per_chunk(self):
+        text = "name,description,minimum_bid\n" + "".join(f"Lot {i},Item {i},{i}\n" for i in range(25))
+        report = BulkImporter(self.platform, chunk_size=10).import_rows(read_csv(io.StringIO(text)), kind='lot')
+        self.assertEqual((report.rows, report.imported, report.failed), (25, 25, 0))
+        self.assertEqual(self.storage.saves, 3)
+        lots = self.platform.lots
+        self.assertEqual([lot.minimum_bid for lot in lots], list(range(25)))
+        self.assertEqual(lots[3].description, 'Item 3')
+        self.assertGreater(report.rows_per_second, 0)
+
+    def test_invalid_rows_are_reported(self):
+        text = "\n".join([
+            '{"type": "participant", "nickname": "Alice", "balance": 100}',
+            '{"type": "lot", "name": "Vase", "minimum_bid": -5}',
+            'not json',
+            '{"type": "lot", "minimum_bid": 10}',
+            '[1, 2]',
+            '{"type": "car", "name": "Volvo"}',
+            '{"type": "participant", "nickname": "Bob", "balance": "lots"}',
+            '',
+            '{"type": "lot", "name": "Clock", "minimum_bid": 12.5}',
+        ])
+        report = BulkImporter(self.platform, max_errors=3).import_rows(read_jsonl(io.StringIO(text)))
+        self.assertEqual((report.rows, report.imported, report.failed), (8, 2, 6))
+        self.assertEqual([error.line for error in report.errors], [2, 3, 4])
+        self.assertIn('non-negative', report.errors[0].message)
+        self.assertEqual(self.platform.participants[0].nickname, 'Alice')
+        self.assertEqual(self.platform.lots[0].minimum_bid, 12.5)
+
+    def test_import_file(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'catalog.csv')
+            with open(path, 'w', encoding='utf-8') as file:
+                file.write("type,name,nickname,balance,minimum_bid\nlot,Painting,,,100\nparticipant,,Carol,500,\n")
+            report = BulkImporter(self.platform).import_file(path)
+            self.assertEqual(report.imported, 2)
+            with self.assertRaises(ValueError):
+                BulkImporter(self.platform).import_file(os.path.join(directory, 'catalog.xml'))
+        self.assertIsInstance(self.platform.lots[0], Lot)
+        self.assertIsInstance(self.platform.participants[0], AuctionParticipant)
+        self.assertEqual(self.platform.participants[0].balance, 500)
+
+    def test_null_nickname_is_missing(self):
+        text = '{"type": "participant", "nickname": null, "balance": 10}'
+        report = BulkImporter(self.platform).import_rows(read_jsonl(io.StringIO(text)))
+        self.assertEqual(report.imported, 1)
+        participant = self.platform.participants[0]
+        self.assertEqual(participant.nickname, f'anonymous_{participant.participant_id}')
+
+    def test_csv_reader_errors_are_reported(self):
+        text = ("name,minimum_bid\n" + "".join(f"Lot {i},{i}\n" for i in range(5)) +
+                "Huge," + "x" * (csv.field_size_limit() + 1) + "\n" +
+                "".join(f"Lot {i},{i}\n" for i in range(5, 8)))
+        report = BulkImporter(self.platform, chunk_size=2).import_rows(read_csv(io.StringIO(text)), kind='lot')
+        self.assertEqual((report.rows, report.imported, report.failed), (9, 8, 1))
+        self.assertEqual(report.errors[0].line, 7)
+        self.assertIn('field limit', report.errors[0].message)
+        self.assertEqual(len(self.platform.lots), 8)
+
+    def test_stream_failure_keeps_committed_chunks(self):
+        def rows():
+            for i in range(5):
+                yield i + 1, {'name': f'Lot {i}'}
+            raise csv.Error('unexpected end of data')
+
+        report = BulkImporter(self.platform, chunk_size=2).import_rows(rows(), kind='lot')
+        self.assertEqual((report.rows, report.imported, report.failed), (6, 5, 1))
+        self.assertEqual(report.errors[0].line, 6)
+        self.assertIn('unexpected end of data', report.errors[0].message)
+        self.assertEqual(len(self.platform.lots), 5)
+
+    def test_requires_preparing_state(self):
+        self.platform.add(AuctionParticipant(nickname="Alice"), Lot(name="Lamp"))
+        self.platform.start_auction()
+        with self.assertRaises(RuntimeError):
+            BulkImporter(self.platform).import_rows(iter([(1, {'name': 'Chair'})]), kind='lot')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,159 @@
+import gc
+import json
+import os
+import tempfile
+import threading
+import time
+import unittest
+import weakref
+
+from auction import TradingPlatform, Lot, AuctionParticipant, JsonStorage, Journal, DeferredStorage
+
+
+class CountingStorage(JsonStorage):
+    def __init__(self, path):
+        super().__init__(path)
+        self.saves = []
+
+    def save(self, platform, changes):
+        self.saves.append(list(changes))
+        super().save(platform, changes)
+
+
+class BlockingStorage(JsonStorage):
+    def __init__(self, path):
+        super().__init__(path)
+        self.writing = threading.Event()
+        self.release = threading.Event()
+
+    def save(self, platform, changes):
+        self.writing.set()
+        self.release.wait(5)
+        super().save(platform, changes)
+
+
+class StateRecordingJournal(Journal):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.states = []
+
+    def save(self, platform, changes):
+        self.states.append(platform is not None)
+        super().save(platform, changes)
+
+
+class TestDeferredStorage(unittest.TestCase):
+    def setUp(self):
+        self._dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self._dir.name, 'state.json')
+
+    def tearDown(self):
+        self._dir.cleanup()
+
+    def test_saves_are_coalesced(self):
+        inner = CountingStorage(self.path)
+        storage = DeferredStorage(inner, interval=10)
+        platform = TradingPlatform(storage=storage)
+        for i in range(50):
+            platform.add(Lot(name=f"Lot {i}"))
+        self.assertEqual(inner.saves, [])
+        self.assertTrue(storage.dirty)
+        platform.flush()
+        self.assertEqual(len(inner.saves), 1)
+        self.assertEqual(len(inner.saves[0]), 50)
+        self.assertFalse(storage.dirty)
+        with open(self.path) as f:
+            self.assertEqual(len(json.load(f)['lots']), 50)
+        storage.close()
+
+    def test_background_writer_flushes_after_interval(self):
+        inner = CountingStorage(self.path)
+        storage = DeferredStorage(inner, interval=0.05)
+        platform = TradingPlatform(storage=storage)
+        platform.add(Lot(name="Painting"))
+        deadline = time.monotonic() + 2
+        while storage.dirty and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertFalse(storage.dirty)
+        self.assertEqual(len(inner.saves), 1)
+        storage.close()
+
+    def test_max_changes_triggers_write(self):
+        inner = CountingStorage(self.path)
+        storage = DeferredStorage(inner, interval=10, max_changes=5)
+        platform = TradingPlatform(storage=storage)
+        platform.add([Lot(name=f"Lot {i}") for i in range(5)])
+        deadline = time.monotonic() + 2
+        while not inner.saves and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(len(inner.saves), 1)
+        storage.close()
+
+    def test_close_writes_pending_changes(self):
+        journal = Journal(path=os.path.join(self._dir.name, 'state.journal'), snapshot_path=self.path)
+        storage = DeferredStorage(journal, interval=10)
+        platform = TradingPlatform(storage=storage)
+        platform.add(Lot(name="Painting"), Lot(name="Vase"))
+        storage.close()
+
+        platform2 = TradingPlatform(load_on_init=True, storage=Journal(
+            path=os.path.join(self._dir.name, 'state.journal'), snapshot_path=self.path))
+        self.assertEqual([lot.name for lot in platform2.lots], ["Painting", "Vase"])
+
+    def test_state_copied_only_for_full_snapshots(self):
+        journal = StateRecordingJournal(path=os.path.join(self._dir.name, 'state.journal'),
+                                        snapshot_path=self.path, snapshot_every=3)
+        storage = DeferredStorage(journal, interval=10)
+        platform = TradingPlatform(storage=storage)
+        for i in range(6):
+            platform.add(Lot(name=f"Lot {i}"))
+            platform.flush()
+        storage.close()
+        # the first save and every third record write a snapshot, the rest append the changes only
+        self.assertEqual(journal.states, [True, False, False, True, False, False])
+
+        platform2 = TradingPlatform(load_on_init=True, storage=Journal(
+            path=os.path.join(self._dir.name, 'state.journal'), snapshot_path=self.path))
+        self.assertEqual([lot.name for lot in platform2.lots], [f"Lot {i}" for i in range(6)])
+
+    def test_save_after_close_raises_error(self):
+        storage = DeferredStorage(JsonStorage(self.path))
+        platform = TradingPlatform(storage=storage)
+        storage.close()
+        with self.assertRaises(RuntimeError):
+            platform.add(Lot(name="Painting"))
+
+    def test_write_does_not_hold_platform_lock(self):
+        inner = BlockingStorage(self.path)
+        storage = DeferredStorage(inner, interval=0.01)
+        platform = TradingPlatform(storage=storage)
+        alice = AuctionParticipant('alice', 500)
+        platform.add(alice, Lot(name="Painting"), Lot(name="Vase"))
+        self.assertTrue(inner.writing.wait(2))
+        bidder = threading.Thread(target=lambda: (platform.start_auction(), platform.place_bid(alice, 100)))
+        bidder.start()
+        bidder.join(2)
+        self.assertFalse(bidder.is_alive())
+        inner.release.set()
+        platform.flush()
+        with open(self.path) as f:
+            self.assertEqual([lot['name'] for lot in json.load(f)['lots']], ["Vase"])
+        platform._timer.cancel()
+        storage.close()
+
+    def test_idle_storage_is_not_kept_alive(self):
+        storage = DeferredStorage(JsonStorage(self.path), interval=0.01)
+        platform = TradingPlatform(storage=storage)
+        platform.add(Lot(name="Painting"))
+        platform.flush()
+        deadline = time.monotonic() + 2
+        while storage._thread is not None and time.monotonic() < deadline:
+            time.sleep(0.01)
+        ref = weakref.ref(storage)
+        del storage, platform
+        gc.collect()
+        self.assertIsNone(ref())
+
+
+if __name__ == '__main__':
+    unittest.main()
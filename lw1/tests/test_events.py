@@ -0,0 +1,112 @@
+import threading
+import unittest
+
+from auction import (TradingPlatform, AuctionParticipant, Lot, MemoryStorage, VirtualClock, EventBus, Event,
+                     DROP_OLDEST, COALESCE)
+
+
+class TestEventBus(unittest.TestCase):
+    def test_drop_oldest_keeps_latest_events(self):
+        bus = EventBus()
+        subscription = bus.subscribe(maxsize=3, policy=DROP_OLDEST)
+        for amount in range(5):
+            bus.publish(Event('bid_accepted', 1, 7, amount, 0.0))
+        self.assertEqual([e.amount for e in subscription.drain()], [2, 3, 4])
+        self.assertEqual(subscription.dropped, 2)
+
+    def test_coalesce_keeps_latest_price_per_lot(self):
+        bus = EventBus()
+        subscription = bus.subscribe(policy=COALESCE)
+        bus.publish(Event('bid_accepted', 1, 7, 100, 0.0))
+        bus.publish(Event('bid_accepted', 2, 7, 50, 0.0))
+        bus.publish(Event('bid_accepted', 1, 8, 120, 0.0))
+        bus.publish(Event('lot_sold', 1, 8, 120, 0.0))
+        bus.publish(Event('bid_accepted', 1, 7, 130, 0.0))
+        events = subscription.drain()
+        self.assertEqual([(e.kind, e.lot_id, e.amount) for e in events],
+                         [('bid_accepted', 1, 120), ('bid_accepted', 2, 50), ('lot_sold', 1, 120),
+                          ('bid_accepted', 1, 130)])
+        self.assertEqual(subscription.coalesced, 1)
+
+    def test_slow_subscriber_does_not_affect_others(self):
+        bus = EventBus()
+        slow = bus.subscribe(maxsize=1)
+        fast = bus.subscribe(maxsize=100)
+        for amount in range(10):
+            bus.publish(Event('bid_accepted', 1, 7, amount, 0.0))
+        self.assertEqual(len(slow.drain()), 1)
+        self.assertEqual(len(fast.drain()), 10)
+
+    def test_kinds_filter_and_validation(self):
+        bus = EventBus()
+        subscription = bus.subscribe(kinds=['lot_sold'])
+        bus.publish(Event('bid_accepted', 1, 7, 100, 0.0))
+        bus.publish(Event('lot_sold', 1, 7, 100, 0.0))
+        self.assertEqual([e.kind for e in subscription.drain()], ['lot_sold'])
+        with self.assertRaises(ValueError):
+            bus.subscribe(kinds=['price_changed'])
+        with self.assertRaises(ValueError):
+            bus.subscribe(policy='block')
+
+    def test_kinds_from_generator(self):
+        bus = EventBus()
+        subscription = bus.subscribe(kinds=(kind for kind in ['lot_sold', 'lot_unsold']))
+        bus.publish(Event('lot_sold', 1, 7, 100, 0.0))
+        bus.publish(Event('bid_accepted', 1, 7, 100, 0.0))
+        self.assertEqual([e.kind for e in subscription.drain()], ['lot_sold'])
+
+    def test_get_waits_for_event_and_close_wakes_reader(self):
+        bus = EventBus()
+        subscription = bus.subscribe()
+        received = []
+        reader = threading.Thread(target=lambda: received.extend(subscription))
+        reader.start()
+        bus.publish(Event('paused', 1, None, None, 0.0))
+        bus.unsubscribe(subscription)
+        reader.join(2)
+        self.assertFalse(reader.is_alive())
+        self.assertEqual([e.kind for e in received], ['paused'])
+        self.assertIsNone(subscription.get(timeout=0))
+
+
+class TestPlatformEvents(unittest.TestCase):
+    def test_platform_publishes_auction_events(self):
+        clock = VirtualClock()
+        platform = TradingPlatform(storage=MemoryStorage(), clock=clock)
+        subscription = platform.subscribe()
+        alice = AuctionParticipant(nickname="Alice", balance=500)
+        painting = Lot(name="Painting", minimum_bid=100)
+        vase = Lot(name="Vase", minimum_bid=10)
+        platform.add(alice, painting, vase)
+
+        platform.start_auction()
+        clock.advance(5)
+        platform.place_bid(alice, 150)
+        platform.pause_auction()
+        platform.end_auction()
+        platform.start_auction()
+        platform.end_auction()
+
+        events = subscription.drain()
+        self.assertEqual([(e.kind, e.lot_id, e.participant_id, e.amount) for e in events], [
+            ('lot_started', painting.lot_id, None, None),
+            ('bid_accepted', painting.lot_id, alice.participant_id, 150),
+            ('paused', painting.lot_id, None, None),
+            ('lot_sold', painting.lot_id, alice.participant_id, 150),
+            ('lot_started', vase.lot_id, None, None),
+            ('lot_unsold', vase.lot_id, None, None),
+        ])
+        self.assertEqual(events[1].timestamp, 5)
+
+    def test_unsubscribed_reader_gets_no_events(self):
+        platform = TradingPlatform(storage=MemoryStorage())
+        subscription = platform.subscribe()
+        platform.unsubscribe(subscription)
+        platform.add(AuctionParticipant(nickname="Alice", balance=500), Lot(name="Painting"))
+        platform.start_auction()
+        platform.end_auction()
+        self.assertEqual(subscription.drain(), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
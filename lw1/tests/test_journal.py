@@ -0,0 +1,93 @@
+import os
+import tempfile
+import unittest
+
+from auction import TradingPlatform, AuctionParticipant, Lot, Journal
+
+
+class TestJournal(unittest.TestCase):
+    def setUp(self):
+        self._dir = tempfile.TemporaryDirectory()
+        self.journal_path = os.path.join(self._dir.name, 'state.journal')
+        self.snapshot_path = os.path.join(self._dir.name, 'state.json')
+
+    def tearDown(self):
+        self._dir.cleanup()
+
+    def _journal(self, snapshot_every=1000):
+        return Journal(path=self.journal_path, snapshot_path=self.snapshot_path, snapshot_every=snapshot_every)
+
+    def test_save_appends_one_record_per_call(self):
+        platform = TradingPlatform(storage=self._journal())
+        platform.add(AuctionParticipant(nickname="Alice", balance=200.0))
+        platform.add(Lot(name="Painting", minimum_bid=100.0))
+        platform.add(Lot(name="Vase", minimum_bid=10.0))
+        platform._storage.close()
+        with open(self.journal_path) as f:
+            self.assertEqual(len(f.readlines()), 2)
+
+    def test_load_replays_snapshot_and_journal_tail(self):
+        platform = TradingPlatform(storage=self._journal())
+        participant = AuctionParticipant(nickname="Alice", balance=200.0)
+        lot = Lot(name="Painting", minimum_bid=100.0)
+        unsold = Lot(name="Vase", minimum_bid=10.0)
+        platform.add(participant, lot, unsold)
+        platform.timeout = 0.1
+        platform.start_auction()
+        platform.place_bid(participant, 150.0)
+        platform.end_auction()
+        platform._storage.close()
+
+        platform2 = TradingPlatform(load_on_init=True, storage=self._journal())
+        self.assertEqual([l.name for l in platform2.lots], ["Vase"])
+        self.assertEqual([l.name for l in platform2.sold_lots], ["Painting"])
+        self.assertEqual(platform2.participants[0].balance, 50.0)
+        self.assertEqual(platform2.participants[0].lots[0].name, "Painting")
+        self.assertEqual(platform2._timeout, 0.1)
+        platform2._storage.close()
+
+    def test_snapshot_truncates_journal(self):
+        platform = TradingPlatform(storage=self._journal(snapshot_every=2))
+        platform.add(Lot(name="Painting"))
+        platform.add(Lot(name="Vase"))
+        platform.add(Lot(name="Chair"))
+        platform.add(Lot(name="Table"))
+        platform._storage.close()
+        with open(self.journal_path) as f:
+            self.assertEqual(len(f.readlines()), 1)
+
+        platform2 = TradingPlatform(load_on_init=True, storage=self._journal())
+        self.assertEqual([l.name for l in platform2.lots], ["Painting", "Vase", "Chair", "Table"])
+        platform2._storage.close()
+
+    def test_load_ignores_torn_last_record(self):
+        platform = TradingPlatform(storage=self._journal())
+        platform.add(Lot(name="Painting"))
+        platform.add(Lot(name="Vase"))
+        platform._storage.close()
+        with open(self.journal_path, 'a') as f:
+            f.write('{"seq": 99, "ops": [["add_lot"')
+
+        platform2 = TradingPlatform(load_on_init=True, storage=self._journal())
+        self.assertEqual([l.name for l in platform2.lots], ["Painting", "Vase"])
+        platform2._storage.close()
+
+    def test_saves_after_torn_record_survive_reload(self):
+        platform = TradingPlatform(storage=self._journal())
+        platform.add(Lot(name="Painting"))
+        platform._storage.close()
+        with open(self.journal_path, 'a') as f:
+            f.write('{"seq": 99, "ops": [["add_lot"')
+
+        platform2 = TradingPlatform(load_on_init=True, storage=self._journal())
+        platform2.add(Lot(name="Vase"))
+        platform2.add(Lot(name="Clock"))
+        platform2._storage.close()
+
+        platform3 = TradingPlatform(load_on_init=True, storage=self._journal())
+        self.assertEqual([l.name for l in platform3.lots], ["Painting", "Vase", "Clock"])
+        platform3._storage.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
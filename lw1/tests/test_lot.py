@@ -43,5 +43,9 @@ class TestLot(unittest.TestCase):
         self.assertEqual(lot.minimum_bid, 100.0)
         self.assertEqual(lot.lot_id, 1)
 
+    def test_lot_has_no_instance_dict(self):
+        lot = Lot(name="Painting")
+        self.assertFalse(hasattr(lot, '__dict__'))
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
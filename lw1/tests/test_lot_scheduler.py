@@ -0,0 +1,149 @@
+import os
+import tempfile
+import unittest
+
+from auction import (TradingPlatform, AuctionParticipant, Lot, MemoryStorage, VirtualClock, LotScheduler,
+                     JsonStorage, Journal, SqliteStorage, BinarySnapshotStorage, DeferredStorage)
+
+
+class TestLotScheduler(unittest.TestCase):
+    def test_priority_then_fifo(self):
+        scheduler = LotScheduler()
+        for lot_id, priority in [(1, 0), (2, 5), (3, 0), (4, 5)]:
+            scheduler.push(lot_id, priority)
+        self.assertEqual(scheduler.lineup(0, 10), [2, 4, 1, 3])
+        self.assertEqual([scheduler.pop(0) for _ in range(5)], [2, 4, 1, 3, None])
+
+    def test_start_time(self):
+        scheduler = LotScheduler()
+        scheduler.push(1, start_at=100)
+        scheduler.push(2, priority=-1)
+        scheduler.push(3, priority=9, start_at=50)
+        self.assertEqual(scheduler.lineup(0), [2, 3, 1])
+        self.assertEqual(scheduler.pop(10), 2)
+        self.assertIsNone(scheduler.pop(10))
+        self.assertEqual(scheduler.next_start(10), 50)
+        self.assertEqual(scheduler.peek(60), 3)
+        self.assertEqual(scheduler.pop(100), 3)
+        self.assertEqual(scheduler.pop(100), 1)
+        self.assertIsNone(scheduler.next_start(100))
+
+    def test_reschedule_and_discard_leave_no_duplicates(self):
+        scheduler = LotScheduler()
+        for lot_id in range(100):
+            scheduler.push(lot_id)
+        for lot_id in range(100):
+            scheduler.push(lot_id, priority=lot_id % 3)
+        for lot_id in range(0, 100, 2):
+            scheduler.discard(lot_id)
+        popped = [scheduler.pop(0) for _ in range(len(scheduler))]
+        self.assertEqual(sorted(popped), list(range(1, 100, 2)))
+        self.assertEqual([lot_id % 3 for lot_id in popped], sorted((lot_id % 3 for lot_id in popped), reverse=True))
+        self.assertLessEqual(len(scheduler._ready), 2 * 100 + 16)
+
+    def test_relist_backoff_doubles(self):
+        scheduler = LotScheduler(relist_backoff=10, max_backoff=25)
+        scheduler.push(1, priority=3)
+        scheduler.pop(0)
+        self.assertEqual(scheduler.relist(1, 0), 10)
+        scheduler.pop(10)
+        self.assertEqual(scheduler.relist(1, 10), 30)
+        scheduler.pop(30)
+        self.assertEqual(scheduler.relist(1, 30), 55)
+        scheduler.push(2, priority=1)
+        self.assertEqual(scheduler.lineup(55), [1, 2])
+
+
+class TestPlatformSchedule(unittest.TestCase):
+    def setUp(self):
+        self.clock = VirtualClock()
+        self.platform = TradingPlatform(storage=MemoryStorage(), clock=self.clock)
+        self.bidder = AuctionParticipant(nickname="Alice", balance=1000)
+        self.lots = [Lot(name=f"Lot {i}", minimum_bid=10) for i in range(4)]
+        self.platform.add(self.bidder, *self.lots)
+
+    def test_lots_are_auctioned_by_priority(self):
+        platform = self.platform
+        platform.schedule(self.lots[2], priority=10)
+        platform.schedule(self.lots[0], start_at=100)
+        self.assertEqual(platform.lineup(), [self.lots[2], self.lots[1], self.lots[3], self.lots[0]])
+        platform.start_auction()
+        self.assertEqual(platform.current_lot, self.lots[2])
+        with self.assertRaises(ValueError):
+            platform.schedule(self.lots[2])
+
+    def test_waiting_lots_are_not_started_early(self):
+        platform = self.platform
+        for lot in self.lots:
+            platform.schedule(lot, start_at=100)
+        with self.assertRaises(ValueError):
+            platform.start_auction()
+        self.clock.advance(100)
+        platform.start_auction()
+        self.assertEqual(platform.current_lot, self.lots[0])
+
+    def test_unsold_lot_is_relisted_after_backoff(self):
+        platform = self.platform
+        platform.relist_backoff = 30
+        platform.remove(self.lots[1:])
+        platform.start_auction()
+        platform.end_auction()
+        self.assertEqual(platform.lots, [self.lots[0]])
+        with self.assertRaises(ValueError):
+            platform.start_auction()
+        self.clock.advance(30)
+        platform.start_auction()
+        self.assertEqual(platform.current_lot, self.lots[0])
+
+    def test_batch_rollback_restores_schedule(self):
+        platform = self.platform
+        platform.schedule(self.lots[3], priority=1)
+        with self.assertRaises(KeyError):
+            with platform.batch():
+                platform.remove(self.lots[3])
+                platform.add(Lot(name="Extra"))
+                raise KeyError
+        self.assertEqual(platform.lineup(), [self.lots[3], self.lots[0], self.lots[1], self.lots[2]])
+
+    def test_loaded_lots_keep_catalog_order(self):
+        storage = MemoryStorage()
+        platform = TradingPlatform(storage=storage)
+        platform.add(self.bidder, *self.lots)
+        platform.remove(self.lots[0])
+        loaded = TradingPlatform(load_on_init=True, storage=storage)
+        self.assertEqual(loaded.lineup(), self.lots[1:])
+
+    def test_schedule_survives_reload(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'state')
+            storages = {
+                'json': lambda: JsonStorage(path + '.json'),
+                'journal': lambda: Journal(path + '.journal', snapshot_path=path + '.json'),
+                'sqlite': lambda: SqliteStorage(path + '.db'),
+                'binary': lambda: BinarySnapshotStorage(path + '.bin'),
+                'deferred': lambda: DeferredStorage(JsonStorage(path + '.deferred.json')),
+            }
+            for name, make_storage in storages.items():
+                with self.subTest(storage=name):
+                    storage = make_storage()
+                    platform = TradingPlatform(storage=storage, clock=VirtualClock())
+                    lots = [Lot(name=f"Lot {i}") for i in range(4)]
+                    platform.add(self.bidder, *lots)
+                    platform.schedule(lots[3], priority=2)
+                    platform.schedule(lots[1], start_at=100)
+                    platform.schedule(lots[0], priority=0)
+                    platform.flush()
+                    storage.close()
+
+                    storage = make_storage()
+                    clock = VirtualClock()
+                    loaded = TradingPlatform(load_on_init=True, storage=storage, clock=clock)
+                    self.assertEqual([lot.lot_id for lot in loaded.lineup()],
+                                     [lots[3].lot_id, lots[2].lot_id, lots[0].lot_id, lots[1].lot_id])
+                    self.assertEqual(loaded._schedule.get(lots[3].lot_id), (2, None))
+                    self.assertAlmostEqual(loaded._schedule.get(lots[1].lot_id)[1], 100, delta=1)
+                    storage.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
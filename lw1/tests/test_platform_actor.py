@@ -0,0 +1,61 @@
+import os
+import tempfile
+import threading
+import unittest
+
+from auction import TradingPlatform, PlatformActor, AuctionParticipant, Lot, JsonStorage
+
+
+class TestPlatformActor(unittest.TestCase):
+    def setUp(self):
+        self._dir = tempfile.TemporaryDirectory()
+        self.platform = TradingPlatform(storage=JsonStorage(os.path.join(self._dir.name, 'state.json')))
+        self.alice = AuctionParticipant(nickname="Alice", balance=500)
+        self.lot = Lot(name="Painting", minimum_bid=100)
+        self.platform.add(self.alice, self.lot)
+        self.platform.timeout = 5
+        self.actor = PlatformActor(self.platform)
+
+    def tearDown(self):
+        self.actor.stop()
+        self._dir.cleanup()
+
+    def test_commands_run_on_writer_thread(self):
+        threads = []
+        future = self.actor.submit(lambda: threads.append(threading.current_thread()))
+        future.result(timeout=1)
+        self.assertIsNot(threads[0], threading.current_thread())
+
+    def test_bids_are_applied_in_order(self):
+        self.actor.start_auction().result(timeout=1)
+        futures = [self.actor.place_bid(self.alice, amount) for amount in range(100, 200)]
+        for future in futures:
+            future.result(timeout=1)
+        self.assertEqual(self.platform.current_bid.amount, 199)
+        self.actor.end_auction().result(timeout=1)
+        self.assertEqual(self.alice.balance, 301)
+
+    def test_future_carries_exception(self):
+        self.actor.start_auction().result(timeout=1)
+        with self.assertRaises(ValueError):
+            self.actor.place_bid(self.alice, 1000).result(timeout=1)
+
+    def test_timer_expiration_is_posted_to_queue(self):
+        self.actor.submit(setattr, self.platform, 'timeout', 0.01).result(timeout=1)
+        self.actor.start_auction().result(timeout=1)
+        self.platform._timer._timer.join(timeout=1)
+        self.actor.submit(lambda: None).result(timeout=1)
+        self.assertEqual(self.platform.state, 'preparing_for_auction')
+
+    def test_latency_stats(self):
+        for _ in range(10):
+            self.actor.submit(lambda: None)
+        self.actor.submit(lambda: None).result(timeout=1)
+        stats = self.actor.latency_stats()
+        self.assertEqual(stats['count'], 11)
+        self.assertGreaterEqual(stats['max'], stats['p50'])
+        self.assertEqual(self.actor.queue_depth, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
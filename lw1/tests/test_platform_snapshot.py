@@ -0,0 +1,172 @@
+import random
+import threading
+import unittest
+
+from auction import (TradingPlatform, AuctionParticipant, Lot, MemoryStorage, VirtualClock, PersistentMap,
+                     ParticipantView, BidView)
+
+
+class TestPersistentMap(unittest.TestCase):
+    def test_matches_dict(self):
+        rng = random.Random(3)
+        expected = {}
+        index = PersistentMap()
+        versions = []
+        for _ in range(3000):
+            key = rng.randrange(5000)
+            if rng.random() < 0.3:
+                expected.pop(key, None)
+                index = index.delete(key)
+            else:
+                expected[key] = rng.random()
+                index = index.set(key, expected[key])
+            versions.append((index, dict(expected)))
+        self.assertEqual(len(index), len(expected))
+        self.assertEqual(index.items(), sorted(expected.items()))
+        for old_index, old_expected in versions[::300]:
+            self.assertEqual(dict(old_index.items()), old_expected)
+
+    def test_bulk_build(self):
+        items = [(key, str(key)) for key in (70000, 5, 31, 32, 1024)]
+        index = PersistentMap(items)
+        self.assertEqual(list(index), [5, 31, 32, 1024, 70000])
+        self.assertEqual(index[1024], '1024')
+        self.assertNotIn(6, index)
+        self.assertNotIn(10 ** 9, index)
+        self.assertIsNone(index.get(-1))
+        with self.assertRaises(KeyError):
+            index[6]
+
+    def test_structural_sharing(self):
+        index = PersistentMap((key, key) for key in range(10000))
+        changed = index.set(5000, -1)
+        self.assertEqual((index[5000], changed[5000]), (5000, -1))
+        shared = sum(a is b for a, b in zip(index._root, changed._root))
+        self.assertEqual(shared, len(index._root) - 1)
+        self.assertIs(index.delete(20000), index)
+        self.assertEqual(len(index.delete(0)), 9999)
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            PersistentMap().set(-1, 'x')
+        with self.assertRaises(ValueError):
+            PersistentMap().set(1, None)
+
+
+class TestPlatformSnapshot(unittest.TestCase):
+    def setUp(self):
+        self.clock = VirtualClock()
+        self.platform = TradingPlatform(storage=MemoryStorage(), clock=self.clock)
+        self.alice = AuctionParticipant('alice', 500)
+        self.bob = AuctionParticipant('bob', 500)
+        self.lots = [Lot(f'lot {i}', minimum_bid=10) for i in range(3)]
+        self.platform.add(self.alice, self.bob, self.lots)
+
+    def test_auction_lifecycle(self):
+        platform = self.platform
+        before = platform.snapshot()
+        self.assertEqual(before.state, 'preparing_for_auction')
+        self.assertEqual(list(before.lots), [lot.lot_id for lot in self.lots])
+        self.assertEqual(before.participants[self.alice.participant_id],
+                         ParticipantView(self.alice.participant_id, 'alice', 500, ()))
+
+        platform.start_auction()
+        platform.place_bid(self.alice, 100)
+        bidding = platform.snapshot()
+        self.assertEqual(bidding.state, 'accepting_bids')
+        self.assertEqual(bidding.current_lot, self.lots[0])
+        self.assertEqual(bidding.current_bid, BidView(100, self.alice.participant_id))
+        self.assertNotIn(self.lots[0].lot_id, bidding.lots)
+        self.assertGreater(bidding.version, before.version)
+
+        platform.end_auction()
+        after = platform.snapshot()
+        self.assertIsNone(after.current_bid)
+        self.assertEqual(after.participants[self.alice.participant_id].balance, 400)
+        self.assertEqual(after.participants[self.alice.participant_id].lot_ids, (self.lots[0].lot_id,))
+        self.assertEqual(list(after.sold_lots), [self.lots[0].lot_id])
+        self.assertIs(after.lots, bidding.lots)
+        self.assertIs(after.participants.get(self.bob.participant_id),
+                      bidding.participants.get(self.bob.participant_id))
+        # the earlier versions are unaffected
+        self.assertEqual(before.participants[self.alice.participant_id].balance, 500)
+        self.assertEqual(len(bidding.sold_lots), 0)
+
+    def test_pause_and_unsold_lot(self):
+        platform = self.platform
+        platform.snapshot()
+        platform.start_auction()
+        platform.pause_auction()
+        self.assertEqual(platform.snapshot().state, 'auction_paused')
+        platform.end_auction()
+        snapshot = platform.snapshot()
+        self.assertIn(self.lots[0].lot_id, snapshot.lots)
+        self.assertEqual(len(snapshot.sold_lots), 0)
+
+    def test_remove_participant_drops_sold_lots(self):
+        platform = self.platform
+        platform.snapshot()
+        platform.start_auction()
+        platform.place_bid(self.bob, 50)
+        platform.end_auction()
+        platform.remove(self.bob)
+        snapshot = platform.snapshot()
+        self.assertNotIn(self.bob.participant_id, snapshot.participants)
+        self.assertEqual(len(snapshot.sold_lots), 0)
+
+    def test_failed_batch_publishes_nothing(self):
+        platform = self.platform
+        snapshot = platform.snapshot()
+        with self.assertRaises(RuntimeError):
+            with platform.batch():
+                platform.add(Lot('extra'))
+                raise RuntimeError('abort')
+        self.assertIs(platform.snapshot(), snapshot)
+        with platform.batch():
+            extra = Lot('extra')
+            platform.add(extra)
+            platform.remove(self.lots[1])
+        snapshot = platform.snapshot()
+        self.assertIn(extra.lot_id, snapshot.lots)
+        self.assertNotIn(self.lots[1].lot_id, snapshot.lots)
+
+    def test_reader_thread_sees_consistent_versions(self):
+        platform = TradingPlatform(storage=MemoryStorage())
+        participants = [AuctionParticipant(f'p{i}', 10 ** 6) for i in range(5)]
+        lots = [Lot(f'lot {i}') for i in range(50)]
+        platform.add(participants, lots)
+        platform.snapshot()
+        stop = threading.Event()
+        errors = []
+
+        def read():
+            version = 0
+            while not stop.is_set():
+                snapshot = platform.snapshot()
+                if snapshot.version < version:
+                    errors.append('version went back')
+                version = snapshot.version
+                pending = set(snapshot.lots)
+                sold = set(snapshot.sold_lots)
+                owned = {lot_id for view in snapshot.participants.values() for lot_id in view.lot_ids}
+                current = {snapshot.current_lot.lot_id} if snapshot.current_lot is not None else set()
+                if pending & sold or owned != sold or len(pending | sold | current) != len(lots):
+                    errors.append(f'torn snapshot {snapshot.version}')
+
+        reader = threading.Thread(target=read)
+        reader.start()
+        try:
+            for i in range(len(lots)):
+                platform.start_auction()
+                for amount in range(1, 20):
+                    platform.place_bid(participants[(i + amount) % 5], amount)
+                platform.end_auction()
+        finally:
+            stop.set()
+            reader.join()
+        self.assertEqual(errors, [])
+        self.assertEqual(len(platform.snapshot().sold_lots), len(lots))
+
+
+if __name__ == '__main__':
+    unittest.main()
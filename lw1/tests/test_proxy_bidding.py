@@ -0,0 +1,130 @@
+import unittest
+
+from auction import ProxyBook, TradingPlatform, AuctionParticipant, Lot
+
+
+class TestProxyBook(unittest.TestCase):
+    def setUp(self):
+        self.alice = AuctionParticipant(nickname="Alice", balance=1000)
+        self.bob = AuctionParticipant(nickname="Bob", balance=1000)
+        self.carol = AuctionParticipant(nickname="Carol", balance=1000)
+        self.book = ProxyBook(increment=5)
+
+    def test_single_proxy_bids_minimum(self):
+        self.book.submit(self.alice, 300)
+        self.assertEqual(self.book.resolve(0, None, 100), (self.alice, 100))
+
+    def test_price_is_one_increment_above_second_maximum(self):
+        self.book.submit(self.alice, 300)
+        self.book.submit(self.bob, 200)
+        self.assertEqual(self.book.resolve(0, None, 100), (self.alice, 205))
+
+    def test_opening_price_beats_zero_current_amount(self):
+        self.book.submit(self.alice, 300)
+        self.assertEqual(self.book.resolve(0, None, 0), (self.alice, 5))
+
+    def test_price_is_capped_by_leader_maximum(self):
+        self.book.submit(self.alice, 300)
+        self.book.submit(self.bob, 298)
+        self.assertEqual(self.book.resolve(0, None, 100), (self.alice, 300))
+
+    def test_earliest_proxy_wins_ties(self):
+        self.book.submit(self.alice, 300)
+        self.book.submit(self.bob, 300)
+        self.assertEqual(self.book.resolve(0, None, 100), (self.alice, 300))
+
+    def test_raised_maximum_replaces_previous(self):
+        self.book.submit(self.alice, 300)
+        self.book.submit(self.bob, 400)
+        self.book.submit(self.alice, 500)
+        self.assertEqual(self.book.resolve(0, None, 100), (self.alice, 405))
+        with self.assertRaises(ValueError):
+            self.book.submit(self.alice, 450)
+
+    def test_standing_bid_is_not_outbid_by_lower_proxy(self):
+        self.book.submit(self.alice, 300)
+        self.assertIsNone(self.book.resolve(300, self.carol, 100))
+        self.assertEqual(self.book.resolve(250, self.carol, 100), (self.alice, 255))
+
+    def test_leader_is_raised_only_when_challenged(self):
+        self.book.submit(self.alice, 300)
+        self.assertIsNone(self.book.resolve(100, self.alice, 100))
+        self.book.submit(self.bob, 150)
+        self.assertEqual(self.book.resolve(100, self.alice, 100), (self.alice, 155))
+
+
+class TestPlatformProxyBidding(unittest.TestCase):
+    def setUp(self):
+        self.platform = TradingPlatform()
+        self.alice = AuctionParticipant(nickname="Alice", balance=500)
+        self.bob = AuctionParticipant(nickname="Bob", balance=500)
+        self.lot = Lot(name="Painting", minimum_bid=100)
+        self.platform.add(self.alice, self.bob, self.lot)
+        self.platform.timeout = 0.1
+        self.platform.bid_increment = 10
+        self.platform.start_auction()
+
+    def test_proxies_resolve_bidding_war_in_one_step(self):
+        self.platform.place_proxy_bid(self.alice, 300)
+        self.assertEqual(self.platform.current_bid.amount, 100)
+        self.platform.place_proxy_bid(self.bob, 400)
+        self.assertEqual(self.platform.current_bid.participant, self.bob)
+        self.assertEqual(self.platform.current_bid.amount, 310)
+        self.assertEqual(len(self.platform.bid_history(self.lot.lot_id)), 2)
+
+    def test_direct_bid_is_answered_by_proxy(self):
+        self.platform.place_proxy_bid(self.alice, 300)
+        self.platform.place_bid(self.bob, 200)
+        self.assertEqual(self.platform.current_bid.participant, self.alice)
+        self.assertEqual(self.platform.current_bid.amount, 210)
+
+    def test_direct_bid_above_proxy_wins(self):
+        self.platform.place_proxy_bid(self.alice, 300)
+        self.platform.place_bid(self.bob, 350)
+        self.assertEqual(self.platform.current_bid.participant, self.bob)
+        self.assertEqual(self.platform.current_bid.amount, 350)
+
+    def test_proxy_exceeding_balance_raises_error(self):
+        with self.assertRaises(ValueError):
+            self.platform.place_proxy_bid(self.alice, 600)
+
+    def test_end_auction_sells_at_proxy_price(self):
+        self.platform.place_proxy_bid(self.alice, 300)
+        self.platform.place_proxy_bid(self.bob, 250)
+        self.platform.end_auction()
+        self.assertEqual(self.alice.balance, 240)
+        self.assertIsNone(self.platform._proxy_book)
+
+    def test_proxy_bid_on_lot_without_minimum_bid(self):
+        platform = TradingPlatform()
+        lot = Lot(name="Postcard")
+        platform.add(self.alice, self.bob, lot)
+        platform.start_auction()
+        platform.place_proxy_bid(self.alice, 50)
+        self.assertEqual(platform.current_bid.amount, 1)
+        self.assertEqual(platform.current_bid.participant, self.alice)
+        platform.place_proxy_bid(self.bob, 30)
+        self.assertEqual((platform.current_bid.participant, platform.current_bid.amount), (self.alice, 31))
+        platform._timer.cancel()
+
+    def test_failed_proxy_bid_leaves_book_unchanged(self):
+        self.platform.place_proxy_bid(self.alice, 300)
+        book = self.platform._proxy_book
+        book.resolve = lambda *args: (self.bob, self.platform.current_bid.amount)
+        with self.assertRaises(ValueError):
+            self.platform.place_proxy_bid(self.bob, 400)
+        self.assertIsNone(book.maximum(self.bob))
+        self.assertEqual(book.maximum(self.alice), 300)
+
+    def test_proxy_bid_without_bid_log_syncs_no_sequence(self):
+        synced = []
+        self.platform._sync_bids = synced.append
+        self.assertIsNone(self.platform._apply_proxies())
+        self.platform.place_proxy_bid(self.alice, 300)
+        self.platform.place_bid(self.bob, 200)
+        self.assertEqual(synced, [0, 0])
+        self.assertEqual(self.platform.current_bid.amount, 210)
+
+
+if __name__ == "__main__":
+    unittest.main()
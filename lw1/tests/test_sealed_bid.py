@@ -0,0 +1,130 @@
+import random
+import unittest
+
+from auction import TradingPlatform, AuctionParticipant, Lot, MemoryStorage, VirtualClock
+from auction.sealed_bid import SealedBidAuction, FIRST_PRICE, SECOND_PRICE, np
+
+
+def reference_clearing(lots, balances, bids, pricing):
+    """Clears a round one lot at a time, as the vectorized pass is specified to."""
+    latest = {}
+    for seq, (lot_id, participant_id, amount) in enumerate(bids):
+        latest[lot_id, participant_id] = (amount, seq)
+    alive = {key: value for key, value in latest.items()}
+    while True:
+        winners = {}
+        for lot_id, minimum in lots.items():
+            ranked = sorted(((amount, -seq, pid) for (lid, pid), (amount, seq) in alive.items() if lid == lot_id),
+                            reverse=True)
+            if not ranked:
+                continue
+            amount, _, pid = ranked[0]
+            if pricing == FIRST_PRICE:
+                price = amount
+            else:
+                price = max(ranked[1][0], minimum) if len(ranked) > 1 else minimum
+            winners[lot_id] = (pid, price)
+        dropped = False
+        for pid, balance in balances.items():
+            wins = sorted(((price, -lot_id, lot_id) for lot_id, (winner, price) in winners.items() if winner == pid),
+                          reverse=True)
+            spent = 0
+            for price, _, lot_id in wins:
+                spent += price
+                if spent > balance:
+                    del alive[lot_id, pid]
+                    dropped = True
+                    break
+        if not dropped:
+            return winners
+
+
+@unittest.skipIf(np is None, 'numpy is not installed')
+class TestSealedBidAuction(unittest.TestCase):
+    def setUp(self):
+        self.clock = VirtualClock()
+        self.storage = MemoryStorage()
+        self.platform = TradingPlatform(storage=self.storage, clock=self.clock)
+        self.alice = AuctionParticipant(nickname="Alice", balance=500)
+        self.bob = AuctionParticipant(nickname="Bob", balance=300)
+        self.carol = AuctionParticipant(nickname="Carol", balance=1000)
+        self.lots = [Lot(name=f"Lot {i}", minimum_bid=50) for i in range(3)]
+        self.platform.add(self.alice, self.bob, self.carol, *self.lots)
+
+    def test_second_price(self):
+        auction = SealedBidAuction(self.platform, SECOND_PRICE)
+        auction.open()
+        first, second, third = (lot.lot_id for lot in self.lots)
+        auction.submit(self.alice, first, 200)
+        auction.submit(self.bob, first, 150)
+        auction.submit(self.bob, first, 120)
+        auction.submit(self.carol, second, 80)
+        saves = self.storage.saves
+        results = {r.lot.lot_id: (r.winner, r.price) for r in auction.clear()}
+        self.assertEqual(self.storage.saves, saves + 1)
+        self.assertEqual(results[first], (self.alice, 120))
+        self.assertEqual(results[second], (self.carol, 50))
+        self.assertEqual(results[third], (None, None))
+        self.assertEqual((self.alice.balance, self.carol.balance), (380, 950))
+        self.assertEqual(self.platform.lots, [self.lots[2]])
+        self.assertEqual(len(self.platform.bid_history(first)), 3)
+
+    def test_first_price_and_balance_feasibility(self):
+        auction = SealedBidAuction(self.platform, FIRST_PRICE)
+        auction.open(self.lots[:2])
+        first, second = self.lots[0].lot_id, self.lots[1].lot_id
+        results = auction.submit_many([(self.alice, first, 400), (self.alice, second, 300), (self.bob, second, 250),
+                                       (self.bob, first, 301), (self.carol, self.lots[2].lot_id, 100)])
+        self.assertEqual([r.accepted for r in results], [True, True, True, False, False])
+        outcome = {r.lot.lot_id: (r.winner, r.price) for r in auction.clear()}
+        # Alice cannot pay 700: her cheaper win goes to the next bidder
+        self.assertEqual(outcome, {first: (self.alice, 400), second: (self.bob, 250)})
+        self.assertEqual((self.alice.balance, self.bob.balance), (100, 50))
+
+    def test_window_clears_the_round(self):
+        auction = SealedBidAuction(self.platform)
+        auction.open(window=30)
+        auction.submit(self.bob, self.lots[0].lot_id, 60)
+        self.clock.advance(30)
+        self.assertFalse(auction.is_open)
+        self.assertEqual(self.platform.sold_lots, [self.lots[0]])
+        with self.assertRaises(ValueError):
+            auction.submit(self.bob, self.lots[1].lot_id, 60)
+
+    def test_matches_reference_clearing(self):
+        rng = random.Random(3)
+        for pricing in (FIRST_PRICE, SECOND_PRICE):
+            platform = TradingPlatform(storage=MemoryStorage(keep_state=False))
+            participants = [AuctionParticipant(nickname=f"p{i}", balance=rng.randrange(100, 2000)) for i in range(15)]
+            lots = [Lot(name=f"l{i}", minimum_bid=rng.randrange(1, 50)) for i in range(25)]
+            platform.add(participants, lots)
+            balances = {p.participant_id: p.balance for p in participants}
+            auction = SealedBidAuction(platform, pricing)
+            auction.open()
+            bids = []
+            for _ in range(300):
+                participant, lot = rng.choice(participants), rng.choice(lots)
+                amount = rng.randrange(lot.minimum_bid, participant.balance + 1)
+                auction.submit(participant, lot.lot_id, amount)
+                bids.append((lot.lot_id, participant.participant_id, amount))
+            expected = reference_clearing({lot.lot_id: lot.minimum_bid for lot in lots}, balances, bids, pricing)
+            outcome = {r.lot.lot_id: (r.winner.participant_id, r.price) for r in auction.clear() if r.winner}
+            self.assertEqual(outcome, expected)
+
+    def test_rejects_invalid_bids(self):
+        auction = SealedBidAuction(self.platform)
+        with self.assertRaises(ValueError):
+            auction.submit(self.alice, self.lots[0].lot_id, 100)
+        auction.open(self.lots[:1])
+        with self.assertRaises(ValueError):
+            auction.submit(self.alice, self.lots[1].lot_id, 100)
+        with self.assertRaises(ValueError):
+            auction.submit(self.alice, self.lots[0].lot_id, 10)
+        with self.assertRaises(ValueError):
+            auction.submit(self.bob, self.lots[0].lot_id, 301)
+        with self.assertRaises(RuntimeError):
+            auction.open()
+
+
+if __name__ == '__main__':
+    unittest.main()
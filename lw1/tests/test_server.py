@@ -0,0 +1,64 @@
+import asyncio
+import json
+import unittest
+
+from auction import AsyncTradingPlatform, BidServer, MemoryStorage
+
+
+class TestBidServer(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.platform = AsyncTradingPlatform(storage=MemoryStorage())
+        self.server = BidServer(self.platform)
+        host, port = await self.server.start()
+        self.reader, self.writer = await asyncio.open_connection(host, port)
+
+    async def asyncTearDown(self):
+        self.writer.close()
+        await self.writer.wait_closed()
+        await self.server.close()
+        await self.platform.close()
+
+    async def request(self, op, **arguments):
+        self.writer.write(json.dumps(dict(arguments, op=op, id=op)).encode() + b'\n')
+        await self.writer.drain()
+        response = json.loads(await self.reader.readline())
+        self.assertEqual(response['id'], op)
+        return response
+
+    async def test_auction_lifecycle(self):
+        alice = (await self.request('add_participant', nickname="Alice", balance=500))['result']
+        lot = (await self.request('add_lot', name="Painting", minimum_bid=100))['result']
+        self.assertEqual([l['lot_id'] for l in (await self.request('lots'))['result']], [lot])
+        self.assertTrue((await self.request('start_auction'))['ok'])
+        self.assertEqual((await self.request('state'))['result'], 'accepting_bids')
+
+        response = await self.request('place_bid', participant_id=alice, amount=150)
+        self.assertTrue(response['ok'])
+        self.assertEqual(response['result']['amount'], 150)
+        self.assertEqual((await self.request('current_bid'))['result']['participant_id'], alice)
+
+        await self.request('end_auction')
+        participants = (await self.request('participants'))['result']
+        self.assertEqual(participants[0]['balance'], 350)
+        self.assertIsNone((await self.request('current_bid'))['result'])
+
+    async def test_rejected_bid_reports_error(self):
+        alice = (await self.request('add_participant', nickname="Alice", balance=500))['result']
+        await self.request('add_lot', name="Painting", minimum_bid=100)
+        await self.request('start_auction')
+        response = await self.request('place_bid', participant_id=alice, amount=1000)
+        self.assertFalse(response['ok'])
+        self.assertEqual(response['error'], "Bid amount exceeds participant balance")
+        await self.request('end_auction')
+
+    async def test_invalid_requests_keep_connection_open(self):
+        self.assertFalse((await self.request('unknown'))['ok'])
+        self.assertFalse((await self.request('place_bid', participant_id=12345, amount=1))['ok'])
+        self.assertFalse((await self.request('add_lot', colour="red"))['ok'])
+        self.writer.write(b'not json\n')
+        self.assertFalse(json.loads(await self.reader.readline())['ok'])
+        self.assertEqual((await self.request('state'))['result'], 'preparing_for_auction')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,101 @@
+import unittest
+
+from auction import (TradingPlatform, AuctionHouse, AuctionParticipant, Lot, MemoryStorage, ShardedAuction,
+                     BalanceCoordinator)
+
+
+class TestBalanceCoordinator(unittest.TestCase):
+    def test_holds_do_not_exceed_balance(self):
+        coordinator = BalanceCoordinator()
+        coordinator.register(1, 100)
+        self.assertTrue(coordinator.reserve(1, 10, 60))
+        self.assertFalse(coordinator.reserve(1, 11, 50))
+        self.assertTrue(coordinator.reserve(1, 10, 70))
+        self.assertTrue(coordinator.reserve(1, 11, 30))
+        self.assertEqual(coordinator.reserved(1), 100)
+        self.assertFalse(coordinator.reserve(2, 10, 1))
+
+    def test_settle_charges_the_hold(self):
+        coordinator = BalanceCoordinator()
+        coordinator.register(1, 100)
+        coordinator.reserve(1, 10, 60)
+        coordinator.reserve(1, 11, 30)
+        self.assertEqual(coordinator.settle(1, 10), 40)
+        self.assertEqual(coordinator.release(1, 11), 30)
+        self.assertIsNone(coordinator.settle(1, 11))
+        self.assertEqual(coordinator.reserved(1), 0)
+        self.assertEqual(coordinator.balances(), {1: 40})
+
+
+class TestAuctionHouseBatches(unittest.TestCase):
+    def test_place_bids_reserves_the_best_affordable_bid(self):
+        platform = TradingPlatform(storage=MemoryStorage())
+        alice = AuctionParticipant(nickname="Alice", balance=100)
+        bob = AuctionParticipant(nickname="Bob", balance=300)
+        first, second = Lot(name="First"), Lot(name="Second")
+        platform.add(alice, bob, first, second)
+        house = AuctionHouse(platform)
+        house.start_auction(first.lot_id)
+        house.start_auction(second.lot_id)
+        house.place_bid(first.lot_id, bob, 250)
+
+        results = house.place_bids(second.lot_id, [(alice, 50), (alice, 40), (bob, 90), (alice, 95)])
+        self.assertEqual([r.accepted for r in results], [True, False, True, True])
+        self.assertEqual(house.current_bid(second.lot_id).participant, alice)
+
+        results = house.place_bids(second.lot_id, [(alice, 99), (bob, 120)])
+        self.assertEqual([r.accepted for r in results], [True, False])
+        self.assertEqual(results[1].reason, "Bid amount exceeds participant balance")
+        self.assertEqual(house.current_bid(second.lot_id).amount, 99)
+        self.assertEqual(len(platform.bid_history(second.lot_id)), 4)
+        house.end_all()
+        self.assertEqual((alice.balance, bob.balance), (1, 50))
+        self.assertEqual(house._funds.reserved(alice), 0)
+
+
+class TestShardedAuction(unittest.TestCase):
+    def test_shards_share_balances(self):
+        alice = AuctionParticipant(nickname="Alice", balance=100)
+        bob = AuctionParticipant(nickname="Bob", balance=1000)
+        lots = [Lot(name=f"Lot {i}", minimum_bid=1) for i in range(4)]
+        with ShardedAuction(shards=2, timeout=60) as auction:
+            auction.add(alice, bob, lots)
+            self.assertEqual(sorted(auction.start_all()), [lot.lot_id for lot in lots])
+            self.assertNotEqual(auction.shard_of(lots[0].lot_id), auction.shard_of(lots[1].lot_id))
+
+            auction.place_bid(lots[0].lot_id, alice.participant_id, 70)
+            with self.assertRaises(ValueError):
+                auction.place_bid(lots[1].lot_id, alice.participant_id, 40)
+            results = auction.place_bids([(lots[1].lot_id, alice.participant_id, 30),
+                                          (lots[2].lot_id, alice.participant_id, 10),
+                                          (lots[2].lot_id, bob.participant_id, 20),
+                                          (lots[3].lot_id, -1, 5)])
+            self.assertEqual([r.accepted for r in results], [True, True, True, False])
+            self.assertEqual(auction.current_bid(lots[2].lot_id), (20, bob.participant_id))
+
+            winners = auction.end_all()
+            self.assertEqual(winners, {lots[0].lot_id: alice.participant_id, lots[1].lot_id: alice.participant_id,
+                                       lots[2].lot_id: bob.participant_id, lots[3].lot_id: None})
+            self.assertEqual(auction.balance(alice.participant_id), 0)
+            self.assertEqual(auction.balance(bob.participant_id), 980)
+
+    def test_shard_survives_malformed_commands(self):
+        alice = AuctionParticipant(nickname="Alice", balance=100)
+        lot = Lot(name="Painting", minimum_bid=1)
+        with ShardedAuction(shards=1, timeout=60) as auction:
+            auction.add(alice, lot)
+            with self.assertRaises(ValueError):
+                auction._call(0, 'no_such_command')
+            with self.assertRaises(ValueError):
+                auction._call(0, '_house')
+            with self.assertRaises(RuntimeError):
+                auction._call(0, 'place_bid', lot.lot_id)
+            with self.assertRaises(ValueError):
+                auction._scatter({0: ('place_bid',)})
+            self.assertEqual(auction.start_all(), [lot.lot_id])
+            auction.place_bid(lot.lot_id, alice.participant_id, 10)
+            self.assertEqual(auction.current_bid(lot.lot_id), (10, alice.participant_id))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,57 @@
+import unittest
+
+from auction import (TradingPlatform, AuctionParticipant, Lot, MemoryStorage, VirtualClock, Simulation,
+                     synthetic_bids)
+
+
+class TestSimulation(unittest.TestCase):
+    def _platform(self, lots=3):
+        platform = TradingPlatform(storage=MemoryStorage(keep_state=False), clock=VirtualClock())
+        self.alice = AuctionParticipant(nickname="Alice", balance=1000)
+        self.bob = AuctionParticipant(nickname="Bob", balance=1000)
+        platform.add(self.alice, self.bob, [Lot(name=f"Lot {i}", minimum_bid=100) for i in range(lots)])
+        return platform
+
+    def test_replay_closes_lots_at_their_deadlines(self):
+        platform = self._platform()
+        bids = [
+            (10, self.alice, 100),
+            (20, self.bob.participant_id, 120),
+            (190, self.alice, None),    # the first lot closed at 80, the second one unsold at 140
+        ]
+        report = Simulation(platform).run(bids)
+        self.assertEqual(report.auctions, 3)
+        self.assertEqual(report.sold, 2)
+        self.assertEqual(report.unsold, 1)
+        self.assertEqual(report.bids_accepted, 3)
+        self.assertEqual(report.simulated_time, 250)
+        self.assertEqual(self.bob.balance, 880)
+        self.assertEqual(self.alice.balance, 900)
+
+    def test_rejected_bids_are_counted(self):
+        platform = self._platform(lots=1)
+        report = Simulation(platform).run([(1, self.alice, 5000), (2, 10 ** 9, 200), (3, self.bob, 150)])
+        self.assertEqual(report.bids_rejected, 2)
+        self.assertEqual(report.sold, 1)
+
+    def test_max_auctions_stops_the_run(self):
+        platform = self._platform(lots=5)
+        report = Simulation(platform).run(synthetic_bids([self.alice, self.bob], rate=0.01, duration=10 ** 6, seed=1),
+                                          max_auctions=2)
+        self.assertEqual(report.auctions, 2)
+        self.assertEqual(report.sold + report.unsold, 2)
+
+    def test_synthetic_stream_is_reproducible(self):
+        participants = [AuctionParticipant(nickname=f"P{i}", balance=100) for i in range(3)]
+        first = list(synthetic_bids(participants, rate=1, duration=100, seed=7))
+        second = list(synthetic_bids(participants, rate=1, duration=100, seed=7))
+        self.assertEqual(first, second)
+        self.assertTrue(all(a[0] <= b[0] for a, b in zip(first, first[1:])))
+
+    def test_platform_without_virtual_clock_is_rejected(self):
+        with self.assertRaises(ValueError):
+            Simulation(TradingPlatform(storage=MemoryStorage()))
+
+
+if __name__ == '__main__':
+    unittest.main()
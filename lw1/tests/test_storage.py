@@ -0,0 +1,136 @@
+import json
+import os
+import sqlite3
+import tempfile
+import unittest
+
+from auction import TradingPlatform, AuctionParticipant, Lot, JsonStorage, SqliteStorage, migrate_state_data
+
+
+class TestJsonStorage(unittest.TestCase):
+    def setUp(self):
+        self._dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self._dir.name, 'state.json')
+
+    def tearDown(self):
+        self._dir.cleanup()
+
+    def test_save_does_not_leave_temporary_file(self):
+        platform = TradingPlatform(storage=JsonStorage(self.path))
+        platform.add(Lot(name="Painting"))
+        self.assertEqual(os.listdir(self._dir.name), ['state.json'])
+
+    def test_load_missing_file_returns_none(self):
+        self.assertIsNone(JsonStorage(self.path).load())
+
+    def test_sold_lots_are_stored_once(self):
+        platform = TradingPlatform(storage=JsonStorage(self.path))
+        participant = AuctionParticipant(nickname="Alice", balance=200.0)
+        lot = Lot(name="Painting", minimum_bid=100.0)
+        platform.add(participant, lot)
+        platform.timeout = 0.1
+        platform.start_auction()
+        platform.place_bid(participant, 150.0)
+        platform.end_auction()
+        with open(self.path) as f:
+            state_data = json.load(f)
+        self.assertEqual(state_data['schema'], 2)
+        self.assertEqual(state_data['participants'][0]['lot_ids'], [lot.lot_id])
+        self.assertNotIn('lots', state_data['participants'][0])
+        self.assertEqual([l['lot_id'] for l in state_data['sold_lots']], [lot.lot_id])
+
+    def test_load_legacy_layout(self):
+        legacy = {
+            'participants_counter': 3,
+            'lot_counter': 8,
+            'timeout': 60,
+            'participants': [{'nickname': "Alice", 'balance': 50.0, 'participant_id': 2,
+                              'lots': [{'name': "Painting", 'description': None, 'minimum_bid': 100.0,
+                                        'lot_id': 7}]}],
+            'lots': [],
+            'sold_lots': [{'name': "Painting", 'description': None, 'minimum_bid': 100.0, 'lot_id': 7}]
+        }
+        with open(self.path, 'w') as f:
+            json.dump(legacy, f)
+        platform = TradingPlatform(load_on_init=True, storage=JsonStorage(self.path))
+        self.assertEqual([l.lot_id for l in platform.participants[0].lots], [7])
+        self.assertIs(platform.participants[0].lots[0], platform.sold_lots[0])
+
+    def test_migrate_state_data_keeps_lots_missing_from_sold_lots(self):
+        lot = {'name': "Painting", 'description': None, 'minimum_bid': 100.0, 'lot_id': 7}
+        state_data = migrate_state_data({'participants': [{'nickname': "Alice", 'balance': 50.0,
+                                                           'participant_id': 2, 'lots': [lot]}]})
+        self.assertEqual(state_data['participants'][0]['lot_ids'], [7])
+        self.assertEqual(state_data['sold_lots'], [lot])
+
+    def test_migrate_state_data_rejects_newer_schema(self):
+        with self.assertRaises(ValueError):
+            migrate_state_data({'schema': 99})
+
+
+class TestSqliteStorage(unittest.TestCase):
+    def setUp(self):
+        self._dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self._dir.name, 'state.sqlite3')
+
+    def tearDown(self):
+        self._dir.cleanup()
+
+    def test_save_and_load(self):
+        storage = SqliteStorage(self.path)
+        platform = TradingPlatform(storage=storage)
+        participant = AuctionParticipant(nickname="Alice", balance=200.0)
+        lot = Lot(name="Painting", description="A beautiful painting", minimum_bid=100.0)
+        unsold = Lot(name="Vase", minimum_bid=10)
+        platform.add(participant, lot, unsold)
+        platform.timeout = 0.1
+        platform.start_auction()
+        platform.place_bid(participant, 150.0)
+        platform.end_auction()
+        storage.close()
+
+        storage2 = SqliteStorage(self.path)
+        platform2 = TradingPlatform(load_on_init=True, storage=storage2)
+        self.assertEqual([l.name for l in platform2.lots], ["Vase"])
+        self.assertEqual(platform2.lots[0].minimum_bid, 10)
+        self.assertEqual([l.name for l in platform2.sold_lots], ["Painting"])
+        self.assertEqual(platform2.participants[0].nickname, "Alice")
+        self.assertEqual(platform2.participants[0].balance, 50.0)
+        self.assertEqual(list(platform2.participants[0].lots), platform2.sold_lots)
+        self.assertEqual(platform2._timeout, 0.1)
+        storage2.close()
+
+    def test_save_touches_only_changed_rows(self):
+        storage = SqliteStorage(self.path)
+        platform = TradingPlatform(storage=storage)
+        platform.add([Lot(name=f"Lot {i}") for i in range(10)])
+        first, second = platform.lots[0], platform.lots[1]
+        platform.remove(first)
+        conn = sqlite3.connect(self.path)
+        names = [row[0] for row in conn.execute('SELECT name FROM lots ORDER BY position')]
+        conn.close()
+        self.assertEqual(len(names), 9)
+        self.assertEqual(names[0], second.name)
+        storage.close()
+
+    def test_remove_participant_removes_owned_lots(self):
+        storage = SqliteStorage(self.path)
+        platform = TradingPlatform(storage=storage)
+        participant = AuctionParticipant(nickname="Alice", balance=200.0)
+        platform.add(participant, Lot(name="Painting", minimum_bid=100.0))
+        platform.timeout = 0.1
+        platform.start_auction()
+        platform.place_bid(participant, 150.0)
+        platform.end_auction()
+        platform.remove(participant)
+        storage.close()
+
+        storage2 = SqliteStorage(self.path)
+        platform2 = TradingPlatform(load_on_init=True, storage=storage2)
+        self.assertEqual(platform2.participants, [])
+        self.assertEqual(platform2.sold_lots, [])
+        storage2.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
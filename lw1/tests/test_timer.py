@@ -1,6 +1,8 @@
 import unittest
 from unittest.mock import Mock
-from auction import Timer
+import threading
+
+from auction import Timer, Scheduler
 
 class TestTimer(unittest.TestCase):
 
@@ -24,5 +26,43 @@ class TestTimer(unittest.TestCase):
         timer = Timer(0.1, callback)
         self.assertEqual(repr(timer), f"Timer(timeout=0.1, callback={callback})")
 
+    def test_timers_share_one_scheduler_thread(self):
+        threads = set()
+        scheduler = Scheduler()
+        timers = [Timer(0.01, lambda: threads.add(threading.current_thread()), scheduler=scheduler) for _ in range(50)]
+        for timer in timers:
+            timer.start()
+        for timer in timers:
+            timer._timer.join()
+        self.assertEqual(len(threads), 1)
+
+    def test_restart_moves_deadline_of_same_handle(self):
+        callback = Mock()
+        timer = Timer(0.2, callback)
+        timer.start()
+        handle = timer._timer
+        timer.start()
+        self.assertIs(timer._timer, handle)
+        self.assertGreater(timer.remaining, 0.1)
+        timer._timer.join()
+        callback.assert_called_once()
+
+    def test_cancel_prevents_callback(self):
+        callback = Mock()
+        timer = Timer(0.05, callback)
+        timer.start()
+        handle = timer._timer
+        timer.cancel()
+        handle.join()
+        self.assertIsNone(timer.remaining)
+        callback.assert_not_called()
+
+    def test_reschedule_earlier_fires_before_original_deadline(self):
+        scheduler = Scheduler()
+        fired = threading.Event()
+        handle = scheduler.schedule(10, fired.set)
+        self.assertTrue(scheduler.reschedule(handle, 0.01))
+        self.assertTrue(fired.wait(1))
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -1,6 +1,16 @@
 import unittest
 
-from auction import TradingPlatform, AuctionParticipant, Lot, Bid
+from auction import TradingPlatform, AuctionParticipant, Lot, Bid, JsonStorage
+
+
+class CountingStorage(JsonStorage):
+    def __init__(self):
+        super().__init__()
+        self.saves = 0
+
+    def save(self, platform, changes):
+        self.saves += 1
+        super().save(platform, changes)
 
 class TestTradingPlatform(unittest.TestCase):
 
@@ -123,6 +133,100 @@ class TestTradingPlatform(unittest.TestCase):
         with self.assertRaises(ValueError):
             platform.place_bid(participant, 100.0)
 
+    def test_get_participant_and_lot_by_id(self):
+        platform = TradingPlatform()
+        participant = AuctionParticipant(nickname="Alice", balance=200.0)
+        lot = Lot(name="Painting", description="A beautiful painting", minimum_bid=100.0)
+        platform.add(participant, lot)
+        self.assertIs(platform.get_participant(participant.participant_id), participant)
+        self.assertIs(platform.get_lot(lot.lot_id), lot)
+        self.assertIsNone(platform.get_participant(-1))
+        self.assertIsNone(platform.get_lot(-1))
+
+    def test_get_lot_finds_sold_lot(self):
+        platform = TradingPlatform()
+        participant = AuctionParticipant(nickname="Alice", balance=200.0)
+        lot = Lot(name="Painting", description="A beautiful painting", minimum_bid=100.0)
+        platform.add(participant, lot)
+        platform.timeout = 0.1
+        platform.start_auction()
+        platform.place_bid(participant, 150.0)
+        platform.end_auction()
+        self.assertIs(platform.get_lot(lot.lot_id), lot)
+
+    def test_add_sold_lot_raises_error(self):
+        platform = TradingPlatform()
+        participant = AuctionParticipant(nickname="Alice", balance=200.0)
+        lot = Lot(name="Painting", description="A beautiful painting", minimum_bid=100.0)
+        platform.add(participant, lot)
+        platform.timeout = 0.1
+        platform.start_auction()
+        platform.place_bid(participant, 150.0)
+        platform.end_auction()
+        with self.assertRaises(ValueError):
+            platform.add(lot)
+
+    def test_remove_participant_removes_sold_lots(self):
+        platform = TradingPlatform()
+        participant = AuctionParticipant(nickname="Alice", balance=200.0)
+        lot = Lot(name="Painting", description="A beautiful painting", minimum_bid=100.0)
+        platform.add(participant, lot)
+        platform.timeout = 0.1
+        platform.start_auction()
+        platform.place_bid(participant, 150.0)
+        platform.end_auction()
+        platform.remove(participant)
+        self.assertEqual(platform.sold_lots, [])
+
+    def test_place_bids_applies_highest_accepted_bid(self):
+        platform = TradingPlatform()
+        alice = AuctionParticipant(nickname="Alice", balance=200.0)
+        bob = AuctionParticipant(nickname="Bob", balance=500.0)
+        lot = Lot(name="Painting", description="A beautiful painting", minimum_bid=100.0)
+        platform.add(alice, bob, lot)
+        platform.timeout = 0.1
+        platform.start_auction()
+        results = platform.place_bids([(alice, 50.0), (alice, 150.0), (bob, 140.0), (alice, 300.0), (bob, 400.0)])
+        self.assertEqual([r.accepted for r in results], [False, True, False, False, True])
+        self.assertEqual(results[0].reason, "Bid amount is less than the minimum bid")
+        self.assertEqual(results[2].reason, "Bid amount must be greater than the current bid")
+        self.assertEqual(results[3].reason, "Bid amount exceeds participant balance")
+        self.assertEqual(platform.current_bid.participant, bob)
+        self.assertEqual(platform.current_bid.amount, 400.0)
+        self.assertEqual(len(platform.bid_history(lot.lot_id)), 2)
+
+    def test_place_bids_with_no_accepted_bids_keeps_current_bid(self):
+        platform = TradingPlatform()
+        alice = AuctionParticipant(nickname="Alice", balance=200.0)
+        lot = Lot(name="Painting", description="A beautiful painting", minimum_bid=100.0)
+        platform.add(alice, lot)
+        platform.timeout = 0.1
+        platform.start_auction()
+        platform.place_bid(alice, 150.0)
+        results = platform.place_bids([(alice, 120.0)])
+        self.assertFalse(results[0].accepted)
+        self.assertEqual(platform.current_bid.amount, 150.0)
+
+    def test_place_bids_with_malformed_item_places_nothing(self):
+        platform = TradingPlatform()
+        alice = AuctionParticipant(nickname="Alice", balance=200.0)
+        bob = AuctionParticipant(nickname="Bob", balance=500.0)
+        lot = Lot(name="Painting", description="A beautiful painting", minimum_bid=100.0)
+        platform.add(alice, bob, lot)
+        platform.timeout = 0.1
+        platform.start_auction()
+        events = platform.subscribe(kinds=['bid_accepted'])
+        for malformed in [(bob,), (bob, "a lot")]:
+            with self.subTest(malformed=malformed):
+                with self.assertRaises((TypeError, ValueError)):
+                    platform.place_bids([(alice, 150.0), malformed, (bob, 300.0)])
+                self.assertEqual(len(platform.bid_history(lot.lot_id)), 0)
+                self.assertEqual(platform.current_bid.amount, 0)
+                self.assertEqual(len(events), 0)
+        results = platform.place_bids([(alice, 150.0), (bob, 300.0)])
+        self.assertEqual([r.accepted for r in results], [True, True])
+        self.assertEqual(len(platform.bid_history(lot.lot_id)), 2)
+
     def test_save_and_load(self):
         platform = TradingPlatform()
         participant = AuctionParticipant(nickname="Alice", balance=200.0)
@@ -134,5 +238,66 @@ class TestTradingPlatform(unittest.TestCase):
         self.assertEqual(platform2.participants[0].nickname, "Alice")
         self.assertEqual(platform2.lots[0].name, "Painting")
 
+    def test_batch_saves_once(self):
+        storage = CountingStorage()
+        platform = TradingPlatform(storage=storage)
+        lots = [Lot(name=f"Lot {i}") for i in range(10)]
+        with platform.batch():
+            for lot in lots:
+                platform.add(lot)
+            platform.remove(lots[0], [lots[1], (lots[2],)])
+        self.assertEqual(storage.saves, 1)
+        self.assertEqual(platform.lots, lots[3:])
+
+    def test_batch_rolls_back_on_error(self):
+        storage = CountingStorage()
+        platform = TradingPlatform(storage=storage)
+        alice = AuctionParticipant(nickname="Alice", balance=200.0)
+        lot = Lot(name="Painting", minimum_bid=100.0)
+        platform.add(alice, lot)
+        platform.timeout = 0.1
+        platform.start_auction()
+        platform.place_bid(alice, 150.0)
+        platform.end_auction()
+        saves = storage.saves
+        with self.assertRaises(ValueError):
+            with platform.batch():
+                platform.add(Lot(name="Vase"))
+                platform.remove(alice)
+                platform.remove(Lot(name="Unknown"))
+        self.assertEqual(storage.saves, saves)
+        self.assertEqual(platform.lots, [])
+        self.assertEqual(platform.participants, [alice])
+        self.assertEqual(platform.sold_lots, [lot])
+        self.assertIs(alice.lots[0], lot)
+        self.assertEqual(platform._changes, [])
+
+    def test_batch_requires_preparing_state(self):
+        platform = TradingPlatform()
+        platform.add(AuctionParticipant(nickname="Alice", balance=200.0), Lot(name="Painting"))
+        platform.start_auction()
+        with self.assertRaises(RuntimeError):
+            with platform.batch():
+                pass
+        platform.pause_auction()
+        platform.abort_auction()
+
+    def test_batch_rejects_starting_an_auction(self):
+        storage = CountingStorage()
+        platform = TradingPlatform(storage=storage)
+        alice = AuctionParticipant(nickname="Alice", balance=200.0)
+        lot = Lot(name="Painting")
+        platform.add(alice, lot)
+        saves = storage.saves
+        with self.assertRaises(RuntimeError):
+            with platform.batch():
+                platform.add(Lot(name="Vase"))
+                platform.start_auction()
+        self.assertEqual(platform.state, 'preparing_for_auction')
+        self.assertIsNone(platform._current_lot)
+        self.assertEqual(platform.lots, [lot])
+        self.assertEqual(storage.saves, saves)
+        self.assertEqual(platform._changes, [])
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
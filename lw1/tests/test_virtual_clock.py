@@ -0,0 +1,73 @@
+import unittest
+from unittest.mock import Mock
+
+from auction import Timer, VirtualClock, TradingPlatform, AuctionParticipant, Lot, MemoryStorage
+
+
+class TestVirtualClock(unittest.TestCase):
+    def test_timer_fires_only_when_time_is_advanced(self):
+        clock = VirtualClock()
+        callback = Mock()
+        timer = Timer(60, callback, scheduler=clock)
+        timer.start()
+        clock.advance(59.9)
+        callback.assert_not_called()
+        self.assertAlmostEqual(timer.remaining, 0.1)
+        clock.advance(0.1)
+        callback.assert_called_once()
+        self.assertEqual(clock.now(), 60)
+
+    def test_callbacks_run_in_deadline_order_at_their_deadline(self):
+        clock = VirtualClock()
+        fired = []
+        for timeout in (30, 10, 20):
+            Timer(timeout, lambda t=timeout: fired.append((t, clock.now())), scheduler=clock).start()
+        self.assertEqual(clock.advance(100), 3)
+        self.assertEqual(fired, [(10, 10), (20, 20), (30, 30)])
+
+    def test_restarted_timer_fires_at_new_deadline(self):
+        clock = VirtualClock()
+        callback = Mock()
+        timer = Timer(60, callback, scheduler=clock)
+        timer.start()
+        clock.advance(50)
+        timer.start()
+        clock.advance(50)
+        callback.assert_not_called()
+        self.assertTrue(clock.run_next())
+        callback.assert_called_once()
+        self.assertEqual(clock.now(), 110)
+        self.assertFalse(clock.run_next())
+
+    def test_canceled_timer_does_not_fire(self):
+        clock = VirtualClock()
+        callback = Mock()
+        timer = Timer(10, callback, scheduler=clock)
+        timer.start()
+        timer.cancel()
+        self.assertEqual(clock.advance(20), 0)
+        callback.assert_not_called()
+
+    def test_advance_backwards_raises_error(self):
+        with self.assertRaises(ValueError):
+            VirtualClock().advance(-1)
+
+    def test_platform_ends_auction_in_virtual_time(self):
+        clock = VirtualClock()
+        platform = TradingPlatform(storage=MemoryStorage(), clock=clock)
+        alice = AuctionParticipant(nickname="Alice", balance=500)
+        lot = Lot(name="Painting", minimum_bid=100)
+        platform.add(alice, lot)
+        platform.start_auction()
+        clock.advance(30)
+        platform.place_bid(alice, 150)
+        clock.advance(59)
+        self.assertEqual(platform.state, 'accepting_bids')
+        clock.advance(1)
+        self.assertEqual(platform.state, 'preparing_for_auction')
+        self.assertEqual(platform.sold_lots, [lot])
+        self.assertEqual(platform.bid_history(lot.lot_id)[0].timestamp, 30 * 10 ** 9)
+
+
+if __name__ == '__main__':
+    unittest.main()